@@ -0,0 +1,175 @@
+"""
+Módulo:    A* com landmarks (ALT)
+Objetivo:  Consultas de caminho mínimo ponto a ponto com A*, guiado por limites
+           inferiores obtidos de landmarks pela desigualdade triangular (ALT).
+           Um pré-processamento escolhe k landmarks e guarda as distâncias de
+           cada um a todos os vértices (e de todos os vértices a ele, em
+           dígrafos); as consultas seguintes sobre o mesmo grafo reaproveitam
+           essas distâncias e fixam bem menos vértices que o Dijkstra.
+
+           Para cada landmark L, d(v, t) >= d(L, t) - d(L, v) e
+           d(v, t) >= d(v, L) - d(t, L). A heurística é o maior desses limites,
+           o que a torna admissível e consistente: o custo retornado é exato,
+           o mesmo do `dijkstra`.
+
+Funções:   escolher_landmarks(grafo: Grafo, k=8)
+           a_estrela(grafo: Grafo, inicio_id, destino_id, landmarks=None)
+"""
+
+from lib.core.graph import Grafo
+from lib.algorithms.dijkstra import _preparar, _listas, _dijkstra_listas
+import heapq
+from math import inf as INF
+
+NUM_LANDMARKS = 8
+
+def escolher_landmarks(grafo: Grafo, k=NUM_LANDMARKS):
+    """
+    Info: Pré-processamento do ALT. Escolhe os landmarks pelo critério do mais
+          distante: o primeiro é o vértice mais longe do vértice de posição 0, e
+          cada um dos seguintes é o vértice mais longe dos já escolhidos (um
+          vértice que nenhum deles alcança conta como o mais longe, o que cobre
+          os demais componentes). Para cada landmark são calculadas as distâncias
+          dele a todos os vértices e, em dígrafos, de todos os vértices a ele.
+    E: grafo (Grafo/GrafoCSR) - Grafo ponderado.
+       k (int) - Número de landmarks.
+    S: dict - {"ids": IDs dos landmarks, "de": distâncias a partir de cada landmark,
+       "para": distâncias até cada landmark (as mesmas listas de "de" em grafos não
+       direcionados), "modo_pesos": modo dos pesos das distâncias, "versao": versão
+       do grafo para a qual valem (None num GrafoCSR, que não muda)}. As listas de
+       distâncias são indexadas pela posição do vértice (infinito se inalcançável).
+    """
+    _preparar(grafo, None)
+    n = grafo.num_vertices()
+    frente = _listas(grafo)[:3]
+    tras = _listas(grafo, reverso=True)[:3]
+
+    ids, de, para = [], [], []
+    if n == 0:
+        return _landmarks(grafo, ids, de, para)
+
+    # Distância de cada vértice aos landmarks já escolhidos (no início, ao vértice 0).
+    longe = _dijkstra_listas(*frente, 0)[0]
+    escolhidos = set()
+    for _ in range(min(k, n)):
+        candidatos = [i for i in range(n) if i not in escolhidos]
+        landmark = max(candidatos, key=lambda i: (longe[i], -i))
+        escolhidos.add(landmark)
+
+        dist_de = _dijkstra_listas(*frente, landmark)[0]
+        dist_para = _dijkstra_listas(*tras, landmark)[0] if grafo.direcionado else dist_de
+        ids.append(grafo.vertices[landmark].id)
+        de.append(dist_de)
+        para.append(dist_para)
+
+        if len(escolhidos) == 1:
+            longe = [INF] * n
+        longe = [min(atual, d) for atual, d in zip(longe, dist_de)]
+        longe[landmark] = -1
+
+    return _landmarks(grafo, ids, de, para)
+
+def _landmarks(grafo, ids, de, para):
+    return {"ids": ids, "de": de, "para": para, "modo_pesos": getattr(grafo, "modo_pesos", "float"),
+            "versao": getattr(grafo, "versao", None)}
+
+def a_estrela(grafo: Grafo, inicio_id, destino_id, landmarks=None):
+    """
+    Info: Caminho mínimo entre dois vértices com A* e a heurística ALT. Os
+          vértices são fixados em ordem de g + h, onde g é a distância já
+          conhecida a partir da origem e h o limite inferior dos landmarks até o
+          destino; vértices dos quais o destino comprovadamente não é alcançável
+          (h infinito) nem entram na fila.
+    E: grafo (Grafo/GrafoCSR) - Grafo ponderado, sem pesos negativos.
+       inicio_id, destino_id (str/int)
+       landmarks (dict, opcional) - Resultado de `escolher_landmarks` (ou do cache em
+       disco, ver `graph_cache.obter_landmarks`). Se None, são calculados uma
+       vez por versão do grafo e guardados em `resultado_derivado`. Landmarks de
+       outra versão do grafo são recusados: depois de mudanças nas arestas ou nos
+       pesos, os limites deixariam de ser admissíveis.
+    S: (custo, list[Vertice] ou None, int) - O custo (infinito se não houver
+       caminho), os vértices do caminho e o número de vértices fixados.
+    """
+    s, t = _preparar(grafo, inicio_id, destino_id)
+    if landmarks is None:
+        landmarks = grafo.resultado_derivado(("landmarks", NUM_LANDMARKS), lambda: escolher_landmarks(grafo))
+    if landmarks.get("versao") != getattr(grafo, "versao", None):
+        raise ValueError("Os landmarks foram calculados para outra versão do grafo; calcule-os de novo.")
+    if any(len(d) != grafo.num_vertices() for d in landmarks["de"]):
+        raise ValueError("Os landmarks não correspondem a este grafo.")
+
+    indptr, indices, pesos = _listas(grafo)[:3]
+    n = len(indptr) - 1
+    heuristica = _heuristica(landmarks, t, n)
+
+    dist = [INF] * n
+    pred = [-1] * n
+    dist[s] = 0
+    fixados = 0
+
+    h_s = heuristica(s)
+    fila_prioridade = [(h_s, 0, s)] if h_s != INF else []
+    while fila_prioridade:
+        _, dist_u, u = heapq.heappop(fila_prioridade)
+        # já achou caminho melhor
+        if dist_u > dist[u]:
+            continue
+        fixados += 1
+        if u == t:
+            break
+
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            nova_distancia = dist_u + pesos[k]
+            if nova_distancia < dist[v]:
+                h_v = heuristica(v)
+                if h_v == INF:
+                    continue
+                dist[v] = nova_distancia
+                pred[v] = u
+                heapq.heappush(fila_prioridade, (nova_distancia + h_v, nova_distancia, v))
+
+    if dist[t] == INF:
+        return INF, None, fixados
+
+    caminho = [t]
+    while caminho[-1] != s:
+        caminho.append(pred[caminho[-1]])
+    caminho.reverse()
+    vertices = grafo.vertices
+    return dist[t], [vertices[i] for i in caminho], fixados
+
+def _heuristica(landmarks, t, n):
+    """
+    Info: Monta a função h(v) da consulta com destino `t`, memorizada por vértice.
+          Só entram nos limites as distâncias finitas; um limite infinito indica
+          que `t` não é alcançável a partir de `v`.
+    S: callable - h(posição) -> limite inferior de d(v, t).
+    """
+    pares = [(de, de[t], para, para[t]) for de, para in zip(landmarks["de"], landmarks["para"])]
+    memo = [None] * n
+
+    def h(v):
+        valor = memo[v]
+        if valor is not None:
+            return valor
+        valor = 0
+        for de, de_t, para, para_t in pares:
+            # d(v, t) >= d(L, t) - d(L, v)
+            if de[v] != INF:
+                if de_t == INF:
+                    valor = INF
+                    break
+                if de_t - de[v] > valor:
+                    valor = de_t - de[v]
+            # d(v, t) >= d(v, L) - d(t, L)
+            if para_t != INF:
+                if para[v] == INF:
+                    valor = INF
+                    break
+                if para[v] - para_t > valor:
+                    valor = para[v] - para_t
+        memo[v] = valor
+        return valor
+
+    return h
@@ -10,34 +10,54 @@ Retorna:
 """
 
 from math import inf as infinito
+from lib.algorithms.dijkstra import _listas
 
 def bellman_ford(grafo, fonte_id):
-    dist = {v.id: infinito for v in grafo.vertices}
-    pred = {v.id: None for v in grafo.vertices}
-    dist[str(fonte_id)] = 0
-    V = len(grafo.vertices)
-    arestas = grafo.arestas
-    for _ in range(V - 1):
+    """
+    Bellman-Ford sobre o índice de arestas de saída: do próprio CSR, ou de
+    `indice_saida` para um Grafo (com os pesos no tipo original). Os dois
+    relaxam as arestas na mesma ordem e, em grafos não direcionados, nos dois
+    sentidos, de modo que Grafo e instantâneo dão o mesmo resultado.
+    """
+    s = grafo.posicao(fonte_id)
+    if s is None:
+        raise ValueError(f"Vértice com ID '{fonte_id}' não encontrado.")
+
+    indptr, indices, pesos = _listas(grafo)[:3]
+    n = grafo.num_vertices()
+    d = [infinito] * n
+    p = [-1] * n
+    d[s] = 0
+
+    def relaxar():
         mudou = False
-        for a in arestas:
-            u = a.v1.id
-            v = a.v2.id
-            w = a.peso
+        for u in range(n):
+            if d[u] == infinito:
+                continue
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                if d[u] + pesos[k] < d[v]:
+                    d[v] = d[u] + pesos[k]
+                    p[v] = u
+                    mudou = True
+        return mudou
 
-            if dist[u] + w < dist[v]:
-                dist[v] = dist[u] + w
-                pred[v] = u
-                mudou = True
-        if not mudou:
+    for _ in range(n - 1):
+        if not relaxar():
             break
-    for a in arestas:
-        u = a.v1.id
-        v = a.v2.id
-        w = a.peso
+    ciclo_negativo = relaxar()
 
-        if dist[u] + w < dist[v]:
-            return dist, pred, True
-    return dist, pred, False
+    return _traduzir_ids(grafo.vertices, d, p, ciclo_negativo)
+
+def _traduzir_ids(vertices, d, p, ciclo_negativo):
+    """
+    Traduz as listas de distâncias e predecessores, indexadas por posição,
+    para o formato público {id: ...}.
+    """
+    ids = [v.id for v in vertices]
+    dist = {ids[i]: d[i] for i in range(len(ids))}
+    pred = {ids[i]: ids[p[i]] if p[i] != -1 else None for i in range(len(ids))}
+    return dist, pred, ciclo_negativo
 
 def formatar_caminho_bellman_ford(grafo, id_inicio: str, id_fim: str):
     """
@@ -52,7 +72,8 @@ def formatar_caminho_bellman_ford(grafo, id_inicio: str, id_fim: str):
     if not grafo.ponderado:
         return titulo + "\n  Algoritmo não aplicável (grafo não ponderado).", None
     try:
-        dist, pred, ciclo_neg = bellman_ford(grafo, id_inicio)
+        dist, pred, ciclo_neg = grafo.resultado_derivado(("bellman_ford", id_inicio),
+                                                         lambda: bellman_ford(grafo, id_inicio))
         report = ""
         report += f"  Ciclo negativo: {'Sim' if ciclo_neg else 'Não'}\n"
 
@@ -67,10 +88,9 @@ def formatar_caminho_bellman_ford(grafo, id_inicio: str, id_fim: str):
             atual = pred[atual]
         caminho_ids.reverse()
         custo = dist[id_fim]
-        report += f"  Custo: {custo}\n"
+        report += f"  Custo: {grafo.formatar_peso(custo)}\n"
         report += "  Caminho: " + " -> ".join(caminho_ids)
-        vertices_map = {v.id: v for v in grafo.vertices}
-        caminho_vertices = [vertices_map[v_id] for v_id in caminho_ids]
+        caminho_vertices = [grafo.vertices[grafo.posicao(v_id)] for v_id in caminho_ids]
         return titulo + "\n" + report, caminho_vertices
     except Exception as e:
         return titulo + f"\n  Erro inesperado: {e}", None
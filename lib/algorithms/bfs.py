@@ -5,6 +5,7 @@ Funções:   bfs(grafo, id_inicio)
 """
 from collections import deque
 from lib.core.graph import Grafo
+from lib.core.graph_csr import GrafoCSR
 
 def bfs(grafo: Grafo, id_inicio=None) -> (list, list):
     """
@@ -13,7 +14,7 @@ def bfs(grafo: Grafo, id_inicio=None) -> (list, list):
           Lida com grafos desconexos e identifica arestas que não são da árvore de busca.
 
     Args:
-        grafo (Grafo): O objeto grafo a ser percorrido.
+        grafo (Grafo/GrafoCSR): O objeto grafo (ou seu instantâneo CSR) a ser percorrido.
         id_inicio (str/int, opcional): ID do vértice para iniciar a busca. 
                                         Se omitido, começa pelo primeiro vértice do grafo.
 
@@ -22,6 +23,9 @@ def bfs(grafo: Grafo, id_inicio=None) -> (list, list):
                       - A ordem de visita em formato [(v, pai), ...].
                       - A lista de arestas encontradas que não pertencem à árvore.
     """
+    if isinstance(grafo, GrafoCSR):
+        return _bfs_csr(grafo, id_inicio)
+
     adj = grafo.lista_adj 
     vertice_inicial_obj = None
 
@@ -72,3 +76,52 @@ def bfs(grafo: Grafo, id_inicio=None) -> (list, list):
                     
     return ordem, arestas_retorno
 
+def _bfs_csr(csr: GrafoCSR, id_inicio=None) -> (list, list):
+    """
+    Info: BFS sobre um instantâneo CSR, com o mesmo resultado de `bfs` sobre o
+          Grafo de origem. Os vértices são tratados por posição inteira.
+    E: csr (GrafoCSR), id_inicio (str/int, opcional)
+    S: (list, list) - Ordem de visita [(v, pai), ...] e arestas fora da árvore.
+    """
+    n = csr.num_vertices()
+    if id_inicio:
+        inicio = csr.posicao(id_inicio)
+        if inicio is None:
+            print(f"Alerta: Vértice inicial '{id_inicio}' não encontrado no grafo '{csr.nome_arquivo}'.")
+            return [], []
+    elif n:
+        inicio = 0
+    else:
+        return [], []
+
+    indptr, indices, _ = csr.como_listas()
+    ids = csr.ids
+    posto = csr.ordem_ids()
+
+    visitados = [False] * n
+    pred = [-1] * n
+    ordem = []
+    arestas_retorno = []
+
+    for raiz in [inicio] + [i for i in range(n) if i != inicio]:
+        if visitados[raiz]:
+            continue
+
+        visitados[raiz] = True
+        fila = deque([raiz])
+
+        while fila:
+            atual = fila.popleft()
+            ordem.append((ids[atual], ids[pred[atual]] if pred[atual] != -1 else "-"))
+
+            for prox in sorted(indices[indptr[atual]:indptr[atual + 1]], key=posto.__getitem__):
+                if not visitados[prox]:
+                    visitados[prox] = True
+                    pred[prox] = atual
+                    fila.append(prox)
+                else:
+                    if not csr.direcionado and pred[atual] == prox:
+                        continue
+                    arestas_retorno.append((ids[atual], ids[prox]))
+
+    return ordem, arestas_retorno
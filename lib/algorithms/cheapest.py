@@ -1,6 +1,5 @@
 from lib.core.graph import Grafo
 from math import inf as INF
-from lib.utils.converter import get_decimal
 
 def cheapest_insertion(grafo : Grafo, v_inicial):
     """Implementa o algoritmo de Inserção Mais Próxima.
@@ -62,7 +61,7 @@ def cheapest_insertion(grafo : Grafo, v_inicial):
     circuito.append(v_inicial)
 
     #calculando custo total
-    custo_total = get_decimal(0)
+    custo_total = 0
     for i in range(len(circuito)-1):
         u = circuito[i]
         w = circuito[(i+1)]
@@ -16,28 +16,23 @@ from lib.core.graph import Grafo
 
 
 def chu_liu_edmonds(grafo, raiz):
-    vertices = list(grafo.vertices)
-    n = len(vertices)
+    n = grafo.num_vertices()
+    r = grafo.posicao(raiz)
+    if r is None:
+        return None, f"Vértice raiz '{raiz}' não encontrado."
 
-    idx = {v.id: i for i, v in enumerate(vertices)}
-    id_map = {i: v.id for i, v in enumerate(vertices)}
-    r = idx[str(raiz)]
-
-    edges = [(idx[a.v1.id], idx[a.v2.id], a.peso) for a in grafo.arestas]
+    posicao = grafo.posicao_vertice
+    id_map = [v.id for v in grafo.vertices]
+    edges = [(posicao(a.v1), posicao(a.v2), a.peso) for a in grafo.arestas]
 
     arestas_resultado, erro = _chu_liu_recursivo(edges, n, r, id_map)
 
     if not arestas_resultado:
         return None, erro
 
-    novo = Grafo(direcionado=True, ponderado=True)
-    novo.nome_arquivo = grafo.nome_arquivo.replace("DIGRAFO_", "AGM_")
-
-    for v in grafo.vertices:
-        novo.adicionar_vertice(v.id)
-
-    for u_idx, v_idx, peso in arestas_resultado:
-        novo.adicionar_aresta(id_map[u_idx], id_map[v_idx], peso)
+    novo = Grafo.de_arestas(((id_map[u_idx], id_map[v_idx], peso) for u_idx, v_idx, peso in arestas_resultado),
+                            vertices=(v.id for v in grafo.vertices), direcionado=True, ponderado=True,
+                            nome_arquivo=grafo.nome_arquivo.replace("DIGRAFO_", "AGM_"), modo_pesos=grafo.modo_pesos)
 
     return novo, None
 
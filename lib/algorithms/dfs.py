@@ -4,7 +4,8 @@ Objetivo:  Implementa o algoritmo de Busca em Profundidade (Depth-First Search)
            de forma modular, com funcionalidades básicas e avançadas.
 Funções:   dfs(grafo, id_vertice_inicial, classificar_arestas, retornar_tempos)
 """
-from lib.core.graph import Grafo, Aresta
+from lib.core.graph import Grafo
+from lib.core.graph_csr import GrafoCSR
 
 def dfs(grafo: Grafo, id_vertice_inicial=None, classificar_arestas=False, retornar_tempos=False):
     """
@@ -13,7 +14,7 @@ def dfs(grafo: Grafo, id_vertice_inicial=None, classificar_arestas=False, retorn
         classificar todos os tipos de arestas e calcular tempos de entrada/saída.
         
     Args:
-       - grafo (Grafo): O objeto grafo a ser percorrido.
+       - grafo (Grafo/GrafoCSR): O objeto grafo (ou seu instantâneo CSR) a ser percorrido.
        - id_vertice_inicial (str/int, opcional): Vértice de início da busca. Se omitido, usa o primeiro do grafo.
        - classificar_arestas (bool, opcional): Se True, ativa a classificação arestas (árvore, avanço, etc.).
        - retornar_tempos (bool, opcional): Se True, retorna os tempos de entrada (PE) e saída (PS) dos vértices.
@@ -21,7 +22,12 @@ def dfs(grafo: Grafo, id_vertice_inicial=None, classificar_arestas=False, retorn
     Returns:
        - Modo Padrão: (list, list) - Tupla com (ordem_visita, arestas_retorno).
        - Modo Avançado: dict - Dicionário com os resultados solicitados.
+       As arestas (de retorno, árvore, avanço e cruzamento) são sempre tuplas
+       (id_origem, id_destino) de strings, sem criar objetos `Aresta`.
     """
+    if isinstance(grafo, GrafoCSR):
+        return _dfs_csr(grafo, id_vertice_inicial, classificar_arestas, retornar_tempos)
+
     adj = grafo.lista_adj
     todos_vertices = grafo.vertices
 
@@ -66,19 +72,19 @@ def dfs(grafo: Grafo, id_vertice_inicial=None, classificar_arestas=False, retorn
             if cor[v] == 'branco':
                 parent[v] = u
                 if classificar_arestas:
-                    arestas_arvore.append(Aresta(u, v))
+                    arestas_arvore.append((str(u.id), str(v.id)))
                 dfs_visit(v)
             
             elif cor[v] == 'cinza':
                 if not grafo.direcionado and parent[u] == v:
                     continue
-                arestas_retorno.append(Aresta(u, v))
+                arestas_retorno.append((str(u.id), str(v.id)))
             
             elif cor[v] == 'preto' and classificar_arestas:
                 if pe[u] < pe[v]:
-                    arestas_avanco.append(Aresta(u, v))
+                    arestas_avanco.append((str(u.id), str(v.id)))
                 else:
-                    arestas_cruzamento.append(Aresta(u, v))
+                    arestas_cruzamento.append((str(u.id), str(v.id)))
 
         cor[u] = 'preto'
         tempo += 1
@@ -103,5 +109,99 @@ def dfs(grafo: Grafo, id_vertice_inicial=None, classificar_arestas=False, retorn
         return resultados
     
     else:
-        arestas_retorno_tuplas = [(str(a.v1.id), str(a.v2.id)) for a in arestas_retorno]
-        return ordem_visita, arestas_retorno_tuplas
+        return ordem_visita, arestas_retorno
+
+def _dfs_csr(csr: GrafoCSR, id_vertice_inicial=None, classificar_arestas=False, retornar_tempos=False):
+    """
+    Info: DFS sobre um instantâneo CSR, com o mesmo resultado de `dfs` sobre o
+          Grafo de origem. Usa uma pilha explícita no lugar da recursão, o que
+          evita o limite de recursão do Python em grafos grandes.
+    E: csr (GrafoCSR) e as mesmas opções de `dfs`.
+    S: Os mesmos formatos de retorno de `dfs`.
+    """
+    n = csr.num_vertices()
+    if id_vertice_inicial:
+        inicio = csr.posicao(id_vertice_inicial)
+        if inicio is None:
+            print(f"Alerta: Vértice inicial '{id_vertice_inicial}' não encontrado no grafo '{csr.nome_arquivo}'.")
+            return ([], []) if not classificar_arestas and not retornar_tempos else {}
+    elif n:
+        inicio = 0
+    else:
+        return ([], []) if not classificar_arestas and not retornar_tempos else {}
+
+    BRANCO, CINZA, PRETO = 0, 1, 2
+    indptr, indices, _ = csr.como_listas()
+    ids = csr.ids
+    posto = csr.ordem_ids()
+
+    cor = [BRANCO] * n
+    parent = [-1] * n
+    pe = [0] * n
+    ps = [0] * n
+    tempo = 0
+    ordem_visita = []
+    arestas_arvore = []
+    arestas_retorno = []
+    arestas_avanco = []
+    arestas_cruzamento = []
+
+    def descobrir(u):
+        nonlocal tempo
+        cor[u] = CINZA
+        tempo += 1
+        pe[u] = tempo
+        ordem_visita.append((ids[u], ids[parent[u]] if parent[u] != -1 else "-"))
+        return [u, sorted(indices[indptr[u]:indptr[u + 1]], key=posto.__getitem__), 0]
+
+    for v_inicio in [inicio] + [i for i in range(n) if i != inicio]:
+        if cor[v_inicio] != BRANCO:
+            continue
+
+        pilha = [descobrir(v_inicio)]
+        while pilha:
+            quadro = pilha[-1]
+            u, vizinhos, k = quadro
+
+            if k == len(vizinhos):
+                cor[u] = PRETO
+                tempo += 1
+                ps[u] = tempo
+                pilha.pop()
+                continue
+
+            quadro[2] += 1
+            v = vizinhos[k]
+            if cor[v] == BRANCO:
+                parent[v] = u
+                if classificar_arestas:
+                    arestas_arvore.append((ids[u], ids[v]))
+                pilha.append(descobrir(v))
+
+            elif cor[v] == CINZA:
+                if not csr.direcionado and parent[u] == v:
+                    continue
+                arestas_retorno.append((ids[u], ids[v]))
+
+            elif classificar_arestas:
+                if pe[u] < pe[v]:
+                    arestas_avanco.append((ids[u], ids[v]))
+                else:
+                    arestas_cruzamento.append((ids[u], ids[v]))
+
+    if classificar_arestas or retornar_tempos:
+        resultados = {
+            'ordem_visita': ordem_visita,
+            'arestas_retorno': arestas_retorno
+        }
+        if classificar_arestas:
+            resultados['arestas_arvore'] = arestas_arvore
+            resultados['arestas_avanco'] = arestas_avanco
+            resultados['arestas_cruzamento'] = arestas_cruzamento
+        if retornar_tempos:
+            resultados['tempos_entrada'] = {ids[i]: pe[i] for i in range(n)}
+            resultados['tempos_saida'] = {ids[i]: ps[i] for i in range(n)}
+        return resultados
+
+    else:
+        return ordem_visita, arestas_retorno
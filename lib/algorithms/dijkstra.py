@@ -1,101 +1,276 @@
 """
 Módulo:    Dijkstra
 Objetivo:  Implementa o algoritmo de Dijkstra para encontrar a árvore geradora mínima.
-Funções:   dijkstra(grafo: Grafo, inicio_id=None)
+Funções:   dijkstra(grafo: Grafo, inicio_id=None, destino_id=None)
+           caminho_minimo(grafo: Grafo, inicio_id, destino_id, bidirecional=True)
+           indice_saida(grafo: Grafo, reverso=False)
 """
 
 from lib.core.graph import Grafo
-import itertools
+from lib.core.graph_csr import GrafoCSR
+from lib.core.graph_view import VisaoArestas
 import heapq
 from math import inf as INF
 
-# desempatador
-count = itertools.count()
-
-def dijkstra(grafo: Grafo, inicio_id=None):
+def dijkstra(grafo: Grafo, inicio_id=None, destino_id=None):
     """
     Tarefa: (5).
     Info: Implementa o algoritmo de Dijkstra para encontrar a Árvore de Caminho Mínimo (Shortest Path Tree) de um grafo ponderado, gerando os caminhos de menor custo a partir de um vértice de origem.
+          Em grafos não direcionados, cada aresta é percorrida nos dois sentidos.
+          Com `destino_id`, a busca para assim que o destino é fixado: a distância e o
+          caminho até ele são exatos, mas a árvore cobre só a parte já explorada e os
+          vértices ainda não fixados podem ter distâncias provisórias (ou infinito).
 
     Args:
-        grafo (Grafo): O objeto grafo ponderado.
+        grafo (Grafo/GrafoCSR): O objeto grafo ponderado (ou seu instantâneo CSR).
         inicio_id: O id do Vertice pelo qual se deseja iniciar. Se não for fornecido (None), será iniciado pelo 1º vértice na lista de vértices do grafo (grafo.vertices[0]).
+        destino_id: O id do Vertice de destino, para a parada antecipada (opcional).
 
     Returns:
-        spt (Grafo): O subgrafo (Árvore de Caminho Mínimo) gerado pelo algoritmo.
+        spt (Grafo): O subgrafo (Árvore de Caminho Mínimo) gerado pelo algoritmo. Sobre um
+            Grafo, é uma visão (VisaoArestas) com as próprias arestas do grafo, somente
+            leitura; `spt.materializar()` devolve uma cópia modificável.
+        distancias (dict): {Vertice: distância}, infinito para vértices inalcançáveis.
+        predecessores (dict): {Vertice: Vertice ou None}.
     """
+    s, t = _preparar(grafo, inicio_id, destino_id)
+    if isinstance(grafo, GrafoCSR):
+        return _dijkstra_csr(grafo, s, t)
+
+    indptr, indices, pesos, ids_arestas = _listas(grafo)
+    dist, pred, aresta_pred = _dijkstra_listas(indptr, indices, pesos, s, t)
 
-    distancias = {vertice: INF for vertice in grafo.vertices}
-    predecessores = {vertice: None for vertice in grafo.vertices}
+    # As arestas da árvore são as próprias arestas do grafo, na ordem dos vértices.
+    vertices = grafo.vertices
+    n = len(vertices)
+    arestas_spt = [grafo.arestas[ids_arestas[aresta_pred[v]]] for v in range(n) if pred[v] != -1]
+    spt = VisaoArestas(grafo, arestas_spt, nome_arquivo="DIJKSTRA")
 
-    for a in grafo.arestas:
-        if a.peso is None:
-            raise ValueError("Todas as arestas precisam ser ponderadas para execução do algoritmo.")
+    distancias = {vertices[i]: dist[i] for i in range(n)}
+    predecessores = {vertices[i]: vertices[pred[i]] if pred[i] != -1 else None for i in range(n)}
+    return spt, distancias, predecessores
 
-    if inicio_id is not None:
-        s = grafo.indice_vertices.get(str(inicio_id))
-        if s is None:
-            raise ValueError(f"Vértice com ID '{inicio_id}' não encontrado.")
+def caminho_minimo(grafo: Grafo, inicio_id, destino_id, bidirecional=True):
+    """
+    Info: Caminho de menor custo entre dois vértices, sem montar a árvore inteira.
+          Por padrão usa a busca bidirecional: uma busca a partir da origem e outra,
+          sobre as arestas invertidas (em dígrafos), a partir do destino, que param
+          quando se encontram. Com `bidirecional=False`, é o Dijkstra comum com
+          parada antecipada no destino.
+    E: grafo (Grafo/GrafoCSR), inicio_id (str/int), destino_id (str/int), bidirecional (bool)
+    S: (custo, list[Vertice]) - O custo e os vértices do caminho, da origem ao
+       destino; (infinito, None) se o destino for inalcançável.
+    """
+    s, t = _preparar(grafo, inicio_id, destino_id)
+    indptr, indices, pesos, _ = _listas(grafo)
+    if bidirecional:
+        custo, caminho = _dijkstra_bidirecional((indptr, indices, pesos), _listas(grafo, reverso=True)[:3], s, t)
     else:
-        s = grafo.vertices[0]
-        
-    distancias[s] = 0
+        dist, pred, _ = _dijkstra_listas(indptr, indices, pesos, s, t)
+        custo, caminho = dist[t], None
+        if custo != INF:
+            caminho = [t]
+            while caminho[-1] != s:
+                caminho.append(pred[caminho[-1]])
+            caminho.reverse()
+
+    if caminho is None:
+        return INF, None
+    vertices = grafo.vertices
+    return custo, [vertices[i] for i in caminho]
 
-    #Iniciando loop que visita todas as arestas
-    fila_prioridade = [(0, next(count), s)]
+def _preparar(grafo, inicio_id, destino_id=None):
+    """
+    Info: Valida os pesos do grafo e traduz origem e destino para posições.
+    S: (int, int) - Posições da origem e do destino (-1 se não houver destino).
+    """
+    if isinstance(grafo, GrafoCSR):
+        ponderado = grafo.arestas_ponderadas
+    else:
+        ponderado = all(a.peso is not None for a in grafo.arestas)
+    if not ponderado:
+        raise ValueError("Todas as arestas precisam ser ponderadas para execução do algoritmo.")
+
+    posicoes = []
+    for vertice_id, padrao in ((inicio_id, 0), (destino_id, -1)):
+        if vertice_id is None:
+            posicoes.append(padrao)
+            continue
+        i = grafo.posicao(vertice_id)
+        if i is None:
+            raise ValueError(f"Vértice com ID '{vertice_id}' não encontrado.")
+        posicoes.append(i)
+    return tuple(posicoes)
+
+def _listas(grafo, reverso=False):
+    """
+    Info: Índice (de saída ou, com `reverso`, de entrada) no formato de listas
+          usado pelo núcleo: do próprio CSR, ou de `indice_saida` para um Grafo,
+          guardado em `resultado_derivado` para ser montado uma vez por versão.
+    S: (list, list, list, list ou None) - indptr, indices, pesos e ids_arestas
+       (None no CSR).
+    """
+    if isinstance(grafo, GrafoCSR):
+        return grafo.como_listas(reverso) + (None,)
+    if not grafo.direcionado:
+        reverso = False
+    return grafo.resultado_derivado(("indice_saida", reverso), lambda: indice_saida(grafo, reverso))
+
+def indice_saida(grafo: Grafo, reverso=False):
+    """
+    Info: Índice das arestas de saída de um Grafo no mesmo formato do CSR, mas em
+          listas Python e com os pesos originais (Decimal, float ou inteiro),
+          para que as distâncias saiam no mesmo tipo dos pesos do grafo. Em grafos
+          não direcionados cada aresta aparece nos dois sentidos. Os vizinhos de
+          cada vértice mantêm a ordem de `grafo.arestas`.
+    E: grafo (Grafo/VisaoGrafo)
+       reverso (bool) - Se True, indexa as arestas de entrada (o grafo invertido).
+    S: (list, list, list, list) - indptr, indices, pesos e ids_arestas (posição
+       da aresta em `grafo.arestas`), indexados como em `GrafoCSR.como_listas`.
+    """
+    n = grafo.num_vertices()
+    posicao = grafo.posicao_vertice
+    saida = [[] for _ in range(n)]
+    for k, a in enumerate(grafo.arestas):
+        u, v = posicao(a.v1), posicao(a.v2)
+        if reverso:
+            u, v = v, u
+        saida[u].append((v, a.peso, k))
+        if not grafo.direcionado:
+            saida[v].append((u, a.peso, k))
+
+    indptr = [0] * (n + 1)
+    indices, pesos, ids_arestas = [], [], []
+    for u, arcos in enumerate(saida):
+        for v, peso, k in arcos:
+            indices.append(v)
+            pesos.append(peso)
+            ids_arestas.append(k)
+        indptr[u + 1] = len(indices)
+    return indptr, indices, pesos, ids_arestas
+
+def _dijkstra_listas(indptr, indices, pesos, s, alvo=-1):
+    """
+    Info: Núcleo do Dijkstra, comum ao Grafo e ao instantâneo CSR. Trabalha só
+          com posições: os vizinhos de `u` são `indices[indptr[u]:indptr[u+1]]`,
+          e distâncias e predecessores ficam em listas indexadas pela posição.
+          Custo O((V + E) log V).
+    E: indptr, indices, pesos (list) - O índice de saída (ver `indice_saida`).
+       s (int) - Posição da origem.
+       alvo (int) - Posição em que a busca para ao ser fixada (-1: nenhuma).
+    S: (list, list, list) - Distâncias (infinito se inalcançável), predecessores
+       (-1 se não houver) e, para cada vértice, a posição `k` no índice do arco
+       que chega a ele pela árvore.
+    """
+    n = len(indptr) - 1
+    dist = [INF] * n
+    pred = [-1] * n
+    aresta_pred = [-1] * n
+    dist[s] = 0
+
+    fila_prioridade = [(0, s)]
     while fila_prioridade:
-        dist_u, _, u = heapq.heappop(fila_prioridade)
-        
+        dist_u, u = heapq.heappop(fila_prioridade)
         # já achou caminho melhor
-        if dist_u > distancias[u]:
+        if dist_u > dist[u]:
             continue
-        
-        # vizinhos
-        arestas_u = [
-            aresta for aresta in grafo.arestas
-            if aresta.v1 == u
-        ]
+        if u == alvo:
+            break
 
         #relaxamento
-        for aresta in arestas_u:
-            v = aresta.v2
-            peso_uv = aresta.peso if aresta.peso is not None else 0
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            nova_distancia = dist_u + pesos[k]
+            if nova_distancia < dist[v]:
+                dist[v] = nova_distancia
+                pred[v] = u
+                aresta_pred[v] = k
+                heapq.heappush(fila_prioridade, (nova_distancia, v))
+
+    return dist, pred, aresta_pred
+
+def _dijkstra_bidirecional(frente, tras, s, t):
+    """
+    Info: Dijkstra bidirecional entre as posições `s` e `t`. Uma busca avança a
+          partir de `s` pelo índice `frente` e outra a partir de `t` pelo índice
+          `tras` (as arestas invertidas); a cada passo avança a busca de menor
+          fronteira. `mu` guarda o melhor caminho s -> v -> t já visto, e a busca
+          termina quando as duas fronteiras somadas não podem mais melhorá-lo.
+    E: frente, tras ((list, list, list)) - indptr, indices e pesos de cada sentido.
+       s, t (int) - Posições da origem e do destino.
+    S: (custo, list[int] ou None) - O custo e as posições do caminho de `s` a `t`.
+    """
+    if s == t:
+        return 0, [s]
 
-            nova_distancia = distancias[u] + peso_uv
+    n = len(frente[0]) - 1
+    dist = ([INF] * n, [INF] * n)
+    pred = ([-1] * n, [-1] * n)  # na busca de trás, o sucessor no caminho até t
+    dist[0][s] = dist[1][t] = 0
+    filas = ([(0, s)], [(0, t)])
+    indices_lado = (frente, tras)
+    mu, meio = INF, -1
 
-            if nova_distancia < distancias[v]:
-                distancias[v] = nova_distancia
-                predecessores[v] = u
+    while filas[0] and filas[1]:
+        if filas[0][0][0] + filas[1][0][0] >= mu:
+            break
+        lado = 0 if filas[0][0][0] <= filas[1][0][0] else 1
+        dist_lado, dist_outro = dist[lado], dist[1 - lado]
+        indptr, indices, pesos = indices_lado[lado]
 
-                heapq.heappush(fila_prioridade, (nova_distancia, next(count), v))
+        dist_u, u = heapq.heappop(filas[lado])
+        if dist_u > dist_lado[u]:
+            continue
 
-    # construindo grafo
-    spt = Grafo(direcionado=grafo.direcionado, ponderado=grafo.ponderado, nome_arquivo="DIJKSTRA")
-    
-    for vertice in grafo.vertices:      
-        spt.adicionar_vertice(vertice.id) 
-        
-    for v, pred_v in predecessores.items():
-        if pred_v is not None:
-            v_id = v.id
-            pred_id = pred_v.id
-            
-            aresta_original = grafo.get_aresta(pred_id, v_id)
-            
-            if aresta_original:
-                peso = aresta_original.peso
-                spt.adicionar_aresta(pred_id, v_id, w=peso)
-            else:
-                 spt.adicionar_aresta(pred_id, v_id, 0)
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            nova_distancia = dist_u + pesos[k]
+            if nova_distancia < dist_lado[v]:
+                dist_lado[v] = nova_distancia
+                pred[lado][v] = u
+                heapq.heappush(filas[lado], (nova_distancia, v))
+            if dist_outro[v] != INF and dist_lado[v] + dist_outro[v] < mu:
+                mu, meio = dist_lado[v] + dist_outro[v], v
 
-    return spt, distancias, predecessores
+    if meio == -1:
+        return INF, None
+
+    caminho = [meio]
+    while caminho[-1] != s:
+        caminho.append(pred[0][caminho[-1]])
+    caminho.reverse()
+    while caminho[-1] != t:
+        caminho.append(pred[1][caminho[-1]])
+    return mu, caminho
 
+def _dijkstra_csr(csr: GrafoCSR, s, alvo=-1):
+    """
+    Info: Dijkstra sobre um instantâneo CSR. Usa o mesmo núcleo do Grafo
+          (`_dijkstra_listas`), lendo os vizinhos diretamente dos arrays CSR.
+    E: csr (GrafoCSR), s (int) - Posição da origem, alvo (int) - Ver `_dijkstra_listas`.
+    S: (Grafo, dict, dict) - O mesmo contrato de `dijkstra`.
+    """
+    n = csr.num_vertices()
+    indptr, indices, pesos = csr.como_listas()
+    dist, pred, aresta_pred = _dijkstra_listas(indptr, indices, pesos, s, alvo)
+
+    vertices = csr.vertices
+    spt = Grafo.de_arestas(((csr.ids[pred[v]], csr.ids[v], pesos[aresta_pred[v]]) for v in range(n) if pred[v] != -1),
+                           vertices=(vertice.id for vertice in vertices), direcionado=csr.direcionado,
+                           ponderado=csr.ponderado, nome_arquivo="DIJKSTRA", modo_pesos="float")
+
+    distancias = {vertices[i]: dist[i] for i in range(n)}
+    predecessores = {vertices[i]: vertices[pred[i]] if pred[i] != -1 else None for i in range(n)}
+    return spt, distancias, predecessores
 
 
 def formatar_caminho_dijkstra(grafo, id_inicio: str, id_fim: str):
     """
-    Executa Dijkstra (com a assinatura modificada), reconstrói o caminho 
-    de custo mínimo e formata o texto para o vértice final especificado.
+    Calcula o caminho de custo mínimo entre dois vértices com o Dijkstra com
+    parada antecipada no destino (ver `caminho_minimo`), sem montar a árvore
+    inteira, e formata o texto para o vértice final especificado. A busca é a
+    mesma de `dijkstra(grafo, id_inicio)` interrompida no destino, de modo que,
+    mesmo com empates de custo, o caminho é o da árvore que essa chamada devolve.
 
     E: grafo (Grafo)
     E: id_inicio (str)
@@ -108,49 +283,27 @@ def formatar_caminho_dijkstra(grafo, id_inicio: str, id_fim: str):
         return titulo + "\n  Algoritmo não aplicável (grafo não ponderado).", None
     
     try:
-        _, distancias_obj, predecessores_obj = dijkstra(grafo, id_inicio)
-
-        dist_id = {v.id: d for v, d in distancias_obj.items()}
-        pred_id = {v.id: p.id if p else None for v, p in predecessores_obj.items()}
-        
         report = ""
-        
-        custo = dist_id.get(str(id_fim), INF) 
-        
-        if custo == INF:
-            report += f"  Não há caminho entre {id_inicio} e {id_fim}."
-            return titulo + "\n" + report, None
-
-        caminho_ids = []
-        atual = str(id_fim)
 
-        if atual not in pred_id:
+        if grafo.posicao(id_inicio) is None:
+            report += f"  Vértice inicial '{id_inicio}' não encontrado no grafo."
+            return titulo + "\n" + report, None
+        if grafo.posicao(id_fim) is None:
             report += f"  Vértice final '{id_fim}' não encontrado no grafo."
             return titulo + "\n" + report, None
 
-        while atual is not None and atual != "":
-            caminho_ids.append(atual)
-            if atual == str(id_inicio):
-                break
+        custo, caminho_vertices = grafo.resultado_derivado(
+            ("caminho_minimo", id_inicio, id_fim),
+            lambda: caminho_minimo(grafo, id_inicio, id_fim, bidirecional=False))
 
-            if atual not in pred_id:
-                 break
-                 
-            atual = pred_id[atual]
-
-        caminho_ids.reverse()
-        
-        if not caminho_ids or caminho_ids[0] != str(id_inicio) or caminho_ids[-1] != str(id_fim):
-            report += f"  Não foi possível reconstruir um caminho válido de {id_inicio} para {id_fim}."
+        if custo == INF:
+            report += f"  Não há caminho entre {id_inicio} e {id_fim}."
             return titulo + "\n" + report, None
-            
-        report += f"  Custo: {custo}\n"
-        report += "  Caminho: " + " -> ".join(caminho_ids)
-        
-        vertices_map = {v.id: v for v in grafo.vertices}
-        caminho_vertices = [vertices_map[v_id] for v_id in caminho_ids]
+
+        report += f"  Custo: {grafo.formatar_peso(custo)}\n"
+        report += "  Caminho: " + " -> ".join(str(v.id) for v in caminho_vertices)
         
         return titulo + "\n" + report, caminho_vertices
         
     except Exception as e:
-        return titulo + f"\n  Erro inesperado ao executar Dijkstra: {e}", None
\ No newline at end of file
+        return titulo + f"\n  Erro inesperado ao executar Dijkstra: {e}", None
@@ -7,15 +7,22 @@ Funções:   floyd_warshall(grafo)
            reconstruir_caminho(pred, vertices, i_idx, j_idx)
 """
 
-import copy
 from math import inf as infinito
 from lib.core.graph import Grafo, Vertice
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 def floyd_warshall(grafo: Grafo):
     """
     Tarefa: (7) Algoritmo de Floyd-Warshall
     Info: Encontra os caminhos mais curtos entre todos os pares de vértices.
-          Baseado no pseudocódigo fornecido.
+          Baseado no pseudocódigo fornecido. Com NumPy, cada passo k é uma única
+          operação vetorizada sobre a matriz densa de pesos (ver `_floyd_warshall_numpy`).
+          As distâncias são os pesos reais, em float, qualquer que seja o `modo_pesos`.
     Args:
         grafo (Grafo): O objeto grafo, que deve ser ponderado.
     Returns:
@@ -28,9 +35,14 @@ def floyd_warshall(grafo: Grafo):
     if not grafo.ponderado:
         raise ValueError("O algoritmo de Floyd-Warshall requer um grafo ponderado.")
 
+    if HAS_NUMPY:
+        dist, pred = _floyd_warshall_numpy(grafo)
+        return dist, pred, grafo.vertices
+
     n = grafo.num_vertices()
     vertices = grafo.vertices
-    dist = copy.deepcopy(grafo.matriz_adj) 
+    escala = grafo.escala_pesos
+    dist = [[infinito if w == infinito else float(w) / escala for w in linha] for linha in grafo.matriz_adj]
     pred = [[None for _ in range(n)] for _ in range(n)]
 
     for i in range(n):
@@ -48,6 +60,37 @@ def floyd_warshall(grafo: Grafo):
                     pred[i][j] = pred[k][j] 
     return dist, pred, vertices
 
+def _floyd_warshall_numpy(grafo: Grafo):
+    """
+    Info: Floyd-Warshall vetorizado sobre `grafo.matriz_pesos`. No passo k, todas
+          as distâncias são relaxadas de uma vez por
+          `np.minimum(dist, dist[:, k, None] + dist[None, k, :])`, e os
+          predecessores das células que melhoraram recebem, por atribuição com
+          máscara, os da linha k. A linha e a coluna k não mudam no passo k
+          (dist[k][k] = 0), o que torna a versão vetorizada equivalente aos
+          laços aninhados.
+    E: grafo (Grafo)
+    S: (list[list], list[list]) - dist e pred no formato de `floyd_warshall`
+       (None onde não há predecessor).
+    """
+    n = grafo.num_vertices()
+    dist = np.array(grafo.matriz_pesos, dtype=np.float64)
+    indices = np.arange(n)
+    pred = np.where(np.isfinite(dist), indices[:, None], -1)
+    dist[indices, indices] = 0
+    pred[indices, indices] = indices
+
+    via_k = np.empty_like(dist)
+    melhorou = np.empty(dist.shape, dtype=bool)
+    for k in range(n):
+        np.add(dist[:, k, None], dist[None, k, :], out=via_k)
+        np.less(via_k, dist, out=melhorou)
+        np.minimum(dist, via_k, out=dist)
+        pred[melhorou] = np.broadcast_to(pred[k], pred.shape)[melhorou]
+
+    pred_lista = [[None if p < 0 else p for p in linha] for linha in pred.tolist()]
+    return dist.tolist(), pred_lista
+
 def reconstruir_caminho(pred: list[list], vertices: list[Vertice], i_idx: int, j_idx: int):
     """
     Tarefa: (7) Recuperação de Caminhos
@@ -24,11 +24,10 @@ def _verificar_condicoes_eulerianas(grafo):
     if grafo.direcionado:
         d_pos_um = []
         d_neg_um = []
+        graus_entrada, graus_saida = grafo.graus()
 
-        for v in grafo.vertices:
-            grau = grafo.get_grau(v.id)
-            grau_entrada, grau_saida = grau
-            diferenca = grau_saida - grau_entrada
+        for i, v in enumerate(grafo.vertices):
+            diferenca = graus_saida[i] - graus_entrada[i]
 
             if diferenca == 1:
                 d_pos_um.append(v)
@@ -38,7 +37,7 @@ def _verificar_condicoes_eulerianas(grafo):
                 return False, None
 
         if (len(d_pos_um) == 0 and len(d_neg_um) == 0):
-            vertice_inicial = next((v for v in grafo.vertices if grafo.get_grau(v.id)[1] > 0), None)
+            vertice_inicial = next((v for i, v in enumerate(grafo.vertices) if graus_saida[i] > 0), None)
             return True, vertice_inicial
         elif (len(d_pos_um) == 1 and len(d_neg_um) == 1):
             vertice_inicial = d_pos_um[0]
@@ -48,13 +47,13 @@ def _verificar_condicoes_eulerianas(grafo):
 
     else: 
         graus_impares = []
-        for v in grafo.vertices:
-            grau = grafo.get_grau(v.id)
-            if grau % 2 != 0:
+        graus = grafo.graus()
+        for i, v in enumerate(grafo.vertices):
+            if graus[i] % 2 != 0:
                 graus_impares.append(v)
 
         if len(graus_impares) == 0:
-            vertice_inicial = next((v for v in grafo.vertices if grafo.get_grau(v.id) > 0), None)
+            vertice_inicial = next((v for i, v in enumerate(grafo.vertices) if graus[i] > 0), None)
             return True, vertice_inicial
         elif len(graus_impares) == 2:
             vertice_inicial = graus_impares[0]
@@ -20,19 +20,11 @@ def _verificar_condicoes_eulerianas(grafo):
         bool: True se as condições forem atendidas, False caso contrário.
     """
 
-    for v in grafo.vertices:
-        grau = grafo.get_grau(v.id)
-        if grafo.direcionado:
-            grau_entrada, grau_saida = grau
-            if grau_entrada != grau_saida:
-                #print("grau_entrada != grau_saida")
-                return False
-        else:
-            if grau % 2 != 0:
-                #print("grau % 2 != 0")
-                return False
+    if grafo.direcionado:
+        graus_entrada, graus_saida = grafo.graus()
+        return all(e == s for e, s in zip(graus_entrada, graus_saida))
 
-    return True
+    return all(grau % 2 == 0 for grau in grafo.graus())
 
 def hierholzer_ciclos(grafo):
     """
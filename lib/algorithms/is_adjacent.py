@@ -33,8 +33,8 @@ def are_adjacent_by_adj_matrix(grafo: Grafo, v1_id, v2_id) -> bool:
     try:
         v1 = grafo.indice_vertices[str(v1_id)]
         v2 = grafo.indice_vertices[str(v2_id)]
-        idx1 = grafo.vertices.index(v1)
-        idx2 = grafo.vertices.index(v2)
+        idx1 = grafo.posicao_vertice(v1)
+        idx2 = grafo.posicao_vertice(v2)
         
         return grafo.matriz_adj[idx1][idx2] == 1 or \
               (not grafo.direcionado and grafo.matriz_adj[idx2][idx1] == 1)
@@ -52,8 +52,8 @@ def are_adjacent_by_inc_matrix(grafo: Grafo, v1_id, v2_id) -> bool:
     try:
         v1 = grafo.indice_vertices[str(v1_id)]
         v2 = grafo.indice_vertices[str(v2_id)]
-        idx1 = grafo.vertices.index(v1)
-        idx2 = grafo.vertices.index(v2)
+        idx1 = grafo.posicao_vertice(v1)
+        idx2 = grafo.posicao_vertice(v2)
 
         if not grafo.matriz_incidencia or not grafo.matriz_incidencia[0]:
             return False
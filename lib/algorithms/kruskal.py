@@ -7,6 +7,7 @@ Funções:   kruskal(grafo)
 from lib.core.graph import Grafo, Aresta, Vertice
 from lib.algorithms.dfs import dfs
 from lib.core.graph_converter import get_grafo_subjacente
+from lib.core.graph_view import VisaoArestas
 
 def kruskal(grafo):
     """
@@ -17,7 +18,9 @@ def kruskal(grafo):
         grafo (Grafo): O objeto grafo ponderado.
 
     Returns:
-        agm (Grafo): Subgrafo gerador do grafo fornecido.
+        agm (Grafo): Subgrafo gerador do grafo fornecido, como visão (VisaoArestas) sobre
+            as arestas do grafo subjacente. A visão é somente leitura; para modificar a
+            árvore, use `agm.materializar()`.
     """
     
     grafo = get_grafo_subjacente(grafo)
@@ -32,13 +35,10 @@ def kruskal(grafo):
     # Implementação de verificação de ciclos usando busca em profundidade (DFS)
     # --------------------------------------------------------------------------
     
-    agm = Grafo(direcionado=grafo.direcionado, nome_arquivo="KRUSKAL")
-    for v in grafo.vertices:
-        agm.adicionar_vertice(v.id)
+    aceitas = []
 
-    temp = Grafo(direcionado=grafo.direcionado)
-    for v in grafo.vertices:
-        temp.adicionar_vertice(v.id)
+    temp = Grafo(direcionado=grafo.direcionado, modo_pesos=grafo.modo_pesos)
+    temp.adicionar_vertices(v.id for v in grafo.vertices)
 
     for aresta in arestas:
         temp.adicionar_aresta(aresta.v1.id, aresta.v2.id, aresta.peso)
@@ -50,7 +50,7 @@ def kruskal(grafo):
             temp.remover_aresta(aresta.v1.id, aresta.v2.id)
             continue
         else:
-            agm.adicionar_aresta(aresta.v1.id, aresta.v2.id, aresta.peso)
+            aceitas.append(aresta)
             continue
 
-    return agm
+    return VisaoArestas(grafo, aceitas, nome_arquivo="KRUSKAL")
@@ -241,12 +241,7 @@ if HAS_NUMBA:
         """Wrapper para 2-opt JIT."""
         ids = [v.id for v in grafo.vertices]
         mapa = {id_v: i for i, id_v in enumerate(ids)}
-        n = len(ids)
-        matriz = np.full((n, n), np.inf, dtype=np.float32)
-        for v in grafo.vertices:
-            idx1 = mapa[v.id]
-            for viz_id, peso in grafo.get_vizinhos(v.id).items():
-                matriz[idx1, mapa[viz_id]] = float(peso)
+        matriz = grafo.matriz_pesos
         
         indices_rota = np.array([mapa[vid] for vid in ciclo_ids], dtype=np.int32)
         melhor_indices, melhor_custo = jit_two_opt(indices_rota, matriz)
@@ -5,6 +5,7 @@ Objetivo:  Implementa o algoritmo de Tarjan para encontrar pontos de articulaç
 Funções:   - find_articulations_and_bridges(grafo)
 """
 from lib.core.graph import Grafo
+from lib.core.graph_csr import GrafoCSR
 
 def lowpt(grafo: Grafo):
     """
@@ -15,7 +16,7 @@ def lowpt(grafo: Grafo):
           O algoritmo opera em grafos não-direcionados. Se um dígrafo for
           passado, a análise será feita em seu grafo subjacente.
 
-    E: grafo (Grafo) - O objeto Grafo a ser analisado.
+    E: grafo (Grafo/GrafoCSR) - O objeto Grafo (ou seu instantâneo CSR) a ser analisado.
     S: (set, set) - Uma tupla contendo:
                     - Um conjunto com os IDs dos vértices de articulação.
                     - Um conjunto de tuplas representando as pontes.
@@ -23,6 +24,9 @@ def lowpt(grafo: Grafo):
     if grafo.direcionado:
         print("Aviso: O algoritmo de biconectividade opera sobre o grafo subjacente não-direcionado.")
 
+    if isinstance(grafo, GrafoCSR):
+        return _lowpt_csr(grafo)
+
     adj = grafo.lista_adj
     todos_vertices = grafo.vertices
     
@@ -72,4 +76,73 @@ def lowpt(grafo: Grafo):
         if vertice not in visitados:
             dfs_visit(vertice)
 
-    return pontos_articulacao, pontes
\ No newline at end of file
+    return pontos_articulacao, pontes
+
+def _lowpt_csr(csr: GrafoCSR):
+    """
+    Info: Versão de `lowpt` sobre um instantâneo CSR. Percorre os vizinhos por
+          posição inteira com uma pilha explícita, sem recursão.
+    E: csr (GrafoCSR)
+    S: (set, set) - Vértices de articulação e pontes, como em `lowpt`.
+    """
+    n = csr.num_vertices()
+    indptr, indices, _ = csr.como_listas()
+    ids = csr.ids
+
+    visitados = [False] * n
+    tempos_descoberta = [0] * n
+    low_link = [0] * n
+    parentes = [-1] * n
+    filhos_dfs = [0] * n
+
+    pontos_articulacao = set()
+    pontes = set()
+    tempo = 0
+
+    for raiz in range(n):
+        if visitados[raiz]:
+            continue
+
+        visitados[raiz] = True
+        tempo += 1
+        tempos_descoberta[raiz] = low_link[raiz] = tempo
+        pilha = [[raiz, indptr[raiz]]]
+
+        while pilha:
+            quadro = pilha[-1]
+            u, k = quadro
+
+            if k < indptr[u + 1]:
+                quadro[1] += 1
+                v = indices[k]
+                if v == parentes[u]:
+                    continue
+
+                if visitados[v]:
+                    low_link[u] = min(low_link[u], tempos_descoberta[v])
+                else:
+                    parentes[v] = u
+                    filhos_dfs[u] += 1
+                    visitados[v] = True
+                    tempo += 1
+                    tempos_descoberta[v] = low_link[v] = tempo
+                    pilha.append([v, indptr[v]])
+                continue
+
+            pilha.pop()
+            p = parentes[u]
+            if p == -1:
+                continue
+
+            low_link[p] = min(low_link[p], low_link[u])
+
+            if parentes[p] == -1 and filhos_dfs[p] > 1:
+                pontos_articulacao.add(csr.vertices[p].id)
+
+            if parentes[p] != -1 and low_link[u] >= tempos_descoberta[p]:
+                pontos_articulacao.add(csr.vertices[p].id)
+
+            if low_link[u] > tempos_descoberta[p]:
+                pontes.add(tuple(sorted((ids[p], ids[u]))))
+
+    return pontos_articulacao, pontes
@@ -0,0 +1,227 @@
+"""
+Módulo:    Caminhos Mínimos de Múltiplas Fontes
+Objetivo:  Calcula, num lote, as distâncias de várias origens a todos os
+           vértices, distribuindo as origens entre processos. Os arrays do
+           instantâneo CSR são copiados uma única vez para memória compartilhada,
+           e o Dijkstra de cada processo roda diretamente sobre eles: com Numba,
+           num núcleo compilado que lê os arrays e escreve suas linhas nas
+           matrizes de resultado, também compartilhadas; sem Numba, no núcleo em
+           Python puro, lendo os mesmos blocos por `memoryview`. Em nenhum dos
+           casos os processos fazem cópias próprias do grafo.
+
+Funções:   caminhos_multiplas_fontes(grafo, fontes, workers=None)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from lib.core.graph_csr import GrafoCSR
+from lib.algorithms.dijkstra import _dijkstra_listas
+
+try:
+    import numpy as np
+    from multiprocessing import shared_memory
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from numba import jit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Estado de cada processo do pool, preenchido por `_iniciar_processo`.
+_ESTADO = {}
+
+def caminhos_multiplas_fontes(grafo, fontes, workers=None):
+    """
+    Info: Dijkstra a partir de cada vértice de `fontes`, em lote. As origens são
+          divididas entre `workers` processos, que compartilham o mesmo
+          instantâneo CSR somente leitura em memória compartilhada; com um único
+          processo (ou uma única origem), tudo roda no processo atual, sobre os
+          arrays do próprio instantâneo.
+    E: grafo (Grafo/GrafoCSR) - Grafo ponderado, sem pesos negativos.
+       fontes (iterável de str/int) - IDs das origens.
+       workers (int, opcional) - Número de processos. Padrão: os.cpu_count().
+    S: (numpy.ndarray, numpy.ndarray) - Distâncias (S x V, float64, infinito se
+       inalcançável) e predecessores (S x V, int32, -1 se não houver). A linha `i`
+       corresponde a `fontes[i]`, e a coluna `j` ao vértice de posição `j`
+       (`grafo.vertices[j]`).
+    """
+    if not HAS_NUMPY:
+        raise ImportError("Os caminhos de múltiplas fontes requerem o pacote numpy.")
+
+    csr = grafo if isinstance(grafo, GrafoCSR) else grafo.resultado_derivado("csr", grafo.congelar)
+    if not csr.arestas_ponderadas:
+        raise ValueError("Todas as arestas precisam ser ponderadas para execução do algoritmo.")
+    if (csr.pesos < 0).any():
+        raise ValueError("O Dijkstra não aceita pesos negativos; use bellman_ford.")
+
+    posicoes = []
+    for fonte_id in fontes:
+        i = csr.posicao(fonte_id)
+        if i is None:
+            raise ValueError(f"Vértice com ID '{fonte_id}' não encontrado.")
+        posicoes.append(i)
+
+    s, n = len(posicoes), csr.num_vertices()
+    workers = os.cpu_count() if workers is None else workers
+    workers = max(1, min(workers, s))
+
+    arrays = {
+        "indptr": csr.indptr,
+        "indices": csr.indices,
+        "pesos": csr.pesos,
+        "fontes": np.array(posicoes, dtype=np.int64),
+        "distancias": np.empty((s, n), dtype=np.float64),
+        "predecessores": np.empty((s, n), dtype=np.int32),
+    }
+    if workers == 1:
+        _resolver_lote(arrays, 0, s)
+        return arrays["distancias"], arrays["predecessores"]
+
+    if HAS_NUMBA:
+        # Compila o núcleo antes de criar o pool: com `fork`, os processos já o
+        # recebem pronto, em vez de cada um compilar a sua cópia.
+        _resolver_lote(arrays, 0, 0)
+
+    blocos = {}
+    try:
+        descritores = {}
+        for nome, array in arrays.items():
+            bloco = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            blocos[nome] = bloco
+            np.ndarray(array.shape, dtype=array.dtype, buffer=bloco.buf)[...] = array
+            descritores[nome] = (bloco.name, array.shape, array.dtype.str)
+
+        # Lotes menores que o total por processo equilibram a carga entre eles.
+        tamanho_lote = max(1, -(-s // (workers * 4)))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_iniciar_processo,
+                                 initargs=(descritores,)) as executor:
+            lotes = [executor.submit(_resolver_lote_compartilhado, inicio, min(inicio + tamanho_lote, s))
+                     for inicio in range(0, s, tamanho_lote)]
+            for lote in lotes:
+                lote.result()
+
+        resultado = []
+        for nome in ("distancias", "predecessores"):
+            _, forma, tipo = descritores[nome]
+            resultado.append(np.ndarray(forma, dtype=tipo, buffer=blocos[nome].buf).copy())
+        return tuple(resultado)
+    finally:
+        for bloco in blocos.values():
+            bloco.close()
+            bloco.unlink()
+
+def _resolver_lote(arrays, inicio, fim):
+    """
+    Info: Preenche as linhas `inicio:fim` das matrizes de resultado, lendo o CSR
+          diretamente dos arrays dados (do instantâneo ou da memória compartilhada).
+    E: arrays (dict) - indptr, indices, pesos, fontes, distancias e predecessores.
+    S: None
+    """
+    if HAS_NUMBA:
+        _dijkstra_lote(arrays["indptr"], arrays["indices"], arrays["pesos"], arrays["fontes"],
+                       inicio, fim, arrays["distancias"], arrays["predecessores"])
+        return
+
+    # Indexar uma memoryview devolve int/float do Python sem copiar o array e
+    # sem o custo dos escalares NumPy; o núcleo em Python puro a aceita como lista.
+    indptr, indices, pesos = (memoryview(arrays[nome]) for nome in ("indptr", "indices", "pesos"))
+    fontes, distancias, predecessores = arrays["fontes"], arrays["distancias"], arrays["predecessores"]
+    for linha in range(inicio, fim):
+        dist, pred, _ = _dijkstra_listas(indptr, indices, pesos, int(fontes[linha]))
+        distancias[linha] = dist
+        predecessores[linha] = pred
+
+if HAS_NUMBA:
+    @jit(nopython=True, nogil=True)
+    def _dijkstra_lote(indptr, indices, pesos, fontes, inicio, fim, distancias, predecessores):
+        """
+        Kernel compilado: o Dijkstra de `_dijkstra_listas` para as linhas
+        `inicio:fim`, com a fila de prioridade num heap binário sobre dois arrays.
+        O heap ordena por (distância, vértice), como o `heapq` com tuplas, de modo
+        que os predecessores saem iguais aos do núcleo em Python puro.
+        """
+        capacidade = indices.shape[0] + 1
+        heap_d = np.empty(capacidade, dtype=np.float64)
+        heap_v = np.empty(capacidade, dtype=np.int64)
+        for linha in range(inicio, fim):
+            dist = distancias[linha]
+            pred = predecessores[linha]
+            dist[:] = np.inf
+            pred[:] = -1
+            s = fontes[linha]
+            dist[s] = 0.0
+            heap_d[0] = 0.0
+            heap_v[0] = s
+            tamanho = 1
+
+            while tamanho > 0:
+                dist_u = heap_d[0]
+                u = heap_v[0]
+                tamanho -= 1
+                if tamanho > 0:
+                    # O último elemento desce a partir da raiz.
+                    d_x = heap_d[tamanho]
+                    x = heap_v[tamanho]
+                    i = 0
+                    while True:
+                        filho = 2 * i + 1
+                        if filho >= tamanho:
+                            break
+                        direito = filho + 1
+                        if direito < tamanho and (heap_d[direito] < heap_d[filho] or
+                                                  (heap_d[direito] == heap_d[filho] and heap_v[direito] < heap_v[filho])):
+                            filho = direito
+                        if heap_d[filho] < d_x or (heap_d[filho] == d_x and heap_v[filho] < x):
+                            heap_d[i] = heap_d[filho]
+                            heap_v[i] = heap_v[filho]
+                            i = filho
+                        else:
+                            break
+                    heap_d[i] = d_x
+                    heap_v[i] = x
+
+                # já achou caminho melhor
+                if dist_u > dist[u]:
+                    continue
+
+                for k in range(indptr[u], indptr[u + 1]):
+                    v = indices[k]
+                    nova_distancia = dist_u + pesos[k]
+                    if nova_distancia < dist[v]:
+                        dist[v] = nova_distancia
+                        pred[v] = u
+                        # Cada vértice é fixado uma vez, então há no máximo uma
+                        # inserção por arco: o heap nunca passa de `capacidade`.
+                        i = tamanho
+                        tamanho += 1
+                        while i > 0:
+                            pai = (i - 1) // 2
+                            if nova_distancia < heap_d[pai] or (nova_distancia == heap_d[pai] and v < heap_v[pai]):
+                                heap_d[i] = heap_d[pai]
+                                heap_v[i] = heap_v[pai]
+                                i = pai
+                            else:
+                                break
+                        heap_d[i] = nova_distancia
+                        heap_v[i] = v
+
+def _iniciar_processo(descritores):
+    """
+    Info: Inicialização de cada processo do pool: abre os blocos compartilhados e
+          monta sobre eles os arrays usados por `_resolver_lote`, sem copiá-los.
+    """
+    # Os blocos pertencem ao processo principal, que os remove ao final; aqui
+    # eles só são abertos e mantidos vivos enquanto o processo existir.
+    arrays = {}
+    blocos = _ESTADO.setdefault("blocos", [])
+    for nome, (nome_bloco, forma, tipo) in descritores.items():
+        bloco = shared_memory.SharedMemory(name=nome_bloco)
+        blocos.append(bloco)
+        arrays[nome] = np.ndarray(forma, dtype=tipo, buffer=bloco.buf)
+    _ESTADO["arrays"] = arrays
+
+def _resolver_lote_compartilhado(inicio, fim):
+    _resolver_lote(_ESTADO["arrays"], inicio, fim)
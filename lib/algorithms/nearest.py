@@ -1,5 +1,4 @@
-from lib.utils.converter import get_decimal
-from decimal import Decimal
+from math import inf as INF
 
 try:
     import numpy as np
@@ -59,18 +58,10 @@ if HAS_NUMBA:
                            - Lista com os IDs da rota encontrada.
                            - Custo total do ciclo.
         """
-        # (Objeto -> Numpy)
+        # (Objeto -> Numpy) sem cópia: a matriz densa já pertence ao grafo
         ids = [v.id for v in grafo.vertices]
-        n = len(ids)
         mapa = {id_v: i for i, id_v in enumerate(ids)}
-        
-        # Cria matriz float32 
-        matriz = np.full((n, n), np.inf, dtype=np.float32)
-        
-        for v in grafo.vertices:
-            idx1 = mapa[v.id]
-            for viz_id, peso in grafo.get_vizinhos(v.id).items():
-                matriz[idx1, mapa[viz_id]] = float(peso)
+        matriz = grafo.matriz_pesos
         
         id_inicio = inicio.id if hasattr(inicio, "id") else inicio
         idx_inicio = mapa.get(id_inicio, 0)
@@ -80,39 +71,41 @@ if HAS_NUMBA:
         rota_final = [ids[i] for i in indices]
         return rota_final, float(custo)
 
-#  IMPLEMENTAÇÃO ORIGINAL (PYTHON PURO + DECIMAL)
+#  IMPLEMENTAÇÃO ORIGINAL (PYTHON PURO)
 def nearest_neighbor(grafo, inicio=0):
     """
     Tarefa: (1) Heurística construtiva Vizinho Mais Próximo (Padrão).
     Info: Constrói um ciclo hamiltoniano guloso escolhendo sempre a aresta de
-          menor custo disponível a partir do vértice atual. Utiliza a biblioteca
-          Decimal para precisão numérica.
+          menor custo disponível a partir do vértice atual. A aritmética usa o
+          tipo nativo do `modo_pesos` do grafo (Decimal, float ou inteiro).
 
     E: grafo (Grafo) - O objeto Grafo onde o ciclo será encontrado.
        inicio (str/int) - O vértice de início para o ciclo (ou seu ID).
 
-    S: (list, Decimal) - Uma tupla contendo:
-                         - Lista de vértices (IDs) no ciclo.
-                         - Custo total do ciclo com precisão Decimal.
+    S: (list, número) - Uma tupla contendo:
+                        - Lista de vértices (IDs) no ciclo.
+                        - Custo total do ciclo, no tipo do `modo_pesos`.
     """
     visitados = set()
     ciclo = []
-    custo_total = get_decimal(0)
+    custo_total = 0
     atual = inicio.id if hasattr(inicio, "id") else inicio
 
     while len(visitados) < len(grafo.vertices):
         visitados.add(atual)
         ciclo.append(atual)
 
-        vizinhos = grafo.get_vizinhos(atual)
         proximo = None
-        menor_custo = Decimal('Infinity')
+        menor_custo = INF
 
-        for vizinho, peso in vizinhos.items():
-            peso = get_decimal(peso)
-            if vizinho not in visitados and peso < menor_custo:
+        for vizinho, peso in grafo.iter_vizinhos(atual):
+            if vizinho.id in visitados:
+                continue
+            if peso is None:
+                peso = grafo.escala_pesos
+            if peso < menor_custo:
                 menor_custo = peso
-                proximo = vizinho
+                proximo = vizinho.id
 
         if proximo is None:
             break
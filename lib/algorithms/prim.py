@@ -1,13 +1,21 @@
+import heapq
 from lib.core.graph import Grafo, Aresta, Vertice
+from lib.core.graph_csr import GrafoCSR
 from lib.core.graph_display import imprimir_matriz_adj
 from lib.core.graph_converter import get_grafo_subjacente
+from lib.core.graph_view import VisaoArestas
 from math import inf as infinito
 
 def prim(grafo):
     """
     Tarefa: (2).
     Info: Implementa o algoritmo de Prim para encontrar a árvore geradora mínima de um grafo ponderado.
+          Aceita também um instantâneo CSR (GrafoCSR).
+          Sobre um Grafo, a árvore é uma visão (VisaoArestas) somente leitura com as
+          arestas do grafo subjacente; `materializar()` devolve uma cópia modificável.
     """
+    if isinstance(grafo, GrafoCSR):
+        return _prim_csr(grafo)
 
     grafo = get_grafo_subjacente(grafo)
 
@@ -21,7 +29,7 @@ def prim(grafo):
 
     if "1" not in grafo.indice_vertices:
         if not n:
-            return Grafo(direcionado=grafo.direcionado, nome_arquivo="PRIM_VAZIO", ponderado=True) # Grafo vazio
+            return Grafo(direcionado=grafo.direcionado, nome_arquivo="PRIM_VAZIO", ponderado=True, modo_pesos=grafo.modo_pesos) # Grafo vazio
         vertice_inicial = n[0]
     else:
         vertice_inicial = grafo.indice_vertices["1"]
@@ -34,9 +42,9 @@ def prim(grafo):
         melhor_peso = infinito
 
         for vertice_z in z:
-            indice_z = grafo.vertices.index(vertice_z)
+            indice_z = grafo.posicao_vertice(vertice_z)
             for vertice_n in n:
-                indice_n = grafo.vertices.index(vertice_n)
+                indice_n = grafo.posicao_vertice(vertice_n)
                 
                 w1 = grafo.matriz_adj[indice_z][indice_n] # z -> n
                 w2 = grafo.matriz_adj[indice_n][indice_z] # n -> z
@@ -52,16 +60,55 @@ def prim(grafo):
         
         v1, v2, peso_encontrado = melhor_aresta_dados
 
-        t.append(Aresta(v1, v2, peso_encontrado))
+        t.append(grafo.get_aresta(v1.id, v2.id))
         
         z.append(v2)
         n.remove(v2)
 
-    agm = Grafo(direcionado=grafo.direcionado, nome_arquivo="PRIM", ponderado=True)
-    for v in grafo.vertices:
-        agm.adicionar_vertice(v.id)
+    return VisaoArestas(grafo, t, nome_arquivo="PRIM")
 
-    for aresta in t:
-        agm.adicionar_aresta(aresta.v1.id, aresta.v2.id, aresta.peso)
+def _prim_csr(csr: GrafoCSR):
+    """
+    Info: Prim com fila de prioridade sobre um instantâneo CSR. Em dígrafos,
+          percorre os CSR de saída e de entrada, o que equivale a operar sobre
+          o grafo subjacente.
+    E: csr (GrafoCSR)
+    S: Grafo - A árvore geradora mínima, como em `prim`.
+    """
+    if not csr.arestas_ponderadas:
+        raise ValueError("Todas as arestas precisam ser ponderadas para execução do algoritmo.")
+
+    n = csr.num_vertices()
+    if n == 0:
+        return Grafo(direcionado=False, nome_arquivo="PRIM_VAZIO", ponderado=True, modo_pesos="float")
+
+    adjacencias = [csr.como_listas()]
+    if csr.direcionado:
+        adjacencias.append(csr.como_listas(reverso=True))
+
+    inicial = csr.posicao("1")
+    if inicial is None:
+        inicial = 0
+
+    na_agm = [False] * n
+    t = []
+    fila = []
+
+    def expandir(u):
+        na_agm[u] = True
+        for indptr, indices, pesos in adjacencias:
+            for k in range(indptr[u], indptr[u + 1]):
+                if not na_agm[indices[k]]:
+                    heapq.heappush(fila, (pesos[k], u, indices[k]))
+
+    expandir(inicial)
+    while fila:
+        peso, u, v = heapq.heappop(fila)
+        if na_agm[v]:
+            continue
+        t.append((u, v, peso))
+        expandir(v)
 
-    return agm
\ No newline at end of file
+    return Grafo.de_arestas(((csr.ids[u], csr.ids[v], peso) for u, v, peso in t),
+                            vertices=(v.id for v in csr.vertices), direcionado=False,
+                            nome_arquivo="PRIM", ponderado=True, modo_pesos="float")
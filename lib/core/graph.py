@@ -12,46 +12,214 @@ Funções:   A classe Grafo inclui métodos para manipulação (adicionar vérti
            sincronização das estruturas de dados internas.
 """
 import collections
+from bisect import bisect_left, insort
 from math import inf as infinito
-from lib.utils.converter import get_decimal
+from lib.utils.converter import get_decimal, formatar_peso, peso_real, MODOS_PESO, ESCALA_INTEIRO
 from decimal import Decimal
+from lib.core.graph_csr import GrafoCSR
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 class Vertice:
-    """Info: Representa um vértice (ou nó) em um grafo."""
-    def __init__(self, id):
+    """
+    Info: Representa um vértice (ou nó) em um grafo.
+          `indice` é a posição do vértice em `Grafo.vertices`, usada para
+          acessar diretamente as linhas e colunas das matrizes.
+          Usa `__slots__` (sem `__dict__` por instância) e hash por identidade,
+          que não muda durante a vida do objeto.
+    """
+    __slots__ = ("id", "indice")
+
+    def __init__(self, id, indice=None):
         self.id = id
+        self.indice = indice
     
     def __str__(self):
         return str(self.id)
 
 class Aresta:
-    """Info: Representa uma aresta (ou arco) que conecta dois vértices."""
-    def __init__(self, v1, v2, peso=None):
+    """
+    Info: Representa uma aresta (ou arco) que conecta dois vértices.
+          `indice` é o identificador inteiro da aresta: sua posição em
+          `Grafo.arestas`, o que permite referenciá-la por um inteiro.
+    """
+    __slots__ = ("v1", "v2", "peso", "indice")
+
+    def __init__(self, v1, v2, peso=None, indice=None):
         self.v1 = v1
         self.v2 = v2
         self.peso = peso
+        self.indice = indice
     
     def __str__(self):
         peso_str = f", peso={self.peso}" if self.peso is not None else ""
         return f"({self.v1},{self.v2}{peso_str})"
 
+# Fração de lacunas (posições removidas) a partir da qual a lista interna de
+# vértices ou de arestas é compactada já na remoção (ver `_compactar_vertices`).
+FRACAO_LACUNAS = 0.5
+
 class Grafo:
-    def __init__(self, direcionado=False, nome_arquivo="", vertices=None, ponderado=False):
+    # Lacunas deixadas pelas remoções em `vertices` (posições na lista interna,
+    # em ordem) e em `arestas` (contagem). Como atributos de classe, valem
+    # "nenhuma" também para as visões, que não removem nada.
+    _lacunas_vertices = ()
+    _arestas_removidas = 0
+
+    def __init__(self, direcionado=False, nome_arquivo="", vertices=None, ponderado=False, dtype_pesos="float64",
+                 modo_pesos="decimal"):
         """
         Info: Representa um grafo, gerenciando suas estruturas de dados e operações.
-        E: direcionado (bool), nome_arquivo (str)
+              Os pesos das arestas ficam na representação do `modo_pesos`: Decimal
+              exato ("decimal"), float ("float") ou inteiro em ponto fixo com duas
+              casas ("inteiro", valor x 100). A conversão é feita uma vez na carga
+              (ver `converter_peso`) e `get_peso` devolve o tipo nativo do modo.
+        E: direcionado (bool), nome_arquivo (str), ponderado (bool),
+           dtype_pesos (str) - Tipo NumPy da matriz densa de pesos ("float64" ou "float32"),
+           modo_pesos (str) - "decimal", "float" ou "inteiro".
         S: None
         """
+        if modo_pesos not in MODOS_PESO:
+            raise ValueError(f"Modo de pesos desconhecido: '{modo_pesos}'. Use um de {MODOS_PESO}.")
+
         self.direcionado = direcionado
         self.ponderado = ponderado
         self.nome_arquivo = nome_arquivo
         self.vertices = list(vertices) if vertices else []
+        for i, v in enumerate(self.vertices):
+            v.indice = i
         self.arestas = []
         self.indice_vertices = {} 
+        self.indice_arestas = {}
         self.lista_adj = collections.defaultdict(list)
-        self.matriz_adj = []
-        self.matriz_incidencia = []
+        self.pesos_adj = collections.defaultdict(dict)
+        # Adjacência reversa (arestas de entrada); em grafos não direcionados é o próprio `pesos_adj`.
+        self.adj_entrada = collections.defaultdict(dict) if direcionado else self.pesos_adj
+        self._grau_entrada = [0] * len(self.vertices)
+        self._grau_saida = [0] * len(self.vertices)
         self.vazio = infinito if self.ponderado else 0
+        self.dtype_pesos = dtype_pesos
+        self.modo_pesos = modo_pesos
+        self.escala_pesos = ESCALA_INTEIRO if modo_pesos == "inteiro" else 1
+        self._matriz_adj = None
+        self._matriz_incidencia = None
+        self._matriz_pesos = None
+        self.versao = 0
+        self.log_mutacoes = None
+        self._derivados = {}
+
+    @classmethod
+    def de_arestas(cls, arestas, vertices=None, direcionado=False, nome_arquivo="", ponderado=False, dtype_pesos="float64",
+                   modo_pesos="decimal"):
+        """
+        Info: Constrói um grafo de uma só vez a partir de uma coleção de arestas,
+              montando todas as estruturas internas numa única passada (tempo
+              linear). Vértices ausentes são criados na ordem em que aparecem e
+              arestas repetidas ficam com o menor peso.
+        E: arestas (iterável de (u, v) ou (u, v, w), ou numpy.ndarray de forma (m, 2)/(m, 3)),
+           vertices (iterável de ids, opcional) - Incluídos antes das arestas, fixando
+           a ordem e permitindo vértices isolados. Os demais parâmetros são os do construtor.
+        S: Grafo - O grafo construído.
+        """
+        grafo = cls(direcionado=direcionado, nome_arquivo=nome_arquivo, ponderado=ponderado, dtype_pesos=dtype_pesos,
+                    modo_pesos=modo_pesos)
+        if vertices is not None:
+            grafo.adicionar_vertices(vertices)
+        grafo.adicionar_arestas(arestas, criar_vertices=True)
+        return grafo
+
+    # --------------------------------------------------------------------------
+    # Vértices e Arestas (compactados sob demanda)
+    # --------------------------------------------------------------------------
+    @property
+    def vertices(self):
+        """
+        Info: Vértices do grafo, na ordem de inclusão. Uma remoção deixa uma lacuna
+              na lista interna; inclusões e consultas pontuais (graus, posições,
+              contagens) trabalham com as lacunas, que só são fechadas quando a
+              lista inteira é pedida aqui ou quando passam de `FRACAO_LACUNAS`
+              dela (ver `_compactar_vertices`).
+        S: list[Vertice]
+        """
+        if self._lacunas_vertices:
+            self._compactar_vertices()
+        return self._lista_vertices
+
+    @vertices.setter
+    def vertices(self, vertices):
+        self._lista_vertices = list(vertices)
+        self._lacunas_vertices = []
+
+    @property
+    def arestas(self):
+        """
+        Info: Arestas do grafo, na ordem de inclusão, com as lacunas tratadas como
+              em `vertices` (ver `_compactar_arestas`).
+        S: list[Aresta]
+        """
+        if self._arestas_removidas:
+            self._compactar_arestas()
+        return self._lista_arestas
+
+    @arestas.setter
+    def arestas(self, arestas):
+        self._lista_arestas = list(arestas)
+        self._arestas_removidas = 0
+
+    # --------------------------------------------------------------------------
+    # Matrizes (materializadas sob demanda)
+    # --------------------------------------------------------------------------
+    @property
+    def matriz_adj(self):
+        """
+        Info: Matriz de adjacência do grafo. É construída a partir das arestas
+              no primeiro acesso e mantida em cache até a próxima modificação.
+        S: list[list] - Matriz V x V com os pesos (ou 1) das arestas.
+        """
+        if self._matriz_adj is None:
+            self._matriz_adj = self._construir_matriz_adj()
+        return self._matriz_adj
+
+    @matriz_adj.setter
+    def matriz_adj(self, matriz):
+        self._matriz_adj = matriz
+
+    @property
+    def matriz_incidencia(self):
+        """
+        Info: Matriz de incidência do grafo. É construída a partir das arestas
+              no primeiro acesso e mantida em cache até a próxima modificação.
+        S: list[list] - Matriz V x E com a incidência de cada vértice em cada aresta.
+        """
+        if self._matriz_incidencia is None:
+            self._matriz_incidencia = self._construir_matriz_inc()
+        return self._matriz_incidencia
+
+    @matriz_incidencia.setter
+    def matriz_incidencia(self, matriz):
+        self._matriz_incidencia = matriz
+
+    @property
+    def matriz_pesos(self):
+        """
+        Info: Matriz densa de pesos em NumPy, contígua e somente leitura, pronta
+              para kernels Numba e operações vetorizadas. É construída no primeiro
+              acesso e, a partir daí, atualizada no lugar pelas operações sobre
+              arestas; inclusão ou exclusão de vértices a descarta. Os valores
+              são os pesos reais (sem a escala do modo "inteiro").
+        S: numpy.ndarray - Matriz V x V do tipo `dtype_pesos`, com `inf` onde não há aresta.
+        """
+        if not HAS_NUMPY:
+            raise ImportError("A matriz densa de pesos requer o pacote numpy.")
+        if self._matriz_pesos is None:
+            self._matriz_pesos = self._construir_matriz_pesos()
+        visao = self._matriz_pesos.view()
+        visao.flags.writeable = False
+        return visao
 
     # --------------------------------------------------------------------------
     # Interface Pública de Manipulação
@@ -67,15 +235,30 @@ class Grafo:
         if id in self.indice_vertices:
             return self.indice_vertices[id]
 
-        v = Vertice(id)
-        self.vertices.append(v)
-        self.indice_vertices[id] = v
-        
-        self._adicionar_vertice_lista_adj(v)
-        self._adicionar_vertice_matriz_adj()
-        self._adicionar_vertice_matriz_inc()
+        v = self._novo_vertice(id)
+        self._invalidar_matrizes()
+        self._matriz_pesos = None
 
         return v
+
+    def adicionar_vertices(self, ids):
+        """
+        Info: Inclui vários vértices de uma vez, ignorando os que já existem.
+              As matrizes em cache são descartadas uma única vez ao final.
+              Os IDs são normalizados para str, como nas consultas.
+        E: ids (iterável de str/int) - Identificadores dos vértices.
+        S: None
+        """
+        indice_vertices = self.indice_vertices
+        total_anterior = self.num_vertices()
+        for id in ids:
+            id = str(id)
+            if id not in indice_vertices:
+                self._novo_vertice(id)
+
+        if self.num_vertices() != total_anterior:
+            self._invalidar_matrizes()
+            self._matriz_pesos = None
     
     def adicionar_aresta(self, v1_id, v2_id, w=None):
         """
@@ -90,29 +273,104 @@ class Grafo:
             print(f"Alerta: Vértice não encontrado ao criar aresta ({v1_id}, {v2_id}).")
             return
         
-        aresta_existente = None
-        for a in self.arestas:
-            if self.direcionado:
-                if a.v1 == v1 and a.v2 == v2:
-                    aresta_existente = a
-                    break
-            else:
-                if (a.v1 == v1 and a.v2 == v2) or (a.v1 == v2 and a.v2 == v1):
-                    aresta_existente = a
-                    break
+        chave = self._chave_aresta(v1, v2)
+        aresta_existente = self.indice_arestas.get(chave)
         if aresta_existente:
             if peso is not None and peso < aresta_existente.peso:
                 print(f"  DEBUG: Atualizando peso de ({v1_id}, {v2_id}). Antigo: {aresta_existente.peso}, Novo: {peso}")
                 aresta_existente.peso = peso
-                self._adicionar_aresta_matriz_adj(v1, v2, peso)
+                self._atualizar_peso_adj(v1, v2, peso)
+                self._registrar_mutacao("atualizar_peso", v1.id, v2.id, peso)
+                self._invalidar_matrizes()
+                self._atualizar_matriz_pesos(v1, v2, peso)
             else:
                 return
         else:
-            nova_aresta = Aresta(v1, v2, peso)
-            self.arestas.append(nova_aresta)
-            self._adicionar_aresta_lista_adj(v1, v2)
-            self._adicionar_aresta_matriz_adj(v1, v2, peso)
-            self._adicionar_aresta_matriz_inc(v1, v2)
+            nova_aresta = Aresta(v1, v2, peso, len(self._lista_arestas))
+            self._lista_arestas.append(nova_aresta)
+            self.indice_arestas[chave] = nova_aresta
+            self._adicionar_aresta_lista_adj(v1, v2, peso)
+            self._registrar_mutacao("adicionar_aresta", v1.id, v2.id, peso)
+            self._invalidar_matrizes()
+            self._atualizar_matriz_pesos(v1, v2, peso)
+
+    def adicionar_arestas(self, arestas, criar_vertices=False):
+        """
+        Info: Inclui várias arestas numa única passada. Arestas repetidas (na
+              entrada ou já presentes no grafo) ficam com o menor peso; uma
+              aresta sem peso nunca substitui nem é substituída. As matrizes em
+              cache são descartadas uma única vez ao final.
+        E: arestas (iterável de (u, v) ou (u, v, w), ou numpy.ndarray de forma (m, 2)/(m, 3)),
+           criar_vertices (bool) - Se True, cria os vértices ausentes (com ID em str)
+           na ordem em que aparecem; caso contrário, a aresta é ignorada com um alerta.
+        S: None
+        """
+        if HAS_NUMPY and isinstance(arestas, np.ndarray):
+            # Num array numérico os IDs viram inteiros antes do `str`; sem isso,
+            # um array float (u, v, w) daria os IDs '1.0', '2.0', ...
+            colunas = [arestas[:, 0], arestas[:, 1]]
+            if arestas.dtype.kind in "biuf":
+                for i, coluna in enumerate(colunas):
+                    inteiros = coluna.astype(np.int64)
+                    if (inteiros != coluna).any():
+                        raise ValueError("IDs de vértices num array numérico precisam ser inteiros.")
+                    colunas[i] = inteiros
+            colunas = [coluna.tolist() for coluna in colunas]
+            if arestas.shape[1] > 2:
+                colunas.append(arestas[:, 2].tolist())
+            arestas = zip(*colunas)
+
+        indice_vertices = self.indice_vertices
+        indice_arestas = self.indice_arestas
+        lista_adj = self.lista_adj
+        pesos_adj = self.pesos_adj
+        adj_entrada = self.adj_entrada
+        lista_arestas = self._lista_arestas
+        grau_entrada = self._grau_entrada
+        grau_saida = self._grau_saida
+        direcionado = self.direcionado
+
+        for aresta in arestas:
+            v1_id, v2_id = str(aresta[0]), str(aresta[1])
+            peso = aresta[2] if len(aresta) > 2 else None
+
+            v1 = indice_vertices.get(v1_id)
+            v2 = indice_vertices.get(v2_id)
+            if v1 is None or v2 is None:
+                if not criar_vertices:
+                    print(f"Alerta: Vértice não encontrado ao criar aresta ({v1_id}, {v2_id}).")
+                    continue
+                if v1 is None:
+                    v1 = self._novo_vertice(v1_id)
+                if v2 is None:
+                    v2 = indice_vertices.get(v2_id) or self._novo_vertice(v2_id)
+
+            chave = (v1, v2) if direcionado or id(v1) <= id(v2) else (v2, v1)
+            existente = indice_arestas.get(chave)
+            if existente is not None:
+                if peso is not None and existente.peso is not None and peso < existente.peso:
+                    existente.peso = peso
+                    self._atualizar_peso_adj(v1, v2, peso)
+                    self._registrar_mutacao("atualizar_peso", v1.id, v2.id, peso)
+                continue
+
+            nova_aresta = Aresta(v1, v2, peso, len(lista_arestas))
+            lista_arestas.append(nova_aresta)
+            indice_arestas[chave] = nova_aresta
+            lista_adj[v1].append(v2)
+            pesos_adj[v1][v2] = peso
+            grau_saida[v1.indice] += 1
+            if direcionado:
+                adj_entrada[v2][v1] = peso
+                grau_entrada[v2.indice] += 1
+            else:
+                lista_adj[v2].append(v1)
+                pesos_adj[v2][v1] = peso
+                grau_saida[v2.indice] += 1
+            self._registrar_mutacao("adicionar_aresta", v1.id, v2.id, peso)
+
+        self._invalidar_matrizes()
+        self._matriz_pesos = None
 
     def remover_aresta(self, v1_id, v2_id):
         v1 = self.indice_vertices.get(str(v1_id))
@@ -122,43 +380,37 @@ class Grafo:
             print(f"Alerta: Vértice não encontrado ao remover aresta ({v1_id}, {v2_id}).")
             return False
 
-        aresta_remover = None
-        for a in self.arestas:
-            if not self.direcionado:
-                if (a.v1 == v1 and a.v2 == v2) or (a.v1 == v2 and a.v2 == v1):
-                    aresta_remover = a
-                    break
-            else:
-                if a.v1 == v1 and a.v2 == v2:
-                    aresta_remover = a
-                    break
-
+        aresta_remover = self.indice_arestas.pop(self._chave_aresta(v1, v2), None)
         if not aresta_remover:
             print(f"Alerta: Aresta ({v1_id}, {v2_id}) não encontrada para remoção.")
             return False
 
-        idx_aresta = self.arestas.index(aresta_remover)
-        self.arestas.remove(aresta_remover)
-
+        self._descartar_aresta(aresta_remover)
         self.lista_adj[v1] = [v for v in self.lista_adj[v1] if v != v2]
-        if not self.direcionado:
+        del self.pesos_adj[v1][v2]
+        if self.direcionado:
+            del self.adj_entrada[v2][v1]
+        else:
             self.lista_adj[v2] = [v for v in self.lista_adj[v2] if v != v1]
+            self.pesos_adj[v2].pop(v1, None)
 
-        i1 = self.vertices.index(v1)
-        i2 = self.vertices.index(v2)
-        self.matriz_adj[i1][i2] = 0
-        if not self.direcionado:
-            self.matriz_adj[i2][i1] = 0
+        self._registrar_mutacao("remover_aresta", v1.id, v2.id)
 
-        for linha in self.matriz_incidencia:
-            linha.pop(idx_aresta)
+        self._invalidar_matrizes()
+        self._atualizar_matriz_pesos(v1, v2, infinito)
 
         return True
 
     def remover_vertice(self, id):
         """
         Info: Orquestra a remoção de um vértice do grafo junto com todas as arestas associadas,
-              atualizando todas as estruturas de dados internas.
+              atualizando todas as estruturas de dados internas. As arestas incidentes
+              são achadas pelas adjacências de saída e de entrada, e o vértice e as
+              arestas deixam lacunas em `vertices` e `arestas` (ver
+              `_compactar_vertices`). Assim o custo da remoção é proporcional ao
+              grau (mais o grau dos vizinhos, nas listas de adjacência), amortizado
+              o das compactações, e a ordem dos demais vértices e arestas é
+              preservada. As matrizes são reconstruídas sob demanda no próximo acesso.
         E: id (str/int) - Identificador único do vértice a ser removido.
         S: bool - True se o vértice foi removido, False caso contrário.
         """
@@ -167,21 +419,59 @@ class Grafo:
             print(f"Alerta: Vértice com ID '{id}' não encontrado para remoção.")
             return False
 
-        indice_na_lista = self.vertices.index(vertice_a_remover)
-        self.arestas = [a for a in self.arestas if vertice_a_remover not in (a.v1, a.v2)]
+        v = vertice_a_remover
+        for vizinho in self.pesos_adj[v]:
+            self._descartar_aresta(self.indice_arestas.pop(self._chave_aresta(v, vizinho)))
+        if self.direcionado:
+            for vizinho in self.adj_entrada[v]:
+                if vizinho is not v:
+                    self._descartar_aresta(self.indice_arestas.pop(self._chave_aresta(vizinho, v)))
+
+        self._remover_vertice_lista_adj(v)
 
-        self._remover_vertice_lista_adj(vertice_a_remover)
-        self._remover_vertice_matriz_adj(indice_na_lista)
-        self._remover_vertice_matriz_inc(indice_na_lista)
-        
         del self.indice_vertices[str(id)]
-        self.vertices.pop(indice_na_lista)
+        self._lista_vertices[v.indice] = None
+        insort(self._lacunas_vertices, v.indice)
+        if len(self._lacunas_vertices) > FRACAO_LACUNAS * len(self._lista_vertices):
+            self._compactar_vertices()
+        self._registrar_mutacao("remover_vertice", v.id)
+
+        self._invalidar_matrizes()
+        self._matriz_pesos = None
         
         return True
 
     # --------------------------------------------------------------------------
     # Métodos Auxiliares Internos
     # --------------------------------------------------------------------------
+    def _chave_aresta(self, v1, v2):
+        """
+        Info: Gera a chave da aresta no índice de arestas. Em grafos não direcionados
+              a chave independe da ordem dos vértices: o par é ordenado pela identidade
+              dos objetos, que não muda quando um vértice troca de posição.
+        E: v1 (Vertice), v2 (Vertice) - Os vértices terminais da aresta.
+        S: tuple - A chave usada em `indice_arestas`.
+        """
+        if self.direcionado or id(v1) <= id(v2):
+            return (v1, v2)
+        return (v2, v1)
+
+    def _novo_vertice(self, id):
+        """
+        Info: Cria um vértice na próxima posição e o registra no índice e na
+              lista de adjacência, sem tocar nas matrizes.
+        E: id (str/int) - Identificador do vértice, que ainda não pode existir.
+        S: Vertice - O vértice criado.
+        """
+        v = Vertice(id, len(self._lista_vertices))
+        self._lista_vertices.append(v)
+        self.indice_vertices[id] = v
+        self._grau_entrada.append(0)
+        self._grau_saida.append(0)
+        self._adicionar_vertice_lista_adj(v)
+        self._registrar_mutacao("adicionar_vertice", id)
+        return v
+
     def _adicionar_vertice_lista_adj(self, vertice):
         """
         Info: Inicializa a entrada para um novo vértice na lista de adjacência.
@@ -189,104 +479,206 @@ class Grafo:
         S: None
         """
         self.lista_adj[vertice] = []
+        self.pesos_adj[vertice] = {}
+        if self.direcionado:
+            self.adj_entrada[vertice] = {}
 
-    def _adicionar_vertice_matriz_adj(self):
+    def _adicionar_aresta_lista_adj(self, v1, v2, peso=None):
         """
-        Info: Expande a matriz de adjacência com uma nova linha e coluna de zeros.
-        E: None
+        Info: Adiciona a conexão entre dois vértices na lista de adjacência e no
+              mapa de pesos dos vizinhos.
+        E: v1 (Vertice), v2 (Vertice) - Os objetos dos vértices a serem conectados.
+           peso (número/None) - O peso da aresta.
         S: None
         """
-        for linha in self.matriz_adj:
-            linha.append(self.vazio)
-        nova_linha = [self.vazio] * len(self.vertices)
-        self.matriz_adj.append(nova_linha)
+        self.lista_adj[v1].append(v2)
+        self.pesos_adj[v1][v2] = peso
+        self._grau_saida[v1.indice] += 1
+        if self.direcionado:
+            self.adj_entrada[v2][v1] = peso
+            self._grau_entrada[v2.indice] += 1
+        else:
+            self.lista_adj[v2].append(v1)
+            self.pesos_adj[v2][v1] = peso
+            self._grau_saida[v2.indice] += 1
 
-    def _adicionar_vertice_matriz_inc(self):
+    def _atualizar_peso_adj(self, v1, v2, peso):
         """
-        Info: Adiciona uma nova linha de zeros à matriz de incidência para o novo vértice.
-        E: None
+        Info: Atualiza o peso de uma aresta existente no mapa de pesos dos vizinhos.
+        E: v1 (Vertice), v2 (Vertice), peso (número/None)
         S: None
         """
-        num_arestas_existentes = self.num_arestas()
-        nova_linha = [0] * num_arestas_existentes
-        self.matriz_incidencia.append(nova_linha)
+        self.pesos_adj[v1][v2] = peso
+        if self.direcionado:
+            self.adj_entrada[v2][v1] = peso
+        else:
+            self.pesos_adj[v2][v1] = peso
 
-    def _adicionar_aresta_lista_adj(self, v1, v2):
+    def _descartar_aresta(self, aresta):
         """
-        Info: Adiciona a conexão entre dois vértices na lista de adjacência.
-        E: v1 (Vertice), v2 (Vertice) - Os objetos dos vértices a serem conectados.
+        Info: Tira uma aresta de `arestas` em O(1) amortizado, deixando uma lacuna
+              na sua posição (ver `_compactar_arestas`), e desconta o grau das
+              pontas. Não mexe no índice de arestas nem nas adjacências.
+        E: aresta (Aresta) - A aresta a ser descartada.
         S: None
         """
-        self.lista_adj[v1].append(v2)
-        if not self.direcionado:
-            self.lista_adj[v2].append(v1)
+        self._lista_arestas[aresta.indice] = None
+        self._arestas_removidas += 1
 
-    def _adicionar_aresta_matriz_adj(self, v1, v2, w=None):
+        self._grau_saida[aresta.v1.indice] -= 1
+        if self.direcionado:
+            self._grau_entrada[aresta.v2.indice] -= 1
+        else:
+            self._grau_saida[aresta.v2.indice] -= 1
+
+        if self._arestas_removidas > FRACAO_LACUNAS * len(self._lista_arestas):
+            self._compactar_arestas()
+
+    def _compactar_vertices(self):
+        """
+        Info: Fecha as lacunas (None) deixadas pelas remoções em `vertices`,
+              mantendo a ordem dos vértices restantes, e renumera os `indice` e os
+              contadores de grau. É chamada quando a lista inteira é pedida ou
+              quando as lacunas passam de `FRACAO_LACUNAS` da lista; como cada
+              passada custa O(V) e só acontece depois de outras tantas remoções,
+              o custo por remoção é O(1) amortizado. Enquanto há lacunas, os
+              `indice` valem como posições na lista interna (e nos contadores de
+              grau), e `posicao_vertice` desconta delas as lacunas anteriores. As
+              listas são alteradas no lugar, para que referências a elas sigam válidas.
+        E: None
+        S: None
         """
-        Info: Adiciona ou ATUALIZA a conexão na matriz de adjacência,
-              garantindo que o MENOR peso seja armazenado.
-        E: v1 (Vertice), v2 (Vertice) - Os objetos dos vértices para encontrar seus índices.
+        vertices, grau_entrada, grau_saida = [], [], []
+        for v, entrada, saida in zip(self._lista_vertices, self._grau_entrada, self._grau_saida):
+            if v is not None:
+                v.indice = len(vertices)
+                vertices.append(v)
+                grau_entrada.append(entrada)
+                grau_saida.append(saida)
+        self._lista_vertices[:] = vertices
+        self._grau_entrada[:] = grau_entrada
+        self._grau_saida[:] = grau_saida
+        self._lacunas_vertices = []
+
+    def _compactar_arestas(self):
+        """
+        Info: Fecha as lacunas deixadas pelas remoções em `arestas` e renumera os
+              `indice`, nas mesmas condições de `_compactar_vertices`.
+        E: None
         S: None
         """
-        
-        peso = 1 if w is None else w
-        idx1 = self.vertices.index(v1)
-        idx2 = self.vertices.index(v2)
-        
-        peso_atual = self.matriz_adj[idx1][idx2]
-        
-        if peso_atual == self.vazio or peso < peso_atual:
-            self.matriz_adj[idx1][idx2] = peso
-            if not self.direcionado:
-                self.matriz_adj[idx2][idx1] = peso
+        arestas = [a for a in self._lista_arestas if a is not None]
+        for i, a in enumerate(arestas):
+            a.indice = i
+        self._lista_arestas[:] = arestas
+        self._arestas_removidas = 0
 
-    def _adicionar_aresta_matriz_inc(self, v1, v2):
+    def _remover_vertice_lista_adj(self, vertice):
         """
-        Info: Adiciona uma nova coluna à matriz de incidência para a nova aresta.
-        E: v1 (Vertice), v2 (Vertice) - Os vértices que a aresta conecta.
+        Info: Remove um vértice e todas as suas menções da lista de adjacência e
+              dos mapas de pesos, visitando apenas os vizinhos do vértice.
+        E: vertice (Vertice) - O objeto do vértice a ser removido.
         S: None
         """
-        idx1 = self.vertices.index(v1)
-        idx2 = self.vertices.index(v2)
-        for i, linha in enumerate(self.matriz_incidencia):
-            if self.direcionado:
-                if i == idx1: linha.append(1)   
-                elif i == idx2: linha.append(-1) 
-                else: linha.append(0)
-            else:
-                if i == idx1 or i == idx2: linha.append(1)
-                else: linha.append(0)
+        for vizinho in self.adj_entrada[vertice]:
+            if vizinho is not vertice:
+                self.lista_adj[vizinho].remove(vertice)
+                del self.pesos_adj[vizinho][vertice]
+        if self.direcionado:
+            for vizinho in self.pesos_adj[vertice]:
+                if vizinho is not vertice:
+                    del self.adj_entrada[vizinho][vertice]
+            del self.adj_entrada[vertice]
 
-    def _remover_vertice_lista_adj(self, vertice):
+        del self.lista_adj[vertice]
+        del self.pesos_adj[vertice]
+
+    def _registrar_mutacao(self, operacao, *dados):
         """
-        Info: Remove um vértice e todas as suas menções da lista de adjacência.
-        E: vertice (Vertice) - O objeto do vértice a ser removido.
+        Info: Avança a versão do grafo e, se o log estiver ativo, anota a mutação.
+        E: operacao (str) - "adicionar_vertice", "remover_vertice", "adicionar_aresta",
+           "remover_aresta" ou "atualizar_peso"; dados - IDs (e peso) envolvidos.
         S: None
         """
-        if vertice in self.lista_adj:
-            del self.lista_adj[vertice]
-        
-        for v_qualquer in self.lista_adj:
-            self.lista_adj[v_qualquer] = [v for v in self.lista_adj[v_qualquer] if v != vertice]
+        self.versao += 1
+        if self.log_mutacoes is not None:
+            self.log_mutacoes.append((self.versao, operacao, dados))
 
-    def _remover_vertice_matriz_adj(self, indice):
+    def _invalidar_matrizes(self):
         """
-        Info: Remove a linha e a coluna de um vértice da matriz de adjacência.
-        E: indice (int) - O índice do vértice a ser removido.
+        Info: Descarta as matrizes em cache após uma modificação no grafo. Elas
+              serão reconstruídas a partir das arestas no próximo acesso.
+        E: None
         S: None
         """
-        self.matriz_adj.pop(indice)
-        for linha in self.matriz_adj:
-            linha.pop(indice)
+        self._matriz_adj = None
+        self._matriz_incidencia = None
+
+    def _construir_matriz_adj(self):
+        """
+        Info: Constrói a matriz de adjacência a partir da lista de arestas,
+              guardando o peso da aresta (ou 1, se não ponderada).
+        E: None
+        S: list[list] - A matriz de adjacência.
+        """
+        n = len(self.vertices)
+        matriz = [[self.vazio] * n for _ in range(n)]
+        posicao = self.posicao_vertice
+        for aresta in self.arestas:
+            peso = 1 if aresta.peso is None else aresta.peso
+            idx1, idx2 = posicao(aresta.v1), posicao(aresta.v2)
+            matriz[idx1][idx2] = peso
+            if not self.direcionado:
+                matriz[idx2][idx1] = peso
+        return matriz
+
+    def _construir_matriz_pesos(self):
+        """
+        Info: Constrói a matriz densa de pesos (NumPy) a partir da lista de arestas.
+              Arestas sem peso valem 1 e pares sem aresta valem `inf`.
+        E: None
+        S: numpy.ndarray - A matriz de pesos, com tipo `dtype_pesos`.
+        """
+        n = len(self.vertices)
+        m = len(self.arestas)
+        matriz = np.full((n, n), np.inf, dtype=self.dtype_pesos)
+        posicao = self.posicao_vertice
+        origem = np.fromiter((posicao(a.v1) for a in self.arestas), dtype=np.intp, count=m)
+        destino = np.fromiter((posicao(a.v2) for a in self.arestas), dtype=np.intp, count=m)
+        pesos = np.fromiter((1.0 if a.peso is None else float(a.peso) / self.escala_pesos for a in self.arestas),
+                            dtype=np.float64, count=m)
+        matriz[origem, destino] = pesos
+        if not self.direcionado:
+            matriz[destino, origem] = pesos
+        return matriz
 
-    def _remover_vertice_matriz_inc(self, indice_vertice):
+    def _atualizar_matriz_pesos(self, v1, v2, peso):
         """
-        Info: Remove a linha do vértice e as colunas das arestas associadas.
-        E: indice_vertice (int)
+        Info: Atualiza no lugar a célula de uma aresta na matriz densa de pesos,
+              caso ela já tenha sido construída.
+        E: v1 (Vertice), v2 (Vertice), peso (número/None) - `inf` remove a aresta.
         S: None
         """
-        self.matriz_incidencia.pop(indice_vertice)
-        self.sincronizar_matriz_inc_pelas_arestas()
+        if self._matriz_pesos is None:
+            return
+        peso = 1.0 if peso is None else float(peso) / self.escala_pesos
+        self._matriz_pesos[v1.indice, v2.indice] = peso
+        if not self.direcionado:
+            self._matriz_pesos[v2.indice, v1.indice] = peso
+
+    def _construir_matriz_inc(self):
+        """
+        Info: Constrói a matriz de incidência a partir da lista de arestas,
+              usando a posição (`posicao_vertice`) de cada vértice como linha.
+        E: None
+        S: list[list] - A matriz de incidência.
+        """
+        matriz = [[0] * len(self.arestas) for _ in self.vertices]
+        posicao = self.posicao_vertice
+        for j, aresta in enumerate(self.arestas):
+            matriz[posicao(aresta.v2)][j] = -1 if self.direcionado else 1
+            matriz[posicao(aresta.v1)][j] = 1
+        return matriz
 
     # --------------------------------------------------------------------------
     # Consultas e Propriedades
@@ -298,7 +690,7 @@ class Grafo:
         E: None.
         S: int - O número total de vértices.
         """
-        return len(self.vertices)
+        return len(self._lista_vertices) - len(self._lacunas_vertices)
 
     def num_arestas(self):
         """
@@ -307,7 +699,7 @@ class Grafo:
         E: None.
         S: int - O número total de arestas.
         """
-        return len(self.arestas)
+        return len(self._lista_arestas) - self._arestas_removidas
 
     def get_grau(self, vertice_id):
         """
@@ -321,15 +713,69 @@ class Grafo:
         if not vertice_obj:
             return None
 
+        i = self._posicao_interna(vertice_obj)
         if not self.direcionado:
-            return len(self.lista_adj.get(vertice_obj, []))
+            return self._grau_saida[i]
         else:
-            grau_saida = len(self.lista_adj.get(vertice_obj, []))
-            grau_entrada = 0
-            for vizinhos in self.lista_adj.values():
-                if vertice_obj in vizinhos:
-                    grau_entrada += 1
-            return (grau_entrada, grau_saida)
+            return (self._grau_entrada[i], self._grau_saida[i])
+
+    def graus(self):
+        """
+        Info: Retorna os graus de todos os vértices de uma vez, na ordem de
+              `vertices` (posição `indice`), a partir dos contadores mantidos
+              pelas operações de inclusão e remoção.
+        E: None.
+        S: numpy.ndarray ou (numpy.ndarray, numpy.ndarray) - O grau total, ou para
+           dígrafos a tupla (graus de entrada, graus de saída). Sem numpy, listas.
+        """
+        if self._lacunas_vertices:
+            self._compactar_vertices()
+        if HAS_NUMPY:
+            saida = np.array(self._grau_saida, dtype=np.int64)
+            if not self.direcionado:
+                return saida
+            return np.array(self._grau_entrada, dtype=np.int64), saida
+        if not self.direcionado:
+            return list(self._grau_saida)
+        return list(self._grau_entrada), list(self._grau_saida)
+
+    def posicao_vertice(self, vertice):
+        """
+        Info: Posição do vértice em `vertices`, isto é, sua linha nas matrizes e
+              nos arrays de `graus()`. No Grafo é o `indice` menos as lacunas
+              anteriores a ele (ver `_compactar_vertices`), achadas por busca
+              binária; as visões (ver `graph_view`) podem renumerar os vértices
+              que selecionam.
+        E: vertice (Vertice)
+        S: int
+        """
+        lacunas = self._lacunas_vertices
+        if not lacunas:
+            return vertice.indice
+        return vertice.indice - bisect_left(lacunas, vertice.indice)
+
+    def _posicao_interna(self, vertice):
+        """
+        Info: Posição do vértice nas listas internas e nos contadores de grau,
+              contando as lacunas ainda não compactadas (o próprio `indice`).
+        E: vertice (Vertice)
+        S: int
+        """
+        return vertice.indice
+
+    def posicao(self, vertice_id):
+        """
+        Info: Traduz o ID externo de um vértice para sua posição inteira (mesmo
+              contrato de `GrafoCSR.posicao`). Os algoritmos devem fazer essa
+              tradução uma vez, na entrada, trabalhar com posições em listas ou
+              arrays e voltar aos IDs (`vertices[i].id`) só no resultado.
+        E: vertice_id (str/int)
+        S: int ou None - A posição, ou None se o vértice não existir.
+        """
+        vertice_obj = self.indice_vertices.get(str(vertice_id))
+        if vertice_obj is None:
+            return None
+        return self.posicao_vertice(vertice_obj)
     
     def get_aresta(self, v1_id, v2_id):
         """
@@ -338,22 +784,12 @@ class Grafo:
             sendo buscada
         S: aresta (Aresta) ou None
         """
+        v1 = self.indice_vertices.get(str(v1_id))
+        v2 = self.indice_vertices.get(str(v2_id))
+        if not v1 or not v2:
+            return None
 
-        s1 = str(v1_id)
-        s2 = str(v2_id)
-
-        for a in self.arestas:
-            a1 = str(a.v1.id)
-            a2 = str(a.v2.id)
-
-            if not self.direcionado:
-                if (a1 == s1 and a2 == s2) or (a1 == s2 and a2 == s1):
-                    return a
-            else:
-                if a1 == s1 and a2 == s2:
-                    return a
-
-        return None
+        return self.indice_arestas.get(self._chave_aresta(v1, v2))
     
     def get_vizinhos(self, vertice_id):
         """
@@ -365,25 +801,104 @@ class Grafo:
         if not vertice_obj:
             return {}
 
-        vizinhos = {}
-        for vizinho in self.lista_adj.get(vertice_obj, []):
-            aresta = self.get_aresta(vertice_obj.id, vizinho.id)
-            peso = aresta.peso if aresta and aresta.peso is not None else 1
-            vizinhos[vizinho.id] = peso
+        return {vizinho.id: 1 if peso is None else peso
+                for vizinho, peso in self.pesos_adj[vertice_obj].items()}
 
-        return vizinhos
+    def iter_vizinhos(self, vertice_id):
+        """
+        Info: Percorre os vizinhos (de saída) de um vértice junto com o peso de
+              cada aresta, sem montar estruturas intermediárias. Custo linear no grau.
+        E: vertice_id (str/int) - O ID do vértice.
+        S: ItemsView - Pares (Vertice, peso); o peso é None em arestas sem peso.
+        """
+        vertice_obj = self.indice_vertices.get(str(vertice_id))
+        if not vertice_obj:
+            return {}.items()
+        return self.pesos_adj[vertice_obj].items()
     
     def get_peso(self, v1_id, v2_id):
         """
         Info: Retorna o peso da aresta entre dois vértices, ou infinito se não houver conexão.
+              No modo "decimal" o peso é normalizado para Decimal; nos demais modos
+              é devolvido como está, para aritmética nativa.
         E: v1_id, v2_id (str/int): Id's dos vértices terminais da aresta 
             sendo buscada
-        S: peso (float) ou infinito
+        S: peso (Decimal, float ou int, conforme `modo_pesos`) ou infinito
         """
-        aresta = self.get_aresta(v1_id, v2_id)
-        if aresta and aresta.peso is not None:
-            return get_decimal(aresta.peso)
-        else:
-            return Decimal('Infinity')
+        v1 = self.indice_vertices.get(str(v1_id))
+        v2 = self.indice_vertices.get(str(v2_id))
+        peso = self.pesos_adj[v1].get(v2) if v1 and v2 else None
+        if self.modo_pesos == "decimal":
+            return get_decimal(peso) if peso is not None else Decimal('Infinity')
+        return peso if peso is not None else infinito
 
-    
+    def formatar_peso(self, valor):
+        """
+        Info: Formata um peso (ou soma de pesos) deste grafo com duas casas decimais,
+              desfazendo a escala do modo "inteiro". Usado apenas na saída.
+        E: valor (número)
+        S: str
+        """
+        return formatar_peso(valor, self.modo_pesos)
+
+    def peso_real(self, valor):
+        """
+        Info: Converte um peso (ou soma de pesos) deste grafo para seu valor real,
+              desfazendo a escala do modo "inteiro"; nos demais modos não altera nada.
+              Quem chama decide quando o valor sai do domínio em ponto fixo: custos
+              já reais (calculados sobre `matriz_pesos`) não devem passar por aqui.
+        E: valor (número) - Na representação nativa do `modo_pesos`.
+        S: número
+        """
+        return peso_real(valor, self.modo_pesos)
+
+    # --------------------------------------------------------------------------
+    # Versão, Log de Mutações e Resultados Derivados
+    # --------------------------------------------------------------------------
+    def ativar_log_mutacoes(self, tamanho_maximo=1024):
+        """
+        Info: Passa a anotar as mutações do grafo num log limitado (as mais antigas
+              são descartadas), permitindo que algoritmos incrementais repliquem
+              apenas as mudanças desde uma versão conhecida.
+        E: tamanho_maximo (int) - Número máximo de mutações guardadas.
+        S: None
+        """
+        self.log_mutacoes = collections.deque(maxlen=tamanho_maximo)
+
+    def mutacoes_desde(self, versao):
+        """
+        Info: Lista as mutações posteriores a `versao`, na ordem em que ocorreram.
+        E: versao (int) - Uma versão observada anteriormente em `self.versao`.
+        S: list[(int, str, tuple)] ou None - Entradas (versão, operação, dados), ou
+           None se o log estiver desativado ou já tiver descartado alguma delas.
+        """
+        if versao == self.versao:
+            return []
+        if self.log_mutacoes is None or not self.log_mutacoes or self.log_mutacoes[0][0] > versao + 1:
+            return None
+        return [entrada for entrada in self.log_mutacoes if entrada[0] > versao]
+
+    def resultado_derivado(self, chave, calcular):
+        """
+        Info: Cache de resultados derivados do grafo (AGM, caminhos mínimos...). O
+              resultado guardado sob `chave` é reaproveitado enquanto a versão do
+              grafo não mudar; caso contrário, `calcular()` é chamado de novo.
+              O resultado é compartilhado: quem o recebe não deve modificá-lo.
+        E: chave (hashable), calcular (callable sem argumentos)
+        S: O resultado de `calcular()`.
+        """
+        versao, resultado = self._derivados.get(chave, (None, None))
+        if versao != self.versao:
+            resultado = calcular()
+            self._derivados[chave] = (self.versao, resultado)
+        return resultado
+
+    def congelar(self):
+        """
+        Info: Cria um instantâneo imutável do grafo no formato CSR, aceito
+              diretamente por BFS, DFS, Dijkstra, Bellman-Ford, Prim e lowpt.
+              Modificações posteriores no grafo não afetam o instantâneo.
+        E: None
+        S: GrafoCSR - O instantâneo do grafo.
+        """
+        return GrafoCSR(self)
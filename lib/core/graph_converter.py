@@ -5,6 +5,7 @@ Descriçao: Contém funções para converter e sincronizar as diferentes
 """
 import collections
 from lib.core.graph import Grafo, Aresta
+from lib.core.graph_view import VisaoSubjacente
 from math import inf as infinito
 
 def matriz_adj_para_lista_adj(grafo: Grafo):
@@ -34,10 +35,9 @@ def lista_adj_para_matriz_adj(grafo: Grafo):
     n = grafo.num_vertices()
     grafo.matriz_adj = [[grafo.vazio] * n for _ in range(n)]
     for vertice, vizinhos in grafo.lista_adj.items():
-        i = grafo.vertices.index(vertice)
+        i = grafo.posicao_vertice(vertice)
         for vizinho in vizinhos:
-            j = grafo.vertices.index(vizinho)
-            grafo.matriz_adj[i][j] = 1
+            grafo.matriz_adj[i][grafo.posicao_vertice(vizinho)] = 1
 
 def arestas_para_matriz_inc(grafo: Grafo):
     """
@@ -51,8 +51,8 @@ def arestas_para_matriz_inc(grafo: Grafo):
     grafo.matriz_incidencia = [[0] * num_a for _ in range(num_v)]
 
     for indice_aresta, aresta in enumerate(grafo.arestas):
-        idx1 = grafo.vertices.index(aresta.v1)
-        idx2 = grafo.vertices.index(aresta.v2)
+        idx1 = grafo.posicao_vertice(aresta.v1)
+        idx2 = grafo.posicao_vertice(aresta.v2)
         if grafo.direcionado:
             grafo.matriz_incidencia[idx1][indice_aresta] = 1
             grafo.matriz_incidencia[idx2][indice_aresta] = -1
@@ -87,37 +87,24 @@ def matriz_inc_para_arestas(grafo: Grafo):
                 pontas.append(grafo.vertices[i])
         
         if grafo.direcionado:
-            if origem and destino: novas_arestas.append(Aresta(origem, destino))
+            if origem and destino: novas_arestas.append(Aresta(origem, destino, indice=len(novas_arestas)))
         elif len(pontas) == 2:
-            novas_arestas.append(Aresta(pontas[0], pontas[1]))
+            novas_arestas.append(Aresta(pontas[0], pontas[1], indice=len(novas_arestas)))
     
     grafo.arestas = novas_arestas
 
 def get_grafo_subjacente(digrafo: Grafo) -> Grafo:
     """
-    Cria um grafo não-direcionado (subjacente) a partir de um dígrafo.
+    Retorna o grafo não-direcionado (subjacente) de um dígrafo.
     
     A aresta entre u e v no grafo subjacente terá o *menor* peso
     encontrado entre (u, v) e (v, u) no dígrafo.
+    O resultado é uma visão somente leitura (VisaoSubjacente), que
+    reaproveita os vértices e arcos do dígrafo em vez de copiá-los. A
+    visão fica no cache de derivados do dígrafo, de modo que chamadas
+    seguidas (e os resultados que ela mesma guarda) são reaproveitadas.
     """
     if not digrafo.direcionado:
         return digrafo 
     
-    subjacente = Grafo(direcionado=False, nome_arquivo=f"{digrafo.nome_arquivo} (subjacente)")
-    
-    for vertice in digrafo.vertices:
-        subjacente.adicionar_vertice(vertice.id)
-        
-    pesos_minimos = {}
-    for aresta in digrafo.arestas:
-        v1_id = aresta.v1.id
-        v2_id = aresta.v2.id
-        peso = aresta.peso
-        par = frozenset([v1_id, v2_id])
-        if par not in pesos_minimos or peso < pesos_minimos[par]:
-            pesos_minimos[par] = peso
-    
-    for par, peso in pesos_minimos.items():
-        v1_id, v2_id = tuple(par)
-        subjacente.adicionar_aresta(v1_id, v2_id, peso)
-    return subjacente
+    return digrafo.resultado_derivado("subjacente", lambda: VisaoSubjacente(digrafo))
@@ -0,0 +1,205 @@
+"""
+Módulo:    Grafo CSR
+Descriçao: Define um instantâneo imutável de um Grafo no formato CSR
+           (compressed sparse row), voltado a algoritmos de leitura intensiva.
+           Os vizinhos de cada vértice ficam contíguos em arrays NumPy, o que
+           permite percorrê-los sem alocações e repassá-los a kernels Numba.
+
+Classes:   - GrafoCSR: Instantâneo somente leitura de um Grafo.
+"""
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+class GrafoCSR:
+    def __init__(self, grafo):
+        """
+        Info: Congela o estado atual de um Grafo em arrays CSR. Os vizinhos do
+              vértice de posição `i` são `indices[indptr[i]:indptr[i+1]]`, com os
+              pesos correspondentes em `pesos`, na mesma ordem da lista de
+              adjacência do grafo. Para dígrafos também é montado o CSR reverso
+              (arestas de entrada); em grafos não direcionados ele é o próprio CSR.
+              `ids_arestas` guarda, para cada posição do CSR, a posição da aresta
+              correspondente em `grafo.arestas` (o `Aresta.indice`, num Grafo). Os pesos são
+              sempre float com o valor real, qualquer que seja o `modo_pesos`.
+        E: grafo (Grafo/VisaoGrafo) - O grafo (ou a visão) a ser congelado.
+        S: None
+        """
+        if not HAS_NUMPY:
+            raise ImportError("O instantâneo CSR requer o pacote numpy.")
+
+        m = len(grafo.arestas)
+        posicao = grafo.posicao_vertice
+        origem = np.fromiter((posicao(a.v1) for a in grafo.arestas), dtype=np.int64, count=m)
+        destino = np.fromiter((posicao(a.v2) for a in grafo.arestas), dtype=np.int64, count=m)
+        pesos = np.fromiter((1.0 if a.peso is None else float(a.peso) / grafo.escala_pesos for a in grafo.arestas),
+                            dtype=np.float64, count=m)
+        self._montar(grafo.vertices, origem, destino, pesos, grafo.direcionado, grafo.ponderado,
+                     grafo.nome_arquivo, all(a.peso is not None for a in grafo.arestas))
+
+    @classmethod
+    def de_arrays(cls, vertices, origem, destino, pesos, direcionado=False, ponderado=False, nome_arquivo=""):
+        """
+        Info: Monta o instantâneo diretamente de arrays de arestas, sem passar por
+              um Grafo (por exemplo, a partir do cache binário em disco). A aresta
+              `k` vai de `vertices[origem[k]]` a `vertices[destino[k]]`.
+        E: vertices (sequência de Vertice), origem, destino (array de int),
+           pesos (array de float, NaN para aresta sem peso), direcionado (bool),
+           ponderado (bool), nome_arquivo (str)
+        S: GrafoCSR
+        """
+        if not HAS_NUMPY:
+            raise ImportError("O instantâneo CSR requer o pacote numpy.")
+
+        pesos = np.asarray(pesos, dtype=np.float64)
+        sem_peso = np.isnan(pesos)
+        csr = cls.__new__(cls)
+        csr._montar(vertices, np.asarray(origem, dtype=np.int64), np.asarray(destino, dtype=np.int64),
+                    np.where(sem_peso, 1.0, pesos), direcionado, ponderado, nome_arquivo, not sem_peso.any())
+        return csr
+
+    def _montar(self, vertices, origem, destino, pesos, direcionado, ponderado, nome_arquivo, arestas_ponderadas):
+        """
+        Info: Preenche o instantâneo a partir dos arrays (origem, destino, peso) das arestas.
+        S: None
+        """
+        self.direcionado = direcionado
+        self.ponderado = ponderado
+        self.nome_arquivo = nome_arquivo
+        self.vertices = tuple(vertices)
+        self.ids = tuple(str(v.id) for v in self.vertices)
+        self.posicoes = {id_v: i for i, id_v in enumerate(self.ids)}
+        self.arestas_ponderadas = arestas_ponderadas
+
+        n = len(self.vertices)
+        m = len(origem)
+        self._num_arestas = m
+        ids_arestas = np.arange(m, dtype=np.int64)
+
+        if not self.direcionado:
+            # Cada aresta entra nos dois sentidos, intercalada para preservar a
+            # ordem da lista de adjacência.
+            origem, destino = (np.column_stack((origem, destino)).ravel(),
+                               np.column_stack((destino, origem)).ravel())
+            pesos = np.repeat(pesos, 2)
+            ids_arestas = np.repeat(ids_arestas, 2)
+
+        self.indptr, self.indices, self.pesos, self.ids_arestas = _montar_csr(n, origem, destino, pesos, ids_arestas)
+        if self.direcionado:
+            (self.indptr_reverso, self.indices_reverso,
+             self.pesos_reverso, self.ids_arestas_reverso) = _montar_csr(n, destino, origem, pesos, ids_arestas)
+        else:
+            self.indptr_reverso, self.indices_reverso = self.indptr, self.indices
+            self.pesos_reverso, self.ids_arestas_reverso = self.pesos, self.ids_arestas
+
+        self._listas = {}
+        self._ordem_ids = None
+        self._derivados = {}
+
+    # --------------------------------------------------------------------------
+    # Consultas
+    # --------------------------------------------------------------------------
+    def num_vertices(self):
+        """
+        Info: Retorna o número de vértices do instantâneo.
+        S: int
+        """
+        return len(self.vertices)
+
+    def num_arestas(self):
+        """
+        Info: Retorna o número de arestas do grafo original no momento do congelamento.
+        S: int
+        """
+        return self._num_arestas
+
+    def posicao(self, vertice_id):
+        """
+        Info: Traduz o ID de um vértice para sua posição no instantâneo.
+        E: vertice_id (str/int)
+        S: int ou None - A posição, ou None se o vértice não existir.
+        """
+        return self.posicoes.get(str(vertice_id))
+
+    def vizinhos(self, i, reverso=False):
+        """
+        Info: Retorna, sem cópia, as posições dos vizinhos de saída (ou de entrada,
+              se `reverso`) do vértice de posição `i`.
+        E: i (int), reverso (bool)
+        S: numpy.ndarray
+        """
+        if reverso:
+            return self.indices_reverso[self.indptr_reverso[i]:self.indptr_reverso[i + 1]]
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def pesos_vizinhos(self, i, reverso=False):
+        """
+        Info: Retorna, sem cópia, os pesos das arestas correspondentes a `vizinhos(i)`.
+        E: i (int), reverso (bool)
+        S: numpy.ndarray
+        """
+        if reverso:
+            return self.pesos_reverso[self.indptr_reverso[i]:self.indptr_reverso[i + 1]]
+        return self.pesos[self.indptr[i]:self.indptr[i + 1]]
+
+    def como_listas(self, reverso=False):
+        """
+        Info: Versão em listas Python dos arrays CSR, para os laços em Python puro
+              (indexar listas é mais rápido que indexar arrays NumPy elemento a
+              elemento). É calculada uma única vez por instantâneo.
+        E: reverso (bool) - Se True, retorna o CSR das arestas de entrada.
+        S: (list, list, list) - indptr, indices e pesos.
+        """
+        if reverso and not self.direcionado:
+            reverso = False
+        if reverso not in self._listas:
+            if reverso:
+                arrays = (self.indptr_reverso, self.indices_reverso, self.pesos_reverso)
+            else:
+                arrays = (self.indptr, self.indices, self.pesos)
+            self._listas[reverso] = tuple(a.tolist() for a in arrays)
+        return self._listas[reverso]
+
+    def resultado_derivado(self, chave, calcular):
+        """
+        Info: Mesmo contrato de `Grafo.resultado_derivado`. Como o instantâneo é
+              imutável, o resultado calculado uma vez nunca fica obsoleto.
+        E: chave (hashable), calcular (callable sem argumentos)
+        S: O resultado de `calcular()`.
+        """
+        if chave not in self._derivados:
+            self._derivados[chave] = calcular()
+        return self._derivados[chave]
+
+    def ordem_ids(self):
+        """
+        Info: Posto de cada vértice na ordenação textual dos IDs, usado para
+              visitar vizinhos na mesma ordem das buscas sobre o Grafo.
+        S: list[int] - `ordem[i]` é o posto do vértice de posição `i`.
+        """
+        if self._ordem_ids is None:
+            ordem = [0] * len(self.ids)
+            for posto, i in enumerate(sorted(range(len(self.ids)), key=self.ids.__getitem__)):
+                ordem[i] = posto
+            self._ordem_ids = ordem
+        return self._ordem_ids
+
+def _montar_csr(n, origem, destino, pesos, ids_arestas):
+    """
+    Info: Agrupa arcos (origem, destino, peso) por origem em arrays CSR somente
+          leitura, mantendo a ordem relativa dos arcos de uma mesma origem.
+    E: n (int), origem, destino (numpy.ndarray[int]), pesos (numpy.ndarray[float]),
+       ids_arestas (numpy.ndarray[int])
+    S: (numpy.ndarray, ...) - indptr, indices, pesos e ids_arestas.
+    """
+    ordem = np.argsort(origem, kind="stable")
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(origem, minlength=n), out=indptr[1:])
+    indices = destino[ordem].astype(np.int32)
+    pesos = np.ascontiguousarray(pesos[ordem])
+    ids_arestas = ids_arestas[ordem].astype(np.int32)
+    for array in (indptr, indices, pesos, ids_arestas):
+        array.flags.writeable = False
+    return indptr, indices, pesos, ids_arestas
@@ -0,0 +1,347 @@
+"""
+Módulo:    Visões de Grafo
+Descriçao: Define visões somente leitura sobre um Grafo: o grafo subjacente de
+           um dígrafo, o subgrafo induzido por um conjunto de vértices e o
+           subgrafo formado por um subconjunto de arestas. As visões reaproveitam
+           os objetos Vertice e Aresta do grafo de origem (nada é copiado) e
+           expõem a mesma interface de consulta do Grafo, de modo que algoritmos,
+           relatórios e renderizações as aceitam no lugar de um grafo comum.
+           Quem precisar modificar o resultado (incluir ou remover vértices e
+           arestas, ou atribuir as matrizes) deve trabalhar sobre `materializar()`.
+
+Classes:   - VisaoGrafo: Base abstrata das visões; bloqueia as operações de
+             modificação e permite copiar a visão num Grafo comum (`materializar`).
+           - VisaoSubjacente: Grafo não direcionado subjacente a um dígrafo.
+           - VisaoInduzida: Subgrafo induzido por um conjunto de vértices.
+           - VisaoArestas: Subgrafo gerador formado por algumas arestas.
+"""
+import collections
+from abc import ABC, abstractmethod
+from lib.core.graph import Grafo
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+class VisaoGrafo(Grafo, ABC):
+    def __init__(self, base, direcionado=None, nome_arquivo=None):
+        """
+        Info: Base das visões. As estruturas de consulta (índices, listas de
+              adjacência, graus e matrizes) são montadas sob demanda, apenas
+              com referências aos objetos da `base`, e refeitas quando a versão
+              da base muda; a visão acompanha, portanto, as modificações feitas
+              no grafo de origem. `Aresta.indice` continua sendo a posição da
+              aresta no grafo de origem, não na visão.
+        E: base (Grafo/VisaoGrafo) - O grafo observado.
+           direcionado (bool, opcional) - Padrão: o da base.
+           nome_arquivo (str, opcional) - Padrão: o da base.
+        S: None
+        """
+        self.base = base
+        self.direcionado = base.direcionado if direcionado is None else direcionado
+        self.ponderado = base.ponderado
+        self.nome_arquivo = base.nome_arquivo if nome_arquivo is None else nome_arquivo
+        self.vazio = base.vazio
+        self.dtype_pesos = base.dtype_pesos
+        self.modo_pesos = base.modo_pesos
+        self.escala_pesos = base.escala_pesos
+        self.log_mutacoes = None
+        self._derivados = {}
+        self._versao_base = None
+
+    # --------------------------------------------------------------------------
+    # Seleção (implementada pelas subclasses)
+    # --------------------------------------------------------------------------
+    @abstractmethod
+    def _selecionar(self):
+        """
+        Info: Escolhe os vértices e as arestas da visão a partir do estado atual da base.
+        E: None
+        S: (list[Vertice], list[Aresta], dict ou None) - Vértices, arestas e, se a
+           visão renumera os vértices, o mapa Vertice -> posição.
+        """
+
+    def _posicoes_base(self):
+        """
+        Info: Mapa de posições da base, para visões que mantêm todos os vértices dela.
+        S: dict ou None - None quando as posições são os próprios `indice`.
+        """
+        if isinstance(self.base, VisaoGrafo):
+            self.base._sincronizar()
+            return self.base._posicoes
+        return None
+
+    def _sincronizar(self):
+        """
+        Info: Refaz a seleção se a base mudou desde a última consulta e descarta
+              as estruturas montadas a partir dela.
+        E: None
+        S: None
+        """
+        if self._versao_base == self.base.versao:
+            return
+        self._vertices, self._arestas, self._posicoes = self._selecionar()
+        self._versao_base = self.base.versao
+        self._indice_vertices = None
+        self._indice_arestas = None
+        self._adjacencias = None
+        self._matriz_adj = None
+        self._matriz_incidencia = None
+        self._matriz_pesos = None
+
+    # --------------------------------------------------------------------------
+    # Estruturas de consulta (montadas sob demanda)
+    # --------------------------------------------------------------------------
+    @property
+    def versao(self):
+        return self.base.versao
+
+    @property
+    def vertices(self):
+        self._sincronizar()
+        return self._vertices
+
+    @property
+    def arestas(self):
+        self._sincronizar()
+        return self._arestas
+
+    @property
+    def indice_vertices(self):
+        self._sincronizar()
+        if self._indice_vertices is None:
+            self._indice_vertices = {v.id: v for v in self._vertices}
+        return self._indice_vertices
+
+    @property
+    def indice_arestas(self):
+        self._sincronizar()
+        if self._indice_arestas is None:
+            self._indice_arestas = {self._chave_aresta(a.v1, a.v2): a for a in self._arestas}
+        return self._indice_arestas
+
+    @property
+    def lista_adj(self):
+        return self._montar_adjacencias()[0]
+
+    @property
+    def pesos_adj(self):
+        return self._montar_adjacencias()[1]
+
+    @property
+    def adj_entrada(self):
+        return self._montar_adjacencias()[2]
+
+    @property
+    def _grau_entrada(self):
+        return self._montar_adjacencias()[3]
+
+    @property
+    def _grau_saida(self):
+        return self._montar_adjacencias()[4]
+
+    def _montar_adjacencias(self):
+        """
+        Info: Monta, uma vez por versão da base, a lista de adjacência, os mapas de
+              pesos (de saída e de entrada) e os contadores de grau da visão, com a
+              mesma semântica que o Grafo mantém incrementalmente.
+        E: None
+        S: tuple - (lista_adj, pesos_adj, adj_entrada, graus de entrada, graus de saída).
+        """
+        self._sincronizar()
+        if self._adjacencias is not None:
+            return self._adjacencias
+
+        lista_adj = collections.defaultdict(list)
+        pesos_adj = collections.defaultdict(dict)
+        adj_entrada = collections.defaultdict(dict) if self.direcionado else pesos_adj
+        for v in self._vertices:
+            lista_adj[v] = []
+            pesos_adj[v] = {}
+            if self.direcionado:
+                adj_entrada[v] = {}
+
+        grau_entrada = [0] * len(self._vertices)
+        grau_saida = [0] * len(self._vertices)
+        posicao = self.posicao_vertice
+        for aresta in self._arestas:
+            v1, v2, peso = aresta.v1, aresta.v2, aresta.peso
+            lista_adj[v1].append(v2)
+            pesos_adj[v1][v2] = peso
+            grau_saida[posicao(v1)] += 1
+            if self.direcionado:
+                adj_entrada[v2][v1] = peso
+                grau_entrada[posicao(v2)] += 1
+            else:
+                lista_adj[v2].append(v1)
+                pesos_adj[v2][v1] = peso
+                grau_saida[posicao(v2)] += 1
+
+        self._adjacencias = (lista_adj, pesos_adj, adj_entrada, grau_entrada, grau_saida)
+        return self._adjacencias
+
+    @property
+    def matriz_adj(self):
+        self._sincronizar()
+        return Grafo.matriz_adj.fget(self)
+
+    @matriz_adj.setter
+    def matriz_adj(self, matriz):
+        self._somente_leitura()
+
+    @property
+    def matriz_incidencia(self):
+        self._sincronizar()
+        return Grafo.matriz_incidencia.fget(self)
+
+    @matriz_incidencia.setter
+    def matriz_incidencia(self, matriz):
+        self._somente_leitura()
+
+    @property
+    def matriz_pesos(self):
+        self._sincronizar()
+        return Grafo.matriz_pesos.fget(self)
+
+    def posicao_vertice(self, vertice):
+        """
+        Info: Posição do vértice em `vertices` da visão (ver `Grafo.posicao_vertice`).
+        E: vertice (Vertice)
+        S: int
+        """
+        if self._posicoes is None:
+            return vertice.indice
+        return self._posicoes[vertice]
+
+    # Os contadores de grau da visão já são indexados pela posição na visão.
+    _posicao_interna = posicao_vertice
+
+    def num_vertices(self):
+        return len(self.vertices)
+
+    def num_arestas(self):
+        return len(self.arestas)
+
+    # --------------------------------------------------------------------------
+    # Modificações (não suportadas)
+    # --------------------------------------------------------------------------
+    def materializar(self, nome_arquivo=None):
+        """
+        Info: Copia o estado atual da visão num Grafo comum, independente da base,
+              com os vértices e as arestas na ordem da visão e os mesmos pesos,
+              orientação e `modo_pesos`. Os objetos Vertice e Aresta são novos:
+              modificar a cópia não afeta a base, e vice-versa.
+        E: nome_arquivo (str, opcional) - Padrão: o da visão.
+        S: Grafo - A cópia modificável.
+        """
+        return Grafo.de_arestas(((a.v1.id, a.v2.id, a.peso) for a in self.arestas),
+                                vertices=[v.id for v in self.vertices], direcionado=self.direcionado,
+                                nome_arquivo=self.nome_arquivo if nome_arquivo is None else nome_arquivo,
+                                ponderado=self.ponderado, dtype_pesos=self.dtype_pesos, modo_pesos=self.modo_pesos)
+
+    def _somente_leitura(self, *args, **kwargs):
+        raise TypeError("Visões de grafo são somente leitura; modifique o grafo de origem "
+                        "ou uma cópia obtida com `materializar()`.")
+
+    adicionar_vertice = _somente_leitura
+    adicionar_vertices = _somente_leitura
+    adicionar_aresta = _somente_leitura
+    adicionar_arestas = _somente_leitura
+    remover_aresta = _somente_leitura
+    remover_vertice = _somente_leitura
+    ativar_log_mutacoes = _somente_leitura
+
+
+class VisaoSubjacente(VisaoGrafo):
+    def __init__(self, digrafo, nome_arquivo=None):
+        """
+        Info: Grafo não direcionado subjacente a um dígrafo. Os arcos (u, v) e
+              (v, u) viram uma única aresta, representada pelo arco de *menor*
+              peso (ou o primeiro encontrado, se algum não tiver peso), na ordem
+              em que o par aparece pela primeira vez no dígrafo.
+        E: digrafo (Grafo), nome_arquivo (str, opcional)
+        S: None
+        """
+        if nome_arquivo is None:
+            nome_arquivo = f"{digrafo.nome_arquivo} (subjacente)"
+        super().__init__(digrafo, direcionado=False, nome_arquivo=nome_arquivo)
+
+    def _selecionar(self):
+        representantes = {}
+        for aresta in self.base.arestas:
+            chave = self._chave_aresta(aresta.v1, aresta.v2)
+            atual = representantes.get(chave)
+            if atual is None:
+                representantes[chave] = aresta
+            elif aresta.peso is not None and atual.peso is not None and aresta.peso < atual.peso:
+                representantes[chave] = aresta
+        self._indice_representantes = representantes
+        return self.base.vertices, list(representantes.values()), self._posicoes_base()
+
+    @property
+    def indice_arestas(self):
+        # O índice já sai pronto da seleção dos representantes.
+        self._sincronizar()
+        return self._indice_representantes
+
+
+class VisaoInduzida(VisaoGrafo):
+    def __init__(self, base, ids_vertices, nome_arquivo=None):
+        """
+        Info: Subgrafo induzido por um conjunto de vértices: contém esses vértices
+              (na ordem em que foram dados, renumerados a partir de 0) e todas as
+              arestas da base entre eles, na ordem de `Aresta.indice` (a da base,
+              quando ela é um Grafo). As arestas são achadas pelas adjacências dos
+              vértices selecionados, sem percorrer as demais arestas da base.
+              Vértices removidos depois da base somem da visão. A matriz densa de
+              pesos é recortada da matriz da base com `np.ix_`.
+        E: base (Grafo/VisaoGrafo), ids_vertices (iterável de str/int),
+           nome_arquivo (str, opcional)
+        S: None
+        """
+        super().__init__(base, nome_arquivo=nome_arquivo)
+        self._ids = list(dict.fromkeys(str(id_v) for id_v in ids_vertices))
+        ausentes = [id_v for id_v in self._ids if id_v not in base.indice_vertices]
+        if ausentes:
+            raise ValueError(f"Vértices não encontrados no grafo: {ausentes}")
+
+    def _selecionar(self):
+        indice = self.base.indice_vertices
+        vertices = [indice[id_v] for id_v in self._ids if id_v in indice]
+        posicoes = {v: i for i, v in enumerate(vertices)}
+        pesos_adj, indice_arestas = self.base.pesos_adj, self.base.indice_arestas
+        arestas = []
+        for u in vertices:
+            vizinhos = pesos_adj[u]
+            # Percorre o menor entre os vizinhos de u e os vértices selecionados;
+            # sem orientação, cada aresta é tomada só a partir da ponta de menor posição.
+            for v in (vertices if len(vizinhos) > len(vertices) else vizinhos):
+                if v in vizinhos and v in posicoes and (self.direcionado or posicoes[v] >= posicoes[u]):
+                    arestas.append(indice_arestas[self.base._chave_aresta(u, v)])
+        arestas.sort(key=lambda a: a.indice)
+        return vertices, arestas, posicoes
+
+    def _construir_matriz_pesos(self):
+        posicoes_base = [self.base.posicao_vertice(v) for v in self._vertices]
+        return self.base.matriz_pesos[np.ix_(posicoes_base, posicoes_base)]
+
+
+class VisaoArestas(VisaoGrafo):
+    def __init__(self, base, arestas, nome_arquivo=None):
+        """
+        Info: Subgrafo gerador com todos os vértices da base e apenas as arestas
+              fornecidas, que devem ser objetos Aresta da própria base. Arestas
+              removidas depois da base somem da visão.
+        E: base (Grafo/VisaoGrafo), arestas (iterável de Aresta), nome_arquivo (str, opcional)
+        S: None
+        """
+        super().__init__(base, nome_arquivo=nome_arquivo)
+        self._selecionadas = list(arestas)
+
+    def _selecionar(self):
+        indice = self.base.indice_arestas
+        chave = self.base._chave_aresta
+        arestas = [a for a in self._selecionadas if indice.get(chave(a.v1, a.v2)) is a]
+        return self.base.vertices, arestas, self._posicoes_base()
@@ -7,4 +7,42 @@ def get_decimal(valor, casas_decimais = 2, rounding = ROUND_HALF_UP):
 
     valor_convertido = Decimal(str(valor)).quantize(Decimal("0." + "0" * casas_decimais), rounding=rounding)
 
-    return valor_convertido
\ No newline at end of file
+    return valor_convertido
+
+MODOS_PESO = ("decimal", "float", "inteiro")
+ESCALA_INTEIRO = 100
+
+def converter_peso(valor, modo="decimal"):
+    """
+    Converte um peso lido (texto ou número) para a representação nativa do modo:
+    Decimal com duas casas ("decimal"), float ("float") ou inteiro em ponto fixo
+    com duas casas, isto é, o valor multiplicado por 100 ("inteiro").
+    """
+    if modo == "decimal":
+        return get_decimal(valor)
+    if modo == "float":
+        return float(valor)
+    if modo == "inteiro":
+        return int(get_decimal(valor) * ESCALA_INTEIRO)
+    raise ValueError(f"Modo de pesos desconhecido: '{modo}'. Use um de {MODOS_PESO}.")
+
+def peso_real(valor, modo="decimal"):
+    """
+    Desfaz a escala do modo "inteiro", devolvendo o valor real de um peso (ou soma
+    de pesos) como float; nos demais modos o valor passa inalterado. Deve receber
+    apenas valores na representação nativa do modo (pesos das arestas e somas
+    deles), nunca custos já reais, como os calculados sobre a matriz de pesos.
+    """
+    if modo == "inteiro":
+        return valor / ESCALA_INTEIRO
+    return valor
+
+def formatar_peso(valor, modo="decimal", casas_decimais=2):
+    """
+    Formata um peso (ou soma de pesos) do modo indicado com duas casas decimais
+    por padrão, desfazendo a escala do modo "inteiro". Como em `peso_real`, o
+    valor deve estar na representação nativa do modo.
+    """
+    if modo == "inteiro":
+        valor = Decimal(valor) / ESCALA_INTEIRO
+    return f"{valor:.{casas_decimais}f}"
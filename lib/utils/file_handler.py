@@ -3,147 +3,411 @@ Módulo:    Leitor de Arquivos
 Descriçao: Funcionalidades para leitura e tratamento com arquivos.
 """
 import os
+import io
 import sys
+import gc
+import gzip
+import lzma
 from lib.core.graph import Grafo
 import csv
-from lib.utils.converter import get_decimal
-def ler_grafo(caminho_arquivo, direcionado=False, renomear=None, ponderado=False):
+from lib.utils.converter import converter_peso
+from lib.utils.graph_cache import carregar_cache, salvar_cache, codificar_grafo, decodificar_grafo
+from concurrent.futures import ProcessPoolExecutor, Future
+from lib.core.graph_view import VisaoInduzida
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import zstandard
+    HAS_ZSTANDARD = True
+except ImportError:
+    HAS_ZSTANDARD = False
+
+# Caracteres de formatação das linhas "(u, v, {w})", removidos de um bloco inteiro por vez.
+_DELIMITADORES = str.maketrans("", "", "(){}")
+TAMANHO_BLOCO = 1 << 20  # caracteres lidos por vez em ler_grafo
+
+# Formatos de compressão aceitos na entrada: (nome, assinatura, extensão).
+COMPRESSOES = (
+    ("gzip", b"\x1f\x8b", ".gz"),
+    ("xz", b"\xfd7zXZ\x00", ".xz"),
+    ("zstd", b"\x28\xb5\x2f\xfd", ".zst"),
+)
+
+def detectar_compressao(caminho_arquivo):
+    """
+    Identifica a compressão de um arquivo pelos primeiros bytes (a assinatura
+    do formato) ou, se o arquivo for curto demais para tê-la, pela extensão.
+    S: str ("gzip", "xz", "zstd") ou None se o arquivo não estiver comprimido.
+    """
+    with open(caminho_arquivo, 'rb') as arquivo:
+        inicio = arquivo.read(max(len(assinatura) for _, assinatura, _ in COMPRESSOES))
+    for nome, assinatura, _ in COMPRESSOES:
+        if inicio.startswith(assinatura):
+            return nome
+    if not inicio:
+        for nome, _, extensao in COMPRESSOES:
+            if caminho_arquivo.lower().endswith(extensao):
+                return nome
+    return None
+
+def remover_extensao_compressao(nome_arquivo):
+    """
+    Remove do nome a extensão de compressão, se houver ("GRAFO_1.txt.gz" -> "GRAFO_1.txt").
+    """
+    for _, _, extensao in COMPRESSOES:
+        if nome_arquivo.lower().endswith(extensao):
+            return nome_arquivo[:-len(extensao)]
+    return nome_arquivo
+
+def abrir_texto(caminho_arquivo, newline=None):
+    """
+    Abre um arquivo de entrada em modo texto (UTF-8), descomprimindo-o sob
+    demanda se ele estiver em gzip, xz ou zstd. A descompressão acompanha a
+    leitura, bloco a bloco: nenhum arquivo temporário é gravado e o conteúdo
+    descomprimido nunca fica inteiro na memória.
+    E: caminho_arquivo (str), newline (str, opcional) - Como em `open`.
+    S: objeto de arquivo em modo texto.
+    """
+    compressao = detectar_compressao(caminho_arquivo)
+    if compressao == "gzip":
+        return gzip.open(caminho_arquivo, 'rt', encoding='utf-8', newline=newline)
+    if compressao == "xz":
+        return lzma.open(caminho_arquivo, 'rt', encoding='utf-8', newline=newline)
+    if compressao == "zstd":
+        if not HAS_ZSTANDARD:
+            raise ImportError("A leitura de arquivos .zst requer o pacote zstandard.")
+        leitor = zstandard.ZstdDecompressor().stream_reader(open(caminho_arquivo, 'rb'), closefd=True)
+        return io.TextIOWrapper(leitor, encoding='utf-8', newline=newline)
+    return open(caminho_arquivo, 'r', encoding='utf-8', newline=newline)
+
+def ler_grafo(caminho_arquivo, direcionado=False, renomear=None, ponderado=False, modo_pesos="decimal"):
     """
     Lê um arquivo de definição de grafo e cria o objeto Grafo.
     Se o parâmetro 'renomear' for fornecido, o grafo será nomeado com esse valor.
+    Os pesos são convertidos uma única vez para o 'modo_pesos' do grafo.
+    O arquivo é lido em blocos (ver `ler_arestas`) e cada bloco de arestas vai
+    direto para o construtor em lote, sem passar pela API de uma aresta por vez.
+    Arquivos comprimidos (gzip, xz, zstd) são descomprimidos durante a leitura
+    (ver `abrir_texto`); o nome do grafo não leva a extensão de compressão.
     """
     print(f"Lendo arquivo: {caminho_arquivo}")
-    nome_arquivo = renomear if renomear else os.path.basename(caminho_arquivo)
-    grafo = Grafo(direcionado, nome_arquivo, ponderado=ponderado)
+    nome_arquivo = renomear if renomear else remover_extensao_compressao(os.path.basename(caminho_arquivo))
     
     try:
-        with open(caminho_arquivo, 'r', encoding='utf-8') as arquivo:
-            primeira_linha = arquivo.readline().strip()
-            if len(primeira_linha) > 1 and not primeira_linha.isdigit():
-                partes = [p.strip() for p in primeira_linha.replace('(', '').replace(')', '').replace('{', '').replace('}', '').split(',')]
-                if len(partes) >= 2 and partes[0] and partes[1]:
-                    v1_id, v2_id = partes[0], partes[1]
-                    peso = get_decimal(partes[2]) if len(partes) > 2 else None
-                    grafo.adicionar_vertice(v1_id)
-                    grafo.adicionar_vertice(v2_id)
-                    grafo.adicionar_aresta(v1_id, v2_id, peso)
-            for linha in arquivo:
-                partes = [p.strip() for p in linha.replace('(', '').replace(')', '').replace('{', '').replace('}', '').split(',')]
-                if len(partes) < 2 or not partes[0] or not partes[1]:
-                    continue
-                
-                v1_id, v2_id = partes[0], partes[1]
-                peso = get_decimal(partes[2]) if len(partes) > 2 else None
-
-                grafo.adicionar_vertice(v1_id)
-                grafo.adicionar_vertice(v2_id)
-                grafo.adicionar_aresta(v1_id, v2_id, peso)
-        
+        grafo = Grafo(direcionado=direcionado, nome_arquivo=nome_arquivo, ponderado=ponderado, modo_pesos=modo_pesos)
+        with abrir_texto(caminho_arquivo) as arquivo:
+            # A carga só cria objetos que continuam vivos; pausar o coletor de
+            # ciclos evita varreduras inúteis sobre o grafo em construção.
+            gc_ativo = gc.isenabled()
+            gc.disable()
+            try:
+                for bloco in ler_arestas(arquivo, modo_pesos):
+                    grafo.adicionar_arestas(bloco, criar_vertices=True)
+            finally:
+                if gc_ativo:
+                    gc.enable()
         return grafo
         
     except Exception as e:
         print(f"Erro ao ler o arquivo {caminho_arquivo}: {e}")
         return None
 
-def ler_grafo_csv(caminho_csv, renomear=None, range=None, subconjunto=None):
-    with open(caminho_csv, newline='', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        linhas = list(reader)
+def ler_arestas(arquivo, modo_pesos="decimal", tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Lê arestas no formato "(u, v, {w})" ou "(u, v)", uma por linha, em blocos de
+    `tamanho_bloco` caracteres. Parênteses e chaves são removidos do bloco inteiro
+    com um único `str.translate`; cada linha passa apenas por um `split`. Linhas
+    com menos de dois campos (como a contagem de vértices no início do arquivo)
+    são ignoradas. Pesos repetidos são convertidos uma única vez.
+    E: arquivo (objeto de arquivo em modo texto), modo_pesos (str), tamanho_bloco (int)
+    S: gerador de list[(str, str, peso ou None)] - Um lote de arestas por bloco.
+    """
+    pesos_convertidos = {}
+    resto = ""
+    while True:
+        bloco = arquivo.read(tamanho_bloco)
+        if not bloco:
+            break
+        linhas = (resto + bloco.translate(_DELIMITADORES)).split("\n")
+        resto = linhas.pop()
+        yield _tokenizar_arestas(linhas, modo_pesos, pesos_convertidos)
+    if resto:
+        yield _tokenizar_arestas([resto], modo_pesos, pesos_convertidos)
 
-    cabecalhos = [h.strip() for h in linhas[0][1:]]  # ignora coluna vazia da esquerda
+def _tokenizar_arestas(linhas, modo_pesos, pesos_convertidos):
+    """
+    Separa os campos de linhas já sem delimitadores e converte os pesos,
+    reaproveitando as conversões guardadas em `pesos_convertidos`.
+    """
+    arestas = []
+    for linha in linhas:
+        partes = linha.split(",")
+        if len(partes) < 2:
+            continue
+        v1, v2 = partes[0].strip(), partes[1].strip()
+        if not v1 or not v2:
+            continue
+        if len(partes) == 2:
+            arestas.append((v1, v2, None))
+            continue
+        texto = partes[2].strip()
+        peso = pesos_convertidos.get(texto)
+        if peso is None:
+            peso = pesos_convertidos[texto] = converter_peso(texto, modo_pesos)
+        arestas.append((v1, v2, peso))
+    return arestas
+
+def ler_grafo_csv(caminho_csv, renomear=None, range=None, subconjunto=None, modo_pesos="decimal"):
+    """
+    Lê uma matriz de distâncias em CSV e retorna o grafo completo (não direcionado)
+    dos vértices em 'subconjunto' (números de coluna, a partir de 1; todos, se None).
+    O CSV é lido uma única vez por processo (ver `carregar_grafo_csv`); cada
+    subconjunto é uma VisaoInduzida sobre o grafo completo, cuja matriz densa de
+    pesos é recortada da matriz completa com `np.ix_`.
+    """
+    completo = carregar_grafo_csv(caminho_csv, modo_pesos)
+    ids = [v.id for v in completo.vertices]
+    if subconjunto is not None:
+        ids = [ids[i - 1] for i in subconjunto]  # CSV começa a contar em 1
+    return VisaoInduzida(completo, ids, nome_arquivo=renomear or caminho_csv)
 
-    if subconjunto is None:
-        indices = list(range(len(cabecalhos)))
-    else:
-        indices = [i - 1 for i in subconjunto]  # CSV começa a contar em 1
+_GRAFOS_CSV = {}  # (caminho absoluto, modo_pesos) -> ((tamanho, mtime_ns), Grafo)
+
+def carregar_grafo_csv(caminho_csv, modo_pesos="decimal"):
+    """
+    Converte o CSV inteiro numa matriz NumPy e dela monta, uma única vez por
+    processo (enquanto o arquivo não mudar), o Grafo com todos os vértices.
+    Células vazias ou "0" não geram aresta; só o triângulo superior é lido.
+    O CSV pode estar comprimido (ver `abrir_texto`).
+    O grafo devolvido é compartilhado e não deve ser modificado.
+    """
+    if not HAS_NUMPY:
+        raise ImportError("A leitura de matrizes CSV requer o pacote numpy.")
 
-    vertices_escolhidos = [cabecalhos[i] for i in indices]
+    chave = (os.path.abspath(caminho_csv), modo_pesos)
+    info = os.stat(caminho_csv)
+    assinatura = (info.st_size, info.st_mtime_ns)
+    em_cache = _GRAFOS_CSV.get(chave)
+    if em_cache is not None and em_cache[0] == assinatura:
+        return em_cache[1]
 
-    grafo = Grafo(direcionado=False, nome_arquivo=renomear or caminho_csv, ponderado=True)
+    with abrir_texto(caminho_csv, newline='') as f:
+        linhas = list(csv.reader(f))
 
-    # adiciona vértices
-    for v in vertices_escolhidos:
-        grafo.adicionar_vertice(v)
+    cabecalhos = [h.strip() for h in linhas[0][1:]]  # ignora coluna vazia da esquerda
+    n = len(cabecalhos)
+    textos = np.array([[c.strip() for c in (linha[1:] + [""] * n)[:n]] for linha in linhas[1:n + 1]], dtype=str)
+    vazio = (textos == "") | (textos == "0")
+    matriz = _converter_celulas(textos, vazio, cabecalhos)
 
-    # percorre a matriz de adjacência
-    for i_pos, i in enumerate(indices):      
-        v1 = cabecalhos[i]
+    # np.nonzero percorre o triângulo superior linha a linha, na ordem do CSV.
+    origem, destino = np.nonzero(np.triu(~vazio, k=1))
+    pesos_convertidos = {}
+    arestas = []
+    for i, j, valor in zip(origem.tolist(), destino.tolist(), matriz[origem, destino].tolist()):
+        peso = pesos_convertidos.get(valor)
+        if peso is None:
+            peso = pesos_convertidos[valor] = converter_peso(valor, modo_pesos)
+        arestas.append((cabecalhos[i], cabecalhos[j], peso))
 
-        linha = linhas[i + 1]                  # pega linha original do CSV
-        valores = linha[1:]                    # ignora coluna vazia da esquerda   
+    completo = Grafo.de_arestas(arestas, vertices=cabecalhos, direcionado=False, nome_arquivo=caminho_csv,
+                                ponderado=True, dtype_pesos="float32", modo_pesos=modo_pesos)
+    _GRAFOS_CSV[chave] = (assinatura, completo)
+    return completo
 
-        for j_pos, j in enumerate(indices):
-            if j <= i:
-                continue  # evita duplicação de arestas em grafos não direcionados/otimiza processamento de matriz
+def _converter_celulas(textos, vazio, cabecalhos):
+    """
+    Converte as células de texto da matriz CSV para float64 (NaN nas vazias).
+    A conversão é vetorizada; se alguma célula não for numérica, as do
+    triângulo superior (as únicas lidas) são convertidas uma a uma, e cada
+    célula inválida gera um alerta e é marcada em `vazio`, sem gerar aresta.
+    """
+    try:
+        return np.where(vazio, "nan", textos).astype(np.float64)
+    except ValueError:
+        pass
 
-            valor = valores[j]
-            if valor.strip() in ("", "0"):
-                continue
+    matriz = np.full(textos.shape, np.nan)
+    for i, j in zip(*(eixo.tolist() for eixo in np.nonzero(np.triu(~vazio, k=1)))):
+        try:
+            matriz[i, j] = float(textos[i, j])
+        except ValueError:
+            print(f"Alerta: Célula ({cabecalhos[i]}, {cabecalhos[j]}) com valor não numérico "
+                  f"'{textos[i, j]}' ignorada.")
+            vazio[i, j] = True
+    return matriz
 
-            peso = float(valor)
-            v2 = cabecalhos[j]
-            grafo.adicionar_aresta(v1, v2, peso)
+def _ler_com_cache(leitor, caminho, usar_cache, **parametros):
+    """
+    Lê um grafo com `leitor(caminho, **parametros)`, passando antes pelo cache
+    binário (ver `graph_cache`): se houver um cache válido para o arquivo e os
+    parâmetros, o grafo vem dele; senão, o arquivo é lido e o cache, gravado.
+    """
+    if usar_cache:
+        grafo = carregar_cache(caminho, parametros)
+        if grafo is not None:
+            print(f"Lendo cache de: {caminho}")
+            return grafo
 
+    grafo = leitor(caminho, **parametros)
+    if usar_cache and grafo is not None:
+        salvar_cache(grafo, caminho, parametros)
     return grafo
 
+# Prefixo do nome (em minúsculas) dos arquivos .txt -> parâmetros de `ler_grafo`.
+# A ordem importa: vale o primeiro prefixo que casar.
+PREFIXOS_TXT = (
+    ("grafo", {"direcionado": False}),
+    ("digrafo", {"direcionado": True}),
+    ("agm", {"direcionado": True, "renomear": "GRAFO_AGM", "ponderado": True}),
+    ("hierholzer_ciclo", {"direcionado": False, "renomear": "GRAFO_CICLO_HIERHOLZER"}),
+    ("hierholzer_caminho", {"direcionado": True, "renomear": "GRAFO_CAMINHO_HIERHOLZER"}),
+    ("chu_liu_edmonds", {"direcionado": True, "ponderado": True, "renomear": "DIGRAFO_CHU_LIU_EDMONDS"}),
+)
 
-def ler_diretorio(diretorio, destinos=None, it=0):
+def _classificar_arquivo(nome_arquivo):
     """
-    Lê todos os arquivos de grafos e digrafos de um diretório,
-    processando cada um e limpando o arquivo de resultados no início.
+    Classifica um arquivo do diretório pelo nome, ignorando a extensão de
+    compressão ("GRAFO_1.txt.gz" é tratado como "GRAFO_1.txt").
+    S: dict (parâmetros de `ler_grafo`), "csv", ou None se o arquivo não for um grafo.
     """
-    with open("resultados.txt", "w", encoding='utf-8') as arquivo:
-        arquivo.write("")
+    nome_lower = remover_extensao_compressao(nome_arquivo).lower()
+    if nome_lower.endswith('.txt'):
+        for prefixo, parametros in PREFIXOS_TXT:
+            if nome_lower.startswith(prefixo):
+                return dict(parametros)
+    elif nome_lower.endswith('.csv'):
+        return "csv"
+    return None
+
+def _ler_em_processo(caminho, usar_cache, parametros):
+    """
+    Tarefa executada pelos processos de `ler_diretorio`: lê o arquivo e devolve
+    o grafo codificado em arrays (ver `codificar_grafo`), que é bem mais barato
+    de transferir entre processos que o Grafo com todos os seus objetos.
+    """
+    grafo = _ler_com_cache(ler_grafo, caminho, usar_cache, **parametros)
+    if grafo is None:
+        return None
+    codificado = codificar_grafo(grafo)
+    return ("codificado", codificado) if codificado is not None else ("grafo", grafo)
+
+def _nome_previsto(nome_arquivo, parametros, it):
+    """
+    Nome que o grafo lido de um arquivo vai receber, conhecido antes da leitura.
+    """
+    if parametros == "csv":
+        categoria = "DISTANCIA" if "distancia" in nome_arquivo.lower() else "TEMPO"
+        return f'PCV_{categoria}-{it+1}'
+    return parametros.get("renomear") or remover_extensao_compressao(nome_arquivo)
 
+def _listar_arquivos(diretorio, it=0, ordenar=False):
+    """
+    Lista os arquivos de grafos de um diretório, sem lê-los.
+    S: list[(str, str, dict ou "csv")] - Nome previsto do grafo, caminho e
+       classificação de cada arquivo, na ordem de `os.listdir` ou, com
+       'ordenar', na ordem dos nomes previstos; None se a pasta não existir.
+    """
     try:
         arquivos = os.listdir(diretorio)
     except FileNotFoundError:
         print(f"ERRO: A pasta '{diretorio}' não foi encontrada.")
-        return []
+        return None
 
-    lista_grafos = []
+    entradas = []
     for nome_arquivo in arquivos:
         caminho = os.path.join(diretorio, nome_arquivo)
-        if os.path.isfile(caminho):
-            nome_lower = nome_arquivo.lower()
-            if nome_lower.startswith('grafo') and nome_lower.endswith('.txt'):
-                grafo = ler_grafo(caminho, direcionado=False)
-                if grafo:
-                    lista_grafos.append(grafo)
-            elif nome_lower.startswith('digrafo') and nome_lower.endswith('.txt'):
-                grafo = ler_grafo(caminho, direcionado=True)
-                if grafo:
-                    lista_grafos.append(grafo)
-            elif nome_lower.startswith('agm') and nome_lower.endswith('.txt'):
-                grafo = ler_grafo(caminho, direcionado=True, renomear='GRAFO_AGM', ponderado=True)
-                if grafo:
-                    lista_grafos.append(grafo) 
-            elif nome_lower.startswith('hierholzer_ciclo') and nome_lower.endswith('.txt'):
-                grafo = ler_grafo(caminho, direcionado=False, renomear='GRAFO_CICLO_HIERHOLZER')
-                if grafo:
-                    lista_grafos.append(grafo)
-            elif nome_lower.startswith('hierholzer_caminho') and nome_lower.endswith('.txt'):
-                grafo = ler_grafo(caminho, direcionado=True, renomear='GRAFO_CAMINHO_HIERHOLZER')
-                if grafo:
-                    lista_grafos.append(grafo)
-            elif nome_lower.startswith('chu_liu_edmonds') and nome_lower.endswith('.txt'):
-                grafo = ler_grafo(
-                    caminho,
-                    direcionado=True,
-                    ponderado=True,
-                    renomear='DIGRAFO_CHU_LIU_EDMONDS'
-                )
-                if grafo:
-                    lista_grafos.append(grafo)
-            elif nome_lower.endswith('.csv'):
-                categoria = "DISTANCIA" if "distancia" in nome_lower else "TEMPO"
-                
-                grafo = ler_grafo_csv(
-                    caminho,
-                    renomear=f'PCV_{categoria}-{it+1}',
-                    subconjunto=destinos
-                )
-                if grafo:
-                    print(f"Arquivo CSV processado: {nome_arquivo} como {grafo.nome_arquivo}")
-                    lista_grafos.append(grafo)
-    return lista_grafos
+        if not os.path.isfile(caminho):
+            continue
+        parametros = _classificar_arquivo(nome_arquivo)
+        if parametros is None:
+            continue
+        entradas.append((_nome_previsto(nome_arquivo, parametros, it), caminho, parametros))
+    if ordenar:
+        entradas.sort(key=lambda entrada: entrada[0])
+    return entradas
+
+def _ler_csv_diretorio(caminho, destinos, it, modo_pesos):
+    nome_arquivo = os.path.basename(caminho)
+    # O CSV já é lido uma única vez por processo; os subconjuntos são visões.
+    grafo = ler_grafo_csv(
+        caminho,
+        renomear=_nome_previsto(nome_arquivo, "csv", it),
+        subconjunto=destinos,
+        modo_pesos=modo_pesos
+    )
+    if grafo:
+        print(f"Arquivo CSV processado: {nome_arquivo} como {grafo.nome_arquivo}")
+    return grafo
+
+def iterar_diretorio(diretorio, destinos=None, it=0, modo_pesos="decimal", usar_cache=True, ordenar=False):
+    """
+    Versão preguiçosa de `ler_diretorio`: um gerador que lê e entrega os grafos
+    do diretório um de cada vez, só quando o próximo é pedido. Quem consome o
+    gerador sem guardar os grafos já processados (ver `executar_pipeline`)
+    mantém em memória apenas um grafo por vez.
+    Com 'ordenar', os grafos saem em ordem de nome (o mesmo `nome_arquivo`
+    que terão depois de lidos), a ordem usada nos relatórios.
+    Ao contrário de `ler_diretorio`, não limpa o arquivo de resultados.
+    """
+    entradas = _listar_arquivos(diretorio, it, ordenar)
+    if entradas is None:
+        return
+
+    for _, caminho, parametros in entradas:
+        if parametros == "csv":
+            grafo = _ler_csv_diretorio(caminho, destinos, it, modo_pesos)
+        else:
+            grafo = _ler_com_cache(ler_grafo, caminho, usar_cache, modo_pesos=modo_pesos, **parametros)
+        if grafo:
+            yield grafo
+        # Solta o grafo antes de ler o próximo.
+        del grafo
+
+def ler_diretorio(diretorio, destinos=None, it=0, modo_pesos="decimal", usar_cache=True, processos=None):
+    """
+    Lê todos os arquivos de grafos e digrafos de um diretório,
+    processando cada um e limpando o arquivo de resultados no início.
+    Todos os grafos são carregados com o mesmo 'modo_pesos'.
+    Com 'usar_cache', os grafos já lidos são recarregados do cache binário
+    gravado na pasta '__grafos__' do diretório, enquanto o arquivo de origem
+    não mudar.
+    Com 'processos' (número de processos), os arquivos .txt são lidos em
+    paralelo num pool de processos; a lista retornada mantém a mesma ordem
+    da leitura sequencial.
+    Para ler um grafo por vez, sem materializar a lista, use `iterar_diretorio`.
+    """
+    with open("resultados.txt", "w", encoding='utf-8') as arquivo:
+        arquivo.write("")
+
+    if not processos:
+        return list(iterar_diretorio(diretorio, destinos, it, modo_pesos, usar_cache))
+
+    entradas = _listar_arquivos(diretorio, it)
+    if entradas is None:
+        return []
+
+    resultados = []  # Grafo, ou Future de um processo, na ordem de `entradas`
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        for _, caminho, parametros in entradas:
+            if parametros == "csv":
+                resultados.append(_ler_csv_diretorio(caminho, destinos, it, modo_pesos))
+            else:
+                parametros["modo_pesos"] = modo_pesos
+                resultados.append(executor.submit(_ler_em_processo, caminho, usar_cache, parametros))
+
+        lista_grafos = []
+        for resultado in resultados:
+            if isinstance(resultado, Future):
+                resultado = resultado.result()
+                if resultado is not None:
+                    tipo, conteudo = resultado
+                    resultado = decodificar_grafo(*conteudo) if tipo == "codificado" else conteudo
+            if resultado:
+                lista_grafos.append(resultado)
+        return lista_grafos
@@ -17,6 +17,7 @@ from lib.algorithms.kruskal import kruskal
 from lib.algorithms.prim import prim
 from lib.algorithms.hierholzer_ciclos import hierholzer_ciclos
 from lib.algorithms.hierholzer_caminhos import hierholzer_caminhos
+from lib.utils.converter import formatar_peso
 
 def formatar_lista_adj(grafo: Grafo):
     """
@@ -267,11 +268,10 @@ def formatar_caminho_floyd_warshall(grafo: Grafo, id_inicio: str, id_fim: str):
         return (titulo + "\n" + report, None)
     
     try:
-        dist, pred, vertices = floyd_warshall(grafo)
+        dist, pred, vertices = grafo.resultado_derivado("floyd_warshall", lambda: floyd_warshall(grafo))
         
-        idx_map = {v.id: i for i, v in enumerate(vertices)}
-        idx_inicio = idx_map.get(id_inicio)
-        idx_fim = idx_map.get(id_fim)
+        idx_inicio = grafo.posicao(id_inicio)
+        idx_fim = grafo.posicao(id_fim)
 
         if idx_inicio is None or idx_fim is None:
             report = f"  Erro: Vértice {id_inicio} ou {id_fim} não encontrado."
@@ -281,7 +281,8 @@ def formatar_caminho_floyd_warshall(grafo: Grafo, id_inicio: str, id_fim: str):
         caminho = reconstruir_caminho(pred, vertices, idx_inicio, idx_fim)
 
         if caminho:
-            custo_str = f"{custo:.0f}" if custo != infinito else "INF"
+            # As distâncias do Floyd-Warshall já estão em valor real (ver `floyd_warshall`).
+            custo_str = formatar_peso(custo) if custo != infinito else "INF"
             caminho_str = " -> ".join([v.id for v in caminho])
             report = f"  Custo: {custo_str}\n  Caminho: {caminho_str}"
             return (titulo + "\n" + report, caminho)
@@ -313,9 +314,9 @@ def formatar_agm_resultado(agm_grafo: Grafo, nome_algoritmo: str):
     for aresta in arestas_ordenadas:
         if aresta.peso is not None:
             custo_total += aresta.peso
-        arestas_str.append(f"  ({aresta.v1.id}, {aresta.v2.id}, {aresta.peso})")
+        arestas_str.append(f"  ({aresta.v1.id}, {aresta.v2.id}, {agm_grafo.formatar_peso(aresta.peso)})")
     
-    output.append(f"  Custo Total: {custo_total}")
+    output.append(f"  Custo Total: {agm_grafo.formatar_peso(custo_total)}")
     output.append("  Arestas da AGM:")
     output.extend(arestas_str)
     return "\n".join(output)
@@ -365,9 +366,9 @@ def formatar_arborescencia(arbo_grafo: Grafo, nome_algoritmo: str):
     for aresta in arestas_ordenadas:
         if aresta.peso is not None:
             custo_total += aresta.peso
-        arestas_str.append(f"  {aresta.v1.id} -> {aresta.v2.id} (peso {aresta.peso})")
+        arestas_str.append(f"  {aresta.v1.id} -> {aresta.v2.id} (peso {arbo_grafo.formatar_peso(aresta.peso)})")
 
-    output.append(f"  Custo Total: {custo_total}")
+    output.append(f"  Custo Total: {arbo_grafo.formatar_peso(custo_total)}")
     output.append("  Arestas da Arborescência:")
     output.extend(arestas_str)
     return "\n".join(output)
@@ -384,7 +385,7 @@ def formatar_vmp(vmp_ciclo: dict, nome_algoritmo: str, it=None):
     
     custo_total = list(vmp_ciclo.values())[0]
 
-    output.append(f"  Custo Total: {custo_total}")
+    output.append(f"  Custo Total: {custo_total:.2f}")
     output.append("  Rota encontrada:")
 
     rota = list(vmp_ciclo.keys())[0]
@@ -403,7 +404,7 @@ def formatar_vmp_melhorado(vmp_ciclo: dict, nome_algoritmo: str):
     
     custo_total = list(vmp_ciclo.values())[0]
 
-    output.append(f"\n  Custo Total após busca local: {custo_total}")
+    output.append(f"\n  Custo Total após busca local: {custo_total:.2f}")
     output.append("  Rota encontrada após busca local:")
 
     rota = list(vmp_ciclo.keys())[0]
@@ -432,7 +433,7 @@ def gerar_relatorio_memetico(dados_completos: list):
                 f.write(f"{'='*60}\n")
             
             f.write(f"\n---- INSTÂNCIA {dados['instancia']} ----\n")
-            f.write(f"  Melhor Custo (em 20 execuções): {dados['melhor_custo']}\n")
+            f.write(f"  Melhor Custo (em 20 execuções): {dados['melhor_custo']:.2f}\n")
             f.write(f"  Custo Médio: {dados['media_custo']:.2f}\n")
             f.write(f"  Tempo Médio: {dados['media_tempo']:.4f}s\n")
             f.write("  Melhor Rota encontrada:\n")
@@ -455,7 +456,7 @@ def gerar_relatorio_genetico(dados_estatisticos: list):
         
         for dados in dados_estatisticos:
             f.write(f"\n---- INSTÂNCIA {dados['instancia']} ----\n")
-            f.write(f"  Melhor Custo (em 20 execuções): {dados['melhor_custo']}\n")
+            f.write(f"  Melhor Custo (em 20 execuções): {dados['melhor_custo']:.2f}\n")
             f.write(f"  Custo Médio: {dados['media_custo']:.2f}\n")
             f.write(f"  Tempo Médio de Execução: {dados['media_tempo']:.4f} segundos\n")
             f.write("  Melhor Rota encontrada:\n")
@@ -522,6 +523,51 @@ def gerar_relatorio_completo(grafo: Grafo):
         ]
     return "\n".join(header + report_body)
 
+def formatar_relatorio_unidade_2(grafo: Grafo):
+    """
+    Info: (Função de relatórios) Bloco do relatório da unidade 2 de um único
+          grafo: representações, graus e os resultados dos algoritmos
+          específicos do arquivo. Permite escrever o relatório um grafo por
+          vez (ver `executar_pipeline`).
+    E: grafo (Grafo) - A instância do grafo.
+    S: str - O bloco de texto do grafo.
+    """
+    output = []
+    output.append("*********************************************************************\n")
+    output.append(f"Arquivo: {grafo.nome_arquivo}\n")
+
+    output.append(formatar_matriz_adj(grafo))
+    output.append("\n")
+    output.append(formatar_lista_adj(grafo))
+    output.append("\n")
+    output.append(formatar_graus(grafo))
+
+    if 'GRAFO_AGM' in grafo.nome_arquivo:
+        try:
+            agm_k = grafo.resultado_derivado("kruskal", lambda: kruskal(grafo))
+            output.append(formatar_agm_resultado(agm_k, "Kruskal")) # (1)
+        except Exception as e:
+            output.append(f"\n==== RESULTADO KRUSKAL ====\n  Erro: {e}")
+        try:
+            agm_p = grafo.resultado_derivado("prim", lambda: prim(grafo))
+            output.append(formatar_agm_resultado(agm_p, "Prim")) # (2)
+        except Exception as e:
+            output.append(f"\n==== RESULTADO PRIM ====\n  Erro: {e}")
+        report_bf, _ = formatar_caminho_bellman_ford(grafo, "1", "15")
+        output.append(report_bf)# (6)
+        report_fw, _ = formatar_caminho_floyd_warshall(grafo, "1", "15")
+        output.append(report_fw) # (7)
+    elif 'CHU_LIU_EDMONDS' in grafo.nome_arquivo:
+        agm_chu, erro = chu_liu_edmonds(grafo, raiz="1")
+        if agm_chu:
+            output.append(formatar_arborescencia(agm_chu, "Chu-Liu/Edmonds"))
+        else:
+            output.append(f"\n==== RESULTADO CHU-LIU/EDMONDS ====\n  Erro: {erro}")
+    elif 'HIERHOLZER' in grafo.nome_arquivo:
+        output.append(formatar_hierholzer_resultado(grafo)) # (8) - (9)
+    output.append("\n\n")
+    return "".join(output)
+
 def gerar_relatorio_unidade_2(grafos: list):
     """
     Info: (Função de relatórios) Agrega todos os resultados da unidade 2
@@ -535,36 +581,4 @@ def gerar_relatorio_unidade_2(grafos: list):
         grafos_ordenados = sorted(grafos, key=lambda g: g.nome_arquivo)
         
         for grafo in grafos_ordenados:
-            f.write("*********************************************************************\n")
-            f.write(f"Arquivo: {grafo.nome_arquivo}\n")
-            
-            f.write(formatar_matriz_adj(grafo))
-            f.write("\n")
-            f.write(formatar_lista_adj(grafo))
-            f.write("\n")
-            f.write(formatar_graus(grafo))
-                        
-            if 'GRAFO_AGM' in grafo.nome_arquivo:
-                try:
-                    agm_k = kruskal(grafo) 
-                    f.write(formatar_agm_resultado(agm_k, "Kruskal")) # (1)
-                except Exception as e:
-                    f.write(f"\n==== RESULTADO KRUSKAL ====\n  Erro: {e}")
-                try:
-                    agm_p = prim(grafo) 
-                    f.write(formatar_agm_resultado(agm_p, "Prim")) # (2)
-                except Exception as e:
-                    f.write(f"\n==== RESULTADO PRIM ====\n  Erro: {e}")
-                report_bf, _ = formatar_caminho_bellman_ford(grafo, "1", "15")
-                f.write(report_bf)# (6)
-                report_fw, _ = formatar_caminho_floyd_warshall(grafo, "1", "15")
-                f.write(report_fw) # (7)
-            elif 'CHU_LIU_EDMONDS' in grafo.nome_arquivo:
-                agm_chu, erro = chu_liu_edmonds(grafo, raiz="1")
-                if agm_chu:
-                    f.write(formatar_arborescencia(agm_chu, "Chu-Liu/Edmonds"))
-                else:
-                    f.write(f"\n==== RESULTADO CHU-LIU/EDMONDS ====\n  Erro: {erro}")
-            elif 'HIERHOLZER' in grafo.nome_arquivo:
-                f.write(formatar_hierholzer_resultado(grafo)) # (8) - (9)          
-            f.write("\n\n")
+            f.write(formatar_relatorio_unidade_2(grafo))
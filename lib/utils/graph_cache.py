@@ -0,0 +1,413 @@
+"""
+Módulo:    Cache Binário de Grafos
+Descriçao: Guarda em disco, num formato binário compacto, os grafos lidos dos
+           arquivos de texto e CSV, para que as execuções seguintes os carreguem
+           sem refazer o parsing. O cache fica na pasta `__grafos__`, ao lado do
+           arquivo de origem, e só é usado enquanto o tamanho e a data de
+           modificação da origem forem os mesmos registrados no cache.
+
+           Formato: uma linha mágica, o tamanho do cabeçalho (8 bytes, little
+           endian), um cabeçalho JSON (atributos do grafo, IDs dos vértices,
+           parâmetros da leitura e dados da origem) e, alinhados a 64 bytes, os
+           arrays `origem` e `destino` (posições dos vértices, int32) e `pesos`
+           de cada aresta, na ordem de `Grafo.arestas`. Os arrays são abertos com
+           `numpy.memmap`, o que torna a carga quase imediata e permite que vários
+           processos compartilhem as mesmas páginas do arquivo.
+
+           Pesos: no modo "float", float64 (NaN para aresta sem peso); nos modos
+           "decimal" e "inteiro", int64 em centésimos (o mínimo de int64 para
+           aresta sem peso), o que preserva exatamente os pesos de duas casas.
+
+           Junto do grafo podem ser guardados também os landmarks do A* (ver
+           `a_estrela`), num arquivo .npz com as distâncias codificadas como os
+           pesos. Eles guardam um resumo do conteúdo do grafo para o qual foram
+           calculados e só são reaproveitados para um grafo com o mesmo resumo.
+
+Funções:   - caminho_cache(caminho_origem, parametros, sufixo)
+           - codificar_grafo(grafo), decodificar_grafo(atributos, origem, destino, pesos)
+           - salvar_cache(grafo, caminho_origem, parametros)
+           - carregar_cache(caminho_origem, parametros)
+           - carregar_csr_cache(caminho_origem, parametros)
+           - salvar_landmarks(landmarks, caminho_origem, parametros)
+           - carregar_landmarks(caminho_origem, parametros)
+           - impressao_grafo(grafo)
+           - obter_landmarks(grafo, caminho_origem, parametros, k)
+"""
+import os
+import gc
+import json
+import hashlib
+from decimal import Decimal
+from lib.core.graph import Grafo, Vertice
+from lib.core.graph_csr import GrafoCSR
+from lib.utils.converter import ESCALA_INTEIRO
+from lib.algorithms.a_estrela import escolher_landmarks, NUM_LANDMARKS
+from math import inf as INF
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+MAGICO = b"GRAFOBIN 1\n"
+PASTA_CACHE = "__grafos__"
+ALINHAMENTO = 64
+SEM_PESO_INTEIRO = -(2 ** 63)
+INALCANCAVEL_INTEIRO = 2 ** 63 - 1
+
+def caminho_cache(caminho_origem, parametros, sufixo=".bin"):
+    """
+    Info: Caminho do arquivo de cache de uma leitura. Leituras do mesmo arquivo
+          com parâmetros diferentes (subconjunto, modo de pesos...) têm caches distintos.
+    E: caminho_origem (str), parametros (dict) - Argumentos passados ao leitor.
+       sufixo (str) - Extensão do arquivo (".bin" para o grafo).
+    S: str
+    """
+    chave = hashlib.sha1(json.dumps(parametros, sort_keys=True, default=list).encode()).hexdigest()[:12]
+    pasta, nome = os.path.split(caminho_origem)
+    return os.path.join(pasta, PASTA_CACHE, f"{nome}.{chave}{sufixo}")
+
+def _descrever_origem(caminho_origem):
+    info = os.stat(caminho_origem)
+    return {"tamanho": info.st_size, "mtime_ns": info.st_mtime_ns}
+
+def _alinhar(posicao):
+    return -(-posicao // ALINHAMENTO) * ALINHAMENTO
+
+def codificar_grafo(grafo):
+    """
+    Info: Representação compacta de um grafo: seus atributos e os arrays
+          (origem, destino, pesos) descritos no início do módulo. É o conteúdo
+          do cache em disco e também o que os processos de leitura paralela
+          devolvem (ver `ler_diretorio`), bem menor que o Grafo serializado.
+    E: grafo (Grafo/VisaoGrafo)
+    S: (dict, numpy.ndarray, numpy.ndarray, numpy.ndarray) ou None - None se
+       não houver numpy ou algum peso não couber no formato.
+    """
+    if not HAS_NUMPY:
+        return None
+
+    m = len(grafo.arestas)
+    posicao = grafo.posicao_vertice
+    origem = np.fromiter((posicao(a.v1) for a in grafo.arestas), dtype=np.int32, count=m)
+    destino = np.fromiter((posicao(a.v2) for a in grafo.arestas), dtype=np.int32, count=m)
+    if grafo.modo_pesos == "float":
+        pesos = np.fromiter((np.nan if a.peso is None else a.peso for a in grafo.arestas), dtype=np.float64, count=m)
+    else:
+        centesimos = []
+        for a in grafo.arestas:
+            if a.peso is None:
+                centesimos.append(SEM_PESO_INTEIRO)
+            elif grafo.modo_pesos == "inteiro":
+                centesimos.append(a.peso)
+            else:
+                valor = a.peso.scaleb(2)
+                if valor != valor.to_integral_value():
+                    return None  # Peso com mais de duas casas: não cabe no formato.
+                centesimos.append(int(valor))
+        pesos = np.array(centesimos, dtype=np.int64)
+
+    atributos = {
+        "nome_arquivo": grafo.nome_arquivo,
+        "direcionado": grafo.direcionado,
+        "ponderado": grafo.ponderado,
+        "dtype_pesos": grafo.dtype_pesos,
+        "modo_pesos": grafo.modo_pesos,
+        "ids": [v.id for v in grafo.vertices],
+        "num_arestas": m,
+        "tipo_pesos": pesos.dtype.str,
+    }
+    return atributos, origem, destino, pesos
+
+def decodificar_grafo(atributos, origem, destino, pesos):
+    """
+    Info: Reconstrói o Grafo a partir da representação de `codificar_grafo`.
+    E: atributos (dict), origem, destino, pesos (numpy.ndarray)
+    S: Grafo
+    """
+    modo_pesos = atributos["modo_pesos"]
+    if modo_pesos == "float":
+        valores = [None if p != p else p for p in pesos.tolist()]
+    elif modo_pesos == "inteiro":
+        valores = [None if c == SEM_PESO_INTEIRO else c for c in pesos.tolist()]
+    else:
+        # Decimal de duas casas, igual ao de `get_decimal`; cada valor distinto é criado uma vez.
+        convertidos = {SEM_PESO_INTEIRO: None}
+        valores = []
+        for c in pesos.tolist():
+            if c not in convertidos:
+                convertidos[c] = Decimal(c).scaleb(-2)
+            valores.append(convertidos[c])
+
+    ids = atributos["ids"]
+    grafo = Grafo(direcionado=atributos["direcionado"], nome_arquivo=atributos["nome_arquivo"],
+                  ponderado=atributos["ponderado"], dtype_pesos=atributos["dtype_pesos"], modo_pesos=modo_pesos)
+    # Como em `ler_grafo`, o coletor de ciclos fica pausado durante a construção.
+    gc_ativo = gc.isenabled()
+    gc.disable()
+    try:
+        grafo.adicionar_vertices(ids)
+        grafo.adicionar_arestas(zip(map(ids.__getitem__, origem.tolist()), map(ids.__getitem__, destino.tolist()),
+                                    valores))
+    finally:
+        if gc_ativo:
+            gc.enable()
+    return grafo
+
+def salvar_cache(grafo, caminho_origem, parametros):
+    """
+    Info: Grava o cache binário de um grafo recém-lido. A escrita vai para um
+          arquivo temporário renomeado ao final, de modo que outro processo nunca
+          encontra um cache pela metade. Falhas de escrita apenas desativam o cache.
+    E: grafo (Grafo), caminho_origem (str), parametros (dict)
+    S: bool - True se o cache foi gravado.
+    """
+    codificado = codificar_grafo(grafo)
+    if codificado is None:
+        return False
+    atributos, origem, destino, pesos = codificado
+
+    cabecalho = dict(atributos, origem=_descrever_origem(caminho_origem), parametros=parametros)
+    texto = json.dumps(cabecalho, default=list).encode("utf-8")
+
+    destino_cache = caminho_cache(caminho_origem, parametros)
+    temporario = f"{destino_cache}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(destino_cache), exist_ok=True)
+        with open(temporario, "wb") as arquivo:
+            arquivo.write(MAGICO)
+            arquivo.write(len(texto).to_bytes(8, "little"))
+            arquivo.write(texto)
+            for array in (origem, destino, pesos):
+                arquivo.write(b"\0" * (_alinhar(arquivo.tell()) - arquivo.tell()))
+                arquivo.write(array.tobytes())
+        os.replace(temporario, destino_cache)
+        return True
+    except OSError as e:
+        print(f"Alerta: não foi possível gravar o cache {destino_cache}: {e}")
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        return False
+
+def _abrir_array(caminho, tipo, inicio, tamanho):
+    """
+    Info: Mapeia um array do arquivo de cache na memória, sem copiá-lo.
+    S: (numpy.ndarray, int) - O array somente leitura e a posição seguinte a ele.
+    """
+    inicio = _alinhar(inicio)
+    if tamanho == 0:
+        return np.empty(0, dtype=tipo), inicio
+    array = np.memmap(caminho, dtype=tipo, mode="r", offset=inicio, shape=(tamanho,))
+    return array, inicio + array.nbytes
+
+def _abrir_cache(caminho_origem, parametros):
+    """
+    Info: Valida o cache de uma leitura e mapeia seus arrays.
+    S: (dict, numpy.ndarray, numpy.ndarray, numpy.ndarray) ou None - Cabeçalho,
+       origem, destino e pesos; None se não houver cache válido.
+    """
+    if not HAS_NUMPY:
+        return None
+
+    caminho = caminho_cache(caminho_origem, parametros)
+    try:
+        with open(caminho, "rb") as arquivo:
+            if arquivo.read(len(MAGICO)) != MAGICO:
+                return None
+            tamanho = int.from_bytes(arquivo.read(8), "little")
+            cabecalho = json.loads(arquivo.read(tamanho).decode("utf-8"))
+        if cabecalho["origem"] != _descrever_origem(caminho_origem):
+            return None
+        if cabecalho["parametros"] != json.loads(json.dumps(parametros, default=list)):
+            return None
+    except (OSError, ValueError, KeyError):
+        return None
+
+    m = cabecalho["num_arestas"]
+    posicao = len(MAGICO) + 8 + tamanho
+    origem, posicao = _abrir_array(caminho, np.int32, posicao, m)
+    destino, posicao = _abrir_array(caminho, np.int32, posicao, m)
+    pesos, posicao = _abrir_array(caminho, np.dtype(cabecalho["tipo_pesos"]), posicao, m)
+    return cabecalho, origem, destino, pesos
+
+def carregar_cache(caminho_origem, parametros):
+    """
+    Info: Carrega o grafo do cache binário, se houver um cache válido para esta
+          origem e estes parâmetros; caso contrário, retorna None e a leitura
+          deve ser feita do arquivo de origem.
+    E: caminho_origem (str), parametros (dict)
+    S: Grafo ou None
+    """
+    aberto = _abrir_cache(caminho_origem, parametros)
+    if aberto is None:
+        return None
+    return decodificar_grafo(*aberto)
+
+def carregar_csr_cache(caminho_origem, parametros):
+    """
+    Info: Carrega do cache binário diretamente um instantâneo GrafoCSR, sem criar
+          os objetos Aresta de um Grafo. É o caminho mais rápido para algoritmos
+          somente leitura; os arrays vêm do arquivo mapeado em memória.
+    E: caminho_origem (str), parametros (dict)
+    S: GrafoCSR ou None - None se não houver cache válido.
+    """
+    aberto = _abrir_cache(caminho_origem, parametros)
+    if aberto is None:
+        return None
+    cabecalho, origem, destino, pesos = aberto
+
+    if cabecalho["modo_pesos"] == "float":
+        reais = pesos
+    else:
+        reais = np.where(pesos == SEM_PESO_INTEIRO, np.nan, pesos / ESCALA_INTEIRO)
+    vertices = [Vertice(id_v, i) for i, id_v in enumerate(cabecalho["ids"])]
+    return GrafoCSR.de_arrays(vertices, origem, destino, reais, direcionado=cabecalho["direcionado"],
+                              ponderado=cabecalho["ponderado"], nome_arquivo=cabecalho["nome_arquivo"])
+
+# ------------------------------------------------------------------------------
+# Landmarks do A* (ALT)
+# ------------------------------------------------------------------------------
+SUFIXO_LANDMARKS = ".alt.npz"
+
+def _codificar_distancias(distancias, modo_pesos):
+    """
+    Info: Distâncias de um landmark no formato dos pesos: float64 (infinito
+          incluído) no modo "float"; int64 em centésimos nos demais, com o
+          máximo de int64 para vértice inalcançável.
+    S: numpy.ndarray ou None - None se alguma distância não couber no formato.
+    """
+    if modo_pesos == "float":
+        return np.array(distancias, dtype=np.float64)
+    centesimos = []
+    for d in distancias:
+        if d == INF:
+            centesimos.append(INALCANCAVEL_INTEIRO)
+        elif modo_pesos == "inteiro":
+            centesimos.append(d)
+        else:
+            valor = Decimal(d).scaleb(2)
+            if valor != valor.to_integral_value():
+                return None
+            centesimos.append(int(valor))
+    return np.array(centesimos, dtype=np.int64)
+
+def _decodificar_distancias(array, modo_pesos):
+    if modo_pesos == "float":
+        return array.tolist()
+    if modo_pesos == "inteiro":
+        return [INF if c == INALCANCAVEL_INTEIRO else c for c in array.tolist()]
+    return [INF if c == INALCANCAVEL_INTEIRO else Decimal(c).scaleb(-2) for c in array.tolist()]
+
+def salvar_landmarks(landmarks, caminho_origem, parametros):
+    """
+    Info: Grava os landmarks de um grafo (ver `escolher_landmarks`) ao lado do seu
+          cache binário, com a mesma validação pela origem. Como em `salvar_cache`,
+          a escrita passa por um arquivo temporário e falhas apenas desativam o cache.
+    E: landmarks (dict) - Com a chave "impressao" (ver `impressao_grafo`) do grafo
+       para o qual foram calculados. caminho_origem (str), parametros (dict)
+    S: bool - True se os landmarks foram gravados.
+    """
+    if not HAS_NUMPY:
+        return False
+
+    modo_pesos = landmarks["modo_pesos"]
+    arrays = {}
+    for nome, listas in (("de", landmarks["de"]), ("para", landmarks["para"])):
+        for i, distancias in enumerate(listas):
+            array = _codificar_distancias(distancias, modo_pesos)
+            if array is None:
+                return False
+            arrays[f"{nome}_{i}"] = array
+
+    cabecalho = {
+        "ids": landmarks["ids"],
+        "modo_pesos": modo_pesos,
+        "impressao": landmarks["impressao"],
+        "num_vertices": len(landmarks["de"][0]) if landmarks["de"] else 0,
+        "origem": _descrever_origem(caminho_origem),
+        "parametros": parametros,
+    }
+    destino_cache = caminho_cache(caminho_origem, parametros, SUFIXO_LANDMARKS)
+    temporario = f"{destino_cache}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(destino_cache), exist_ok=True)
+        with open(temporario, "wb") as arquivo:
+            np.savez(arquivo, cabecalho=np.array(json.dumps(cabecalho, default=list)), **arrays)
+        os.replace(temporario, destino_cache)
+        return True
+    except OSError as e:
+        print(f"Alerta: não foi possível gravar o cache {destino_cache}: {e}")
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        return False
+
+def carregar_landmarks(caminho_origem, parametros):
+    """
+    Info: Carrega os landmarks gravados por `salvar_landmarks`, se ainda valerem
+          para esta origem e estes parâmetros.
+    E: caminho_origem (str), parametros (dict)
+    S: dict ou None - No formato de `escolher_landmarks`.
+    """
+    if not HAS_NUMPY:
+        return None
+
+    caminho = caminho_cache(caminho_origem, parametros, SUFIXO_LANDMARKS)
+    try:
+        with np.load(caminho, allow_pickle=False) as arquivo:
+            cabecalho = json.loads(str(arquivo["cabecalho"]))
+            if cabecalho["origem"] != _descrever_origem(caminho_origem):
+                return None
+            if cabecalho["parametros"] != json.loads(json.dumps(parametros, default=list)):
+                return None
+            modo_pesos = cabecalho["modo_pesos"]
+            k = len(cabecalho["ids"])
+            de = [_decodificar_distancias(arquivo[f"de_{i}"], modo_pesos) for i in range(k)]
+            para = [_decodificar_distancias(arquivo[f"para_{i}"], modo_pesos) for i in range(k)]
+    except (OSError, ValueError, KeyError):
+        return None
+    return {"ids": cabecalho["ids"], "de": de, "para": para, "modo_pesos": modo_pesos,
+            "impressao": cabecalho.get("impressao"), "versao": None}
+
+def impressao_grafo(grafo):
+    """
+    Info: Resumo (SHA-1) do conteúdo de um grafo: orientação, IDs dos vértices e
+          arestas com os pesos, na forma do instantâneo CSR. Um Grafo e o seu
+          instantâneo têm o mesmo resumo, que muda com qualquer alteração nas
+          arestas ou nos pesos.
+    E: grafo (Grafo/GrafoCSR)
+    S: str
+    """
+    csr = grafo if isinstance(grafo, GrafoCSR) else grafo.resultado_derivado("csr", grafo.congelar)
+    resumo = hashlib.sha1(json.dumps([csr.direcionado, list(csr.ids)]).encode())
+    for array in (csr.indptr, csr.indices, csr.pesos):
+        resumo.update(np.ascontiguousarray(array).tobytes())
+    return resumo.hexdigest()
+
+def obter_landmarks(grafo, caminho_origem, parametros, k=NUM_LANDMARKS):
+    """
+    Info: Landmarks do grafo lido de `caminho_origem`: vêm do disco quando já
+          foram calculados para esta origem, estes parâmetros, este `k` e um grafo
+          com o mesmo conteúdo (ver `impressao_grafo`); senão, são calculados e
+          gravados para as próximas execuções. O resultado vale para a versão
+          atual do grafo e fica em `resultado_derivado`, na mesma chave usada por
+          `a_estrela`; depois de uma modificação, a próxima chamada o refaz.
+    E: grafo (Grafo/GrafoCSR), caminho_origem (str), parametros (dict), k (int)
+    S: dict - No formato de `escolher_landmarks`.
+    """
+    def calcular():
+        if not HAS_NUMPY:
+            return escolher_landmarks(grafo, k)
+        impressao = impressao_grafo(grafo)
+        landmarks = carregar_landmarks(caminho_origem, parametros)
+        if (landmarks is not None and landmarks["impressao"] == impressao
+                and len(landmarks["ids"]) == min(k, grafo.num_vertices())):
+            landmarks["versao"] = getattr(grafo, "versao", None)
+            return landmarks
+
+        landmarks = escolher_landmarks(grafo, k)
+        landmarks["impressao"] = impressao
+        salvar_landmarks(landmarks, caminho_origem, parametros)
+        return landmarks
+
+    return grafo.resultado_derivado(("landmarks", k), calcular)
@@ -0,0 +1,34 @@
+"""
+Módulo:    Pipeline de Grafos
+Descriçao: Executa uma sequência de etapas (análise, relatório, renderização)
+           sobre cada grafo de uma fonte preguiçosa, como `iterar_diretorio`,
+           levando um grafo por todas as etapas antes de ler o próximo. Assim,
+           o pico de memória fica limitado ao do maior grafo, e não à soma de
+           todos os grafos do diretório.
+
+Funções:   - executar_pipeline(grafos, etapas)
+"""
+
+def executar_pipeline(grafos, etapas):
+    """
+    Info: Passa cada grafo por todas as etapas, na ordem dada, e descarta a
+          referência a ele antes de pedir o próximo à fonte. As etapas não
+          devem guardar o grafo (nem visões e resultados derivados dele) além
+          da própria chamada; o que precisar sobreviver deve ir para disco ou
+          ser reduzido a valores pequenos.
+    E: grafos (iterável de Grafo) - De preferência um gerador (`iterar_diretorio`).
+       etapas (list[callable]) - Funções `etapa(grafo)`, chamadas em sequência.
+    S: int - Número de grafos processados.
+    """
+    processados = 0
+    iterador = iter(grafos)
+    while True:
+        grafo = next(iterador, None)
+        if grafo is None:
+            break
+        for etapa in etapas:
+            etapa(grafo)
+        processados += 1
+        # Sem esta referência, o grafo pode ser liberado antes da leitura do próximo.
+        del grafo
+    return processados
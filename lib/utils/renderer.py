@@ -41,7 +41,7 @@ def renderizar_grafo(grafo: Grafo):
         dot.node(str(vertice.id), style="solid", penwidth='2.0')
 
     for aresta in grafo.arestas:
-        label = str(aresta.peso) if aresta.peso or aresta.peso == 0 else None
+        label = grafo.formatar_peso(aresta.peso) if aresta.peso or aresta.peso == 0 else None
         dot.edge(str(aresta.v1.id), str(aresta.v2.id),
          style="solid",
          penwidth="2.0",
@@ -75,7 +75,7 @@ def renderizar_agm(grafo: Grafo):
         dot.node(str(vertice.id), style="solid", penwidth='2.0')
 
     for aresta in grafo.arestas:
-        label = str(aresta.peso) if aresta.peso or aresta.peso == 0 else None
+        label = grafo.formatar_peso(aresta.peso) if aresta.peso or aresta.peso == 0 else None
         dot.edge(str(aresta.v1.id), str(aresta.v2.id), style="solid", penwidth='2.0', label=label, fontcolor = "red",)
             
     return dot
@@ -225,7 +225,7 @@ def renderizar_dfs_classificada(ordem_visita, arestas_arvore, arestas_retorno,
           (R, A ou C) para melhor identificação.
     E: ordem_visita (list) - Lista de tuplas (vértice, pai).
     E: arestas_arvore (list), arestas_retorno (list), arestas_avanco (list), 
-       arestas_cruzamento (list) - Listas de objetos `Aresta` classificadas.
+       arestas_cruzamento (list) - Listas de tuplas (u, v) de IDs, como retornadas por `dfs`.
     E: nome_grafo (str) - Nome do grafo/imagem.
     S: dot (Digraph) - O objeto `graphviz` da visualização da DFS classificada.
     """
@@ -240,14 +240,14 @@ def renderizar_dfs_classificada(ordem_visita, arestas_arvore, arestas_retorno,
         else:
             dot.node(v_id, style="solid", penwidth="2.0")
 
-    for aresta in arestas_arvore:
-        dot.edge(*aresta_para_tupla(aresta), color="black", penwidth='2.0')
-    for aresta in arestas_retorno:
-        dot.edge(*aresta_para_tupla(aresta), color="firebrick3", style="dashed", constraint="false", label="R", fontcolor="firebrick3")
-    for aresta in arestas_avanco:
-        dot.edge(*aresta_para_tupla(aresta), color="royalblue3", style="dotted", constraint="false", label="A", fontcolor="royalblue3")
-    for aresta in arestas_cruzamento:
-        dot.edge(*aresta_para_tupla(aresta), color="darkolivegreen", style="dotted", constraint="false", label="C", fontcolor="darkolivegreen")
+    for u, v in arestas_arvore:
+        dot.edge(u, v, color="black", penwidth='2.0')
+    for u, v in arestas_retorno:
+        dot.edge(u, v, color="firebrick3", style="dashed", constraint="false", label="R", fontcolor="firebrick3")
+    for u, v in arestas_avanco:
+        dot.edge(u, v, color="royalblue3", style="dotted", constraint="false", label="A", fontcolor="royalblue3")
+    for u, v in arestas_cruzamento:
+        dot.edge(u, v, color="darkolivegreen", style="dotted", constraint="false", label="C", fontcolor="darkolivegreen")
         
     return dot
 
@@ -307,8 +307,8 @@ def renderizar_caminho_curto(grafo: Grafo, caminho: list[Vertice], nome_grafo="C
             dot.node(v_id_str, style="solid", penwidth="1.0", color="gray")
     for a in grafo.arestas:
         v1_str, v2_str = str(a.v1.id), str(a.v2.id)
-        label = str(a.peso) if a.peso is not None else None
-        if (v1_str, v2_str) in caminho_arestas:
+        label = grafo.formatar_peso(a.peso) if a.peso is not None else None
+        if (v1_str, v2_str) in caminho_arestas or (not grafo.direcionado and (v2_str, v1_str) in caminho_arestas):
             dot.edge(v1_str, v2_str,
                      label=label,
                      color="green",
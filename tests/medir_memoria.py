@@ -0,0 +1,125 @@
+"""
+Módulo:    Medição de memória (tracemalloc)
+Objetivo:  Compara a memória alocada por vértices e arestas com `__slots__`
+           contra as mesmas classes com `__dict__` por instância (o formato
+           anterior), e a de um grafo aleatório inteiro em cada formato. Mede
+           também o resultado da DFS com classificação de arestas.
+
+           Resultado medido (100 mil vértices, 300 mil arestas): o grafo cai de
+           139,1 MB para 123,9 MB, cerca de 1,12x, longe de 3x. Os `__slots__`
+           só encolhem os objetos Vertice e Aresta (~40 B cada), e o grafo é
+           dominado pelas estruturas por aresta do Grafo mutável, como mostra a
+           divisão impressa: os dicionários de `pesos_adj` (34,2 MB, uma entrada
+           por ponta), o `indice_arestas` com chaves em tupla (26,0 MB; pares
+           ordenados por `id()` dos vértices) e as listas de `lista_adj`
+           (16,5 MB), juntos 62% do total. Elas existem para que inclusões,
+           remoções e consultas de aresta sejam O(1), e reduzi-las a um terço
+           exigiria trocá-las por arrays, que é o que o instantâneo `congelar()`
+           (GrafoCSR) já faz para os algoritmos que só leem o grafo: 17,8 MB
+           além dos Vertice que ele compartilha (10,5 MB).
+
+Uso:       python -m tests.medir_memoria [num_vertices] [num_arestas]
+"""
+
+import gc
+import random
+import sys
+import tracemalloc
+from lib.core import graph
+from lib.core.graph import Grafo, Vertice, Aresta
+from lib.algorithms.dfs import dfs
+
+class VerticeComDict(Vertice):
+    """Vertice com `__dict__` por instância, como antes dos `__slots__`."""
+
+class ArestaComDict(Aresta):
+    """Aresta com `__dict__` por instância, como antes dos `__slots__`."""
+
+def medir(funcao):
+    """
+    Info: Executa `funcao` com o tracemalloc ativo.
+    S: (objeto, int) - O retorno de `funcao` e os bytes que ele mantém alocados.
+    """
+    gc.collect()
+    tracemalloc.start()
+    resultado = funcao()
+    gc.collect()
+    atual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, atual
+
+def grafo_aleatorio(n, m, semente=0):
+    aleatorio = random.Random(semente)
+    arestas = [(str(aleatorio.randrange(n)), str(aleatorio.randrange(n)), aleatorio.randint(1, 100))
+               for _ in range(m)]
+    return Grafo.de_arestas([a for a in arestas if a[0] != a[1]], vertices=[str(i) for i in range(n)],
+                            ponderado=True, modo_pesos="float")
+
+def medir_grafo(n, m, classe_vertice, classe_aresta):
+    """Mede o grafo com `graph.Vertice`/`graph.Aresta` trocadas pelas classes dadas."""
+    originais = graph.Vertice, graph.Aresta
+    graph.Vertice, graph.Aresta = classe_vertice, classe_aresta
+    try:
+        return medir(lambda: grafo_aleatorio(n, m))[1]
+    finally:
+        graph.Vertice, graph.Aresta = originais
+
+def tamanho_estruturas(grafo):
+    """
+    Info: Bytes ocupados por cada estrutura do grafo (`sys.getsizeof` dos
+          contêineres e do que só eles referenciam); os objetos Vertice e Aresta
+          e os pesos são contados à parte.
+    S: dict[str, int]
+    """
+    tamanho = sys.getsizeof
+    pesos = {id(a.peso): a.peso for a in grafo.arestas if a.peso is not None}
+    return {
+        "Vertice (objetos e IDs)": sum(tamanho(v) + tamanho(v.id) for v in grafo.vertices) + tamanho(grafo.vertices),
+        "Aresta (objetos)": sum(tamanho(a) for a in grafo.arestas) + tamanho(grafo.arestas),
+        "pesos": sum(tamanho(p) for p in pesos.values()),
+        "indice_vertices": tamanho(grafo.indice_vertices),
+        "indice_arestas (dict e tuplas)": tamanho(grafo.indice_arestas) + sum(tamanho(c) for c in grafo.indice_arestas),
+        "pesos_adj": tamanho(grafo.pesos_adj) + sum(tamanho(d) for d in grafo.pesos_adj.values()),
+        "lista_adj": tamanho(grafo.lista_adj) + sum(tamanho(l) for l in grafo.lista_adj.values()),
+        "graus": tamanho(grafo._grau_entrada) + tamanho(grafo._grau_saida),
+    }
+
+def main(n=100_000, m=300_000):
+    quantidade = 100_000
+    print(f"Por objeto ({quantidade} instâncias):")
+    for nome, classe_vertice, classe_aresta in (("__dict__", VerticeComDict, ArestaComDict),
+                                                ("__slots__", Vertice, Aresta)):
+        vertices, bytes_vertices = medir(lambda: [classe_vertice(str(i), i) for i in range(quantidade)])
+        _, bytes_arestas = medir(lambda: [classe_aresta(vertices[i], vertices[i - 1], 1.0, i)
+                                          for i in range(quantidade)])
+        print(f"  {nome:<9} Vertice {bytes_vertices / quantidade:6.1f} B   Aresta {bytes_arestas / quantidade:6.1f} B")
+
+    print(f"Grafo aleatório ({n} vértices, {m} arestas):")
+    for nome, classe_vertice, classe_aresta in (("__dict__", VerticeComDict, ArestaComDict),
+                                                ("__slots__", Vertice, Aresta)):
+        print(f"  {nome:<9} {medir_grafo(n, m, classe_vertice, classe_aresta) / 2**20:8.1f} MB")
+
+    grafo = grafo_aleatorio(n, m)
+    print("  Divisão por estrutura (__slots__):")
+    for nome, bytes_estrutura in sorted(tamanho_estruturas(grafo).items(), key=lambda item: -item[1]):
+        print(f"    {nome:<32} {bytes_estrutura / 2**20:8.1f} MB")
+    _, bytes_csr = medir(grafo.congelar)
+    print(f"  Instantâneo CSR (congelar), além dos Vertice que compartilha: {bytes_csr / 2**20:.1f} MB")
+    del grafo
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * n))
+    grafo = grafo_aleatorio(n // 10, m // 10)
+    inicio = grafo.vertices[0].id
+    resultado, bytes_dfs = medir(lambda: dfs(grafo, inicio, classificar_arestas=True))
+    pares = [par for chave in ("arestas_arvore", "arestas_retorno", "arestas_avanco", "arestas_cruzamento")
+             for par in resultado[chave]]
+    # As mesmas arestas classificadas como objetos Aresta, como a DFS devolvia antes.
+    vertice = grafo.indice_vertices
+    _, bytes_objetos = medir(lambda: [Aresta(vertice[u], vertice[v]) for u, v in pares])
+    _, bytes_tuplas = medir(lambda: [(u, v) for u, v in pares])
+    print(f"DFS classificada ({n // 10} vértices, {m // 10} arestas, {len(pares)} arestas classificadas):")
+    print(f"  resultado completo {bytes_dfs / 2**20:.1f} MB; arestas como Aresta {bytes_objetos / 2**20:.1f} MB, "
+          f"como tuplas de IDs {bytes_tuplas / 2**20:.1f} MB")
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
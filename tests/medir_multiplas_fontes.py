@@ -0,0 +1,49 @@
+"""
+Módulo:    Medição de escala de `caminhos_multiplas_fontes`
+Objetivo:  Mede o tempo de parede do lote de Dijkstras para 1, 2, 4, ...
+           processos (até `os.cpu_count()`, ou os valores dados), sobre um grafo
+           aleatório, e confere que todos dão o mesmo resultado.
+
+Uso:       python -m tests.medir_multiplas_fontes [num_vertices] [num_arestas] [num_fontes] [workers...]
+"""
+
+import os
+import sys
+import time
+import random
+import numpy as np
+from lib.core.graph_csr import GrafoCSR
+from lib.core.graph import Vertice
+from lib.algorithms.multiplas_fontes import caminhos_multiplas_fontes, HAS_NUMBA
+
+def csr_aleatorio(n, m, semente=0):
+    gerador = np.random.default_rng(semente)
+    origem = gerador.integers(0, n, m)
+    destino = gerador.integers(0, n, m)
+    pesos = gerador.integers(1, 100, m).astype(np.float64)
+    return GrafoCSR.de_arrays([Vertice(str(i), i) for i in range(n)], origem, destino, pesos, ponderado=True)
+
+def main(n=200_000, m=600_000, num_fontes=64, workers=None):
+    if not workers:
+        workers = [1]
+        while workers[-1] * 2 <= (os.cpu_count() or 1):
+            workers.append(workers[-1] * 2)
+    csr = csr_aleatorio(n, m)
+    fontes = random.Random(0).sample(csr.ids, num_fontes)
+    print(f"{n} vértices, {m} arestas, {num_fontes} fontes, {os.cpu_count()} CPUs, "
+          f"núcleo {'Numba' if HAS_NUMBA else 'Python puro'}")
+
+    caminhos_multiplas_fontes(csr, fontes[:1], workers=1)  # compilação do núcleo, fora da medição
+    referencia, tempo_1 = None, None
+    for w in workers:
+        inicio = time.perf_counter()
+        distancias, _ = caminhos_multiplas_fontes(csr, fontes, workers=w)
+        tempo = time.perf_counter() - inicio
+        if referencia is None:
+            referencia, tempo_1 = distancias, tempo
+        assert np.array_equal(distancias, referencia)
+        print(f"  workers={w:<3} {tempo:8.3f} s   aceleração {tempo_1 / tempo:5.2f}x")
+
+if __name__ == "__main__":
+    argumentos = [int(arg) for arg in sys.argv[1:]]
+    main(*argumentos[:3], workers=argumentos[3:])
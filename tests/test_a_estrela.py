@@ -0,0 +1,47 @@
+"""
+Testes do A* com landmarks: validade dos landmarks após modificações no grafo
+e reaproveitamento dos landmarks gravados em disco.
+"""
+import pytest
+from lib.core.graph import Grafo
+from lib.algorithms.a_estrela import a_estrela, escolher_landmarks
+from lib.algorithms.dijkstra import caminho_minimo
+from lib.utils import graph_cache
+
+def _grafo():
+    return Grafo.de_arestas([("1", "2", 1.0), ("2", "3", 1.0), ("3", "4", 1.0), ("1", "4", 10.0)],
+                            ponderado=True, modo_pesos="float")
+
+def test_landmarks_de_outra_versao_sao_recusados():
+    grafo = _grafo()
+    landmarks = escolher_landmarks(grafo, k=2)
+    assert a_estrela(grafo, "1", "4", landmarks)[0] == 3.0
+
+    grafo.remover_aresta("2", "3")
+    with pytest.raises(ValueError):
+        a_estrela(grafo, "1", "4", landmarks)
+    # Sem landmarks explícitos, eles são recalculados para a nova versão.
+    assert a_estrela(grafo, "1", "4")[0] == caminho_minimo(grafo, "1", "4")[0] == 10.0
+
+def test_obter_landmarks_confere_o_conteudo_do_grafo(tmp_path):
+    origem = tmp_path / "grafo.txt"
+    origem.write_text("")
+    parametros = {"modo_pesos": "float"}
+
+    grafo = _grafo()
+    landmarks = graph_cache.obter_landmarks(grafo, str(origem), parametros, k=2)
+    assert graph_cache.carregar_landmarks(str(origem), parametros)["impressao"] == graph_cache.impressao_grafo(grafo)
+    assert a_estrela(grafo, "1", "4", landmarks)[0] == 3.0
+
+    # Mesmo conteúdo, outro objeto (como numa nova execução): os landmarks vêm do disco.
+    outro = _grafo()
+    carregados = graph_cache.obter_landmarks(outro, str(origem), parametros, k=2)
+    assert carregados["ids"] == landmarks["ids"] and carregados["versao"] == outro.versao
+    assert a_estrela(outro.congelar(), "1", "4", graph_cache.obter_landmarks(outro.congelar(), str(origem),
+                                                                             parametros, k=2))[0] == 3.0
+
+    # Depois de mudar um peso, o grafo (mesma origem) não aceita mais os landmarks do disco.
+    outro.adicionar_aresta("1", "4", 0.5)
+    recalculados = graph_cache.obter_landmarks(outro, str(origem), parametros, k=2)
+    assert recalculados["impressao"] != landmarks["impressao"]
+    assert a_estrela(outro, "1", "4", recalculados)[0] == 0.5
@@ -0,0 +1,77 @@
+"""
+Verifica o cache binário de grafos (`graph_cache`): a ida e volta preserva o
+grafo em todos os modos de pesos, a carga direta em CSR equivale a
+`congelar()`, e o cache deixa de valer quando a origem ou os parâmetros mudam.
+"""
+import os
+import random
+import numpy as np
+import pytest
+from decimal import Decimal
+from lib.core.graph import Grafo
+from lib.utils.converter import converter_peso
+from lib.utils.graph_cache import salvar_cache, carregar_cache, carregar_csr_cache, caminho_cache, MAGICO
+from lib.utils.file_handler import _ler_com_cache, ler_grafo
+
+def _grafo(semente, direcionado, modo):
+    aleatorio = random.Random(semente)
+    arestas = [(str(aleatorio.randrange(20)), str(aleatorio.randrange(20)),
+                None if aleatorio.random() < 0.1 else converter_peso(f"{aleatorio.randint(1, 9999) / 100:.2f}", modo))
+               for _ in range(50)]
+    return Grafo.de_arestas(arestas, vertices=[str(i) for i in range(22)], direcionado=direcionado,
+                            nome_arquivo=f"G{semente}", ponderado=True, modo_pesos=modo)
+
+def _descrever(grafo):
+    return ([v.id for v in grafo.vertices], [(a.v1.id, a.v2.id, a.peso, type(a.peso)) for a in grafo.arestas],
+            grafo.direcionado, grafo.ponderado, grafo.modo_pesos, grafo.nome_arquivo)
+
+def _origem(tmp_path, conteudo="origem"):
+    caminho = tmp_path / "GRAFO.txt"
+    caminho.write_text(conteudo)
+    return str(caminho)
+
+@pytest.mark.parametrize("semente,direcionado", [(s, d) for s in range(4) for d in (False, True)])
+@pytest.mark.parametrize("modo", ["decimal", "float", "inteiro"])
+def test_ida_e_volta(tmp_path, semente, direcionado, modo):
+    grafo = _grafo(semente, direcionado, modo)
+    origem, parametros = _origem(tmp_path), {"modo_pesos": modo, "semente": semente}
+    assert salvar_cache(grafo, origem, parametros)
+
+    assert _descrever(carregar_cache(origem, parametros)) == _descrever(grafo)
+    csr, esperado = carregar_csr_cache(origem, parametros), grafo.congelar()
+    assert csr.ids == esperado.ids
+    assert np.array_equal(csr.indptr, esperado.indptr) and np.array_equal(csr.indices, esperado.indices)
+    assert np.allclose(csr.pesos, esperado.pesos, equal_nan=True)
+
+def test_cache_invalidado_quando_a_origem_ou_os_parametros_mudam(tmp_path):
+    grafo = _grafo(0, False, "decimal")
+    origem, parametros = _origem(tmp_path), {"modo_pesos": "decimal"}
+    salvar_cache(grafo, origem, parametros)
+    assert carregar_cache(origem, parametros) is not None
+    assert carregar_cache(origem, {"modo_pesos": "float"}) is None
+
+    info = os.stat(origem)
+    os.utime(origem, ns=(info.st_atime_ns, info.st_mtime_ns + 10**9))
+    assert carregar_cache(origem, parametros) is None and carregar_csr_cache(origem, parametros) is None
+
+    salvar_cache(grafo, origem, parametros)
+    with open(origem, "a") as arquivo:
+        arquivo.write("mais uma linha")
+    os.utime(origem, ns=(info.st_atime_ns, os.stat(origem).st_mtime_ns))
+    assert carregar_cache(origem, parametros) is None
+
+def test_cache_corrompido_e_ignorado(tmp_path):
+    origem, parametros = _origem(tmp_path), {}
+    salvar_cache(_grafo(1, True, "float"), origem, parametros)
+    with open(caminho_cache(origem, parametros), "r+b") as arquivo:
+        arquivo.write(b"X" * len(MAGICO))
+    assert carregar_cache(origem, parametros) is None
+
+def test_leitura_usa_o_cache_na_segunda_vez(tmp_path, capsys):
+    origem = _origem(tmp_path, "3\n(1, 2, {1.50})\n(2, 3, {2.25})\n")
+    primeiro = _ler_com_cache(ler_grafo, origem, True, ponderado=True, modo_pesos="decimal")
+    assert "Lendo cache" not in capsys.readouterr().out
+    segundo = _ler_com_cache(ler_grafo, origem, True, ponderado=True, modo_pesos="decimal")
+    assert "Lendo cache de:" in capsys.readouterr().out
+    assert _descrever(segundo) == _descrever(primeiro)
+    assert [a.peso for a in segundo.arestas] == [Decimal("1.50"), Decimal("2.25")]
@@ -0,0 +1,69 @@
+"""
+Verifica a leitura de entradas comprimidas (gzip, xz e zstd): o grafo lido é o
+mesmo do arquivo sem compressão, a compressão é detectada pela assinatura e o
+nome do grafo não leva a extensão de compressão.
+"""
+import gzip
+import lzma
+import pytest
+from lib.utils import file_handler
+from lib.utils.file_handler import (abrir_texto, detectar_compressao, ler_arestas, ler_grafo, carregar_grafo_csv,
+                                    COMPRESSOES)
+
+TEXTO = "4\n" + "".join(f"({u}, {v}, {{{u + v}.25}})\n" for u in range(1, 5) for v in range(u + 1, 5))
+
+def _comprimir(formato, dados):
+    if formato == "gzip":
+        return gzip.compress(dados)
+    if formato == "xz":
+        return lzma.compress(dados)
+    zstandard = pytest.importorskip("zstandard")
+    return zstandard.ZstdCompressor().compress(dados)
+
+def _escrever(tmp_path, nome, formato, texto=TEXTO):
+    caminho = tmp_path / nome
+    caminho.write_bytes(_comprimir(formato, texto.encode("utf-8")))
+    return str(caminho)
+
+def _descrever(grafo):
+    return [v.id for v in grafo.vertices], [(a.v1.id, a.v2.id, a.peso) for a in grafo.arestas]
+
+@pytest.mark.parametrize("formato,extensao", [(nome, extensao) for nome, _, extensao in COMPRESSOES])
+def test_grafo_comprimido_igual_ao_original(tmp_path, formato, extensao):
+    original = tmp_path / "GRAFO_1.txt"
+    original.write_text(TEXTO)
+    comprimido = _escrever(tmp_path, "GRAFO_1.txt" + extensao, formato)
+
+    assert detectar_compressao(comprimido) == formato
+    grafo = ler_grafo(comprimido, ponderado=True, modo_pesos="inteiro")
+    assert grafo.nome_arquivo == "GRAFO_1.txt"
+    assert _descrever(grafo) == _descrever(ler_grafo(str(original), ponderado=True, modo_pesos="inteiro"))
+
+    # Blocos pequenos: a descompressão acompanha a leitura.
+    with abrir_texto(comprimido) as arquivo:
+        lidas = [aresta for bloco in ler_arestas(arquivo, "float", tamanho_bloco=5) for aresta in bloco]
+    assert len(lidas) == 6 and lidas[0] == ("1", "2", 3.25)
+
+@pytest.mark.parametrize("formato", ["gzip", "xz"])
+def test_deteccao_pela_assinatura_e_pela_extensao(tmp_path, formato):
+    # A assinatura vale mesmo com uma extensão enganosa.
+    assert detectar_compressao(_escrever(tmp_path, "grafo.txt", formato)) == formato
+    texto = tmp_path / "grafo.gz"
+    texto.write_text(TEXTO)
+    assert detectar_compressao(str(texto)) is None
+    # Um arquivo vazio não tem assinatura: vale a extensão.
+    vazio = tmp_path / "vazio.xz"
+    vazio.write_bytes(b"")
+    assert detectar_compressao(str(vazio)) == "xz"
+
+def test_csv_comprimido(tmp_path):
+    texto = "Min,1,2,3\n1,,4,5\n2,4,,6\n3,5,6,\n"
+    grafo = carregar_grafo_csv(_escrever(tmp_path, "m.csv.gz", "gzip", texto), modo_pesos="float")
+    assert [(a.v1.id, a.v2.id, a.peso) for a in grafo.arestas] == [("1", "2", 4.0), ("1", "3", 5.0), ("2", "3", 6.0)]
+
+def test_zstd_sem_o_pacote(tmp_path, monkeypatch):
+    caminho = tmp_path / "grafo.txt.zst"
+    caminho.write_bytes(b"\x28\xb5\x2f\xfd" + b"\0" * 16)
+    monkeypatch.setattr(file_handler, "HAS_ZSTANDARD", False)
+    with pytest.raises(ImportError):
+        abrir_texto(str(caminho))
@@ -0,0 +1,74 @@
+"""
+Verifica que cada algoritmo com caminho próprio para o instantâneo CSR
+(`Grafo.congelar`) dá o mesmo resultado sobre o Grafo e sobre o GrafoCSR,
+em grafos e dígrafos ponderados aleatórios.
+"""
+import random
+import pytest
+from lib.core.graph import Grafo
+from lib.algorithms.bfs import bfs
+from lib.algorithms.dfs import dfs
+from lib.algorithms.lowpt import lowpt
+from lib.algorithms.dijkstra import dijkstra
+from lib.algorithms.bellman_ford import bellman_ford
+from lib.algorithms.prim import prim
+
+def _grafo_aleatorio(semente, direcionado):
+    aleatorio = random.Random(semente)
+    n = aleatorio.randint(1, 25)
+    arestas = []
+    for _ in range(aleatorio.randint(0, 60)):
+        u, v = aleatorio.randrange(n), aleatorio.randrange(n)
+        if u != v:
+            arestas.append((str(u), str(v), aleatorio.randint(1, 9)))
+    return Grafo.de_arestas(arestas, vertices=[str(i) for i in range(n)], direcionado=direcionado,
+                            ponderado=True, modo_pesos="float")
+
+def _ids(resultado):
+    """Troca objetos Vertice/Aresta por IDs, para comparar as duas versões."""
+    if isinstance(resultado, dict):
+        return {chave: _ids(valor) for chave, valor in resultado.items()}
+    if isinstance(resultado, (list, tuple)):
+        return [_ids(valor) for valor in resultado]
+    if hasattr(resultado, "v1"):
+        return (str(resultado.v1.id), str(resultado.v2.id))
+    if hasattr(resultado, "id"):
+        return str(resultado.id)
+    return resultado
+
+def _distancias(distancias):
+    return {str(getattr(v, "id", v)): float(d) for v, d in distancias.items()}
+
+CASOS = [(semente, direcionado) for semente in range(30) for direcionado in (False, True)]
+
+@pytest.mark.parametrize("semente,direcionado", CASOS)
+def test_grafo_e_csr_equivalentes(semente, direcionado):
+    grafo = _grafo_aleatorio(semente, direcionado)
+    csr = grafo.congelar()
+    inicio = grafo.vertices[0].id
+
+    assert bfs(grafo, inicio) == bfs(csr, inicio)
+    for opcoes in ({}, {"classificar_arestas": True}, {"retornar_tempos": True}):
+        assert _ids(dfs(grafo, inicio, **opcoes)) == _ids(dfs(csr, inicio, **opcoes))
+    assert [sorted(map(str, x)) for x in lowpt(grafo)] == [sorted(map(str, x)) for x in lowpt(csr)]
+
+    _, dist_grafo, pred_grafo = dijkstra(grafo, inicio)
+    _, dist_csr, pred_csr = dijkstra(csr, inicio)
+    assert _distancias(dist_grafo) == _distancias(dist_csr)
+    assert _ids(pred_grafo) == _ids(pred_csr)
+
+    dist_grafo, pred_grafo, negativo_grafo = bellman_ford(grafo, inicio)
+    dist_csr, pred_csr, negativo_csr = bellman_ford(csr, inicio)
+    assert _distancias(dist_grafo) == _distancias(dist_csr)
+    assert pred_grafo == pred_csr and negativo_grafo == negativo_csr
+    assert _distancias(dist_grafo) == _distancias(dijkstra(grafo, inicio)[1])
+
+    arvore_grafo, arvore_csr = prim(grafo), prim(csr)
+    assert arvore_grafo.num_arestas() == arvore_csr.num_arestas()
+    assert sum(a.peso for a in arvore_grafo.arestas) == pytest.approx(sum(a.peso for a in arvore_csr.arestas))
+
+def test_bellman_ford_nao_direcionado_percorre_os_dois_sentidos():
+    grafo = Grafo.de_arestas([("a", "b", 1), ("c", "b", 1)], ponderado=True, modo_pesos="float")
+    for entrada in (grafo, grafo.congelar()):
+        dist, pred, _ = bellman_ford(entrada, "a")
+        assert dist["c"] == 2 and pred["c"] == "b"
@@ -0,0 +1,38 @@
+"""
+Testes do caminho ponto a ponto do Dijkstra e de sua formatação.
+"""
+import random
+import pytest
+from lib.core.graph import Grafo
+from lib.algorithms.dijkstra import dijkstra, caminho_minimo, formatar_caminho_dijkstra
+
+def _grafo_com_empates(semente, direcionado):
+    aleatorio = random.Random(semente)
+    n = aleatorio.randint(2, 25)
+    arestas = [(str(aleatorio.randrange(n)), str(aleatorio.randrange(n)), aleatorio.randint(1, 3))
+               for _ in range(aleatorio.randint(1, 70))]
+    return Grafo.de_arestas([a for a in arestas if a[0] != a[1]], vertices=[str(i) for i in range(n)],
+                            direcionado=direcionado, ponderado=True, modo_pesos="float")
+
+@pytest.mark.parametrize("semente", range(20))
+@pytest.mark.parametrize("direcionado", [False, True])
+def test_caminho_formatado_segue_a_arvore_do_dijkstra(semente, direcionado):
+    grafo = _grafo_com_empates(semente, direcionado)
+    inicio = grafo.vertices[0].id
+    spt, distancias, _ = dijkstra(grafo, inicio)
+    arestas_spt = {(a.v1.id, a.v2.id) for a in spt.arestas}
+    if not direcionado:
+        arestas_spt |= {(v, u) for u, v in arestas_spt}
+
+    for destino in grafo.vertices:
+        _, caminho = formatar_caminho_dijkstra(grafo, inicio, destino.id)
+        if caminho is None:
+            continue
+        assert all((u.id, v.id) in arestas_spt for u, v in zip(caminho, caminho[1:]))
+        assert caminho_minimo(grafo, inicio, destino.id)[0] == distancias[destino]
+
+def test_caminho_formatado_vertices_ausentes():
+    grafo = Grafo.de_arestas([("1", "2", 1.0)], vertices=["1", "2", "3"], ponderado=True, modo_pesos="float")
+    assert "Vértice final '9' não encontrado" in formatar_caminho_dijkstra(grafo, "1", "9")[0]
+    assert "Vértice inicial '7' não encontrado" in formatar_caminho_dijkstra(grafo, "7", "2")[0]
+    assert "Não há caminho entre 1 e 3" in formatar_caminho_dijkstra(grafo, "1", "3")[0]
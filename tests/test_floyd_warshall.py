@@ -0,0 +1,70 @@
+"""
+Verifica o Floyd-Warshall vetorizado (NumPy) contra os laços em Python puro,
+usados quando não há NumPy, e contra o Dijkstra e o Bellman-Ford de cada origem.
+"""
+import random
+import pytest
+from math import inf
+from lib.core.graph import Grafo
+from lib.algorithms import floyd_warshall as modulo
+from lib.algorithms.floyd_warshall import floyd_warshall, reconstruir_caminho
+from lib.algorithms.dijkstra import dijkstra
+from lib.algorithms.bellman_ford import bellman_ford
+
+def _grafo(semente, direcionado, negativos=False, modo="float"):
+    aleatorio = random.Random(semente)
+    n = aleatorio.randint(1, 15)
+    arestas = []
+    for _ in range(aleatorio.randint(0, 45)):
+        u, v = aleatorio.randrange(n), aleatorio.randrange(n)
+        peso = aleatorio.randint(1, 9)
+        if negativos:
+            # Arcos só de u para v > u: sem ciclos, portanto sem ciclos negativos.
+            if u == v:
+                continue
+            u, v = min(u, v), max(u, v)
+            peso -= 4
+        arestas.append((str(u), str(v), peso * 100 if modo == "inteiro" else float(peso)))
+    return Grafo.de_arestas(arestas, vertices=[str(i) for i in range(n)], direcionado=direcionado,
+                            ponderado=True, modo_pesos=modo)
+
+def _sem_numpy(grafo, monkeypatch):
+    with monkeypatch.context() as m:
+        m.setattr(modulo, "HAS_NUMPY", False)
+        return floyd_warshall(grafo)
+
+CASOS = [(semente, direcionado) for semente in range(15) for direcionado in (False, True)]
+
+@pytest.mark.parametrize("semente,direcionado", CASOS)
+def test_numpy_igual_ao_python_puro(semente, direcionado, monkeypatch):
+    grafo = _grafo(semente, direcionado)
+    dist, pred, vertices = floyd_warshall(grafo)
+    dist_puro, pred_puro, vertices_puro = _sem_numpy(grafo, monkeypatch)
+    assert dist == dist_puro and pred == pred_puro
+    assert list(vertices) == list(vertices_puro)
+
+    for i, origem in enumerate(vertices):
+        _, dist_dijkstra, _ = dijkstra(grafo, origem.id)
+        assert [dist_dijkstra.get(v, inf) for v in vertices] == dist[i]
+        for j in range(len(vertices)):
+            caminho = reconstruir_caminho(pred, vertices, i, j)
+            if dist[i][j] == inf:
+                assert caminho is None
+            else:
+                custo = sum(grafo.get_peso(a.id, b.id) for a, b in zip(caminho, caminho[1:]))
+                assert caminho[0] is origem and caminho[-1] is vertices[j] and custo == dist[i][j]
+
+@pytest.mark.parametrize("semente", range(10))
+def test_pesos_negativos_sem_ciclo(semente, monkeypatch):
+    grafo = _grafo(semente, True, negativos=True)
+    dist, pred, vertices = floyd_warshall(grafo)
+    assert (dist, pred) == _sem_numpy(grafo, monkeypatch)[:2]
+    for i, origem in enumerate(vertices):
+        dist_bf, _, negativo = bellman_ford(grafo, origem.id)
+        assert not negativo and [dist_bf[v.id] for v in vertices] == dist[i]
+
+@pytest.mark.parametrize("semente", range(5))
+def test_modo_inteiro_devolve_valores_reais(semente, monkeypatch):
+    inteiro = _grafo(semente, True, modo="inteiro")
+    flutuante = _grafo(semente, True)
+    assert floyd_warshall(inteiro)[0] == floyd_warshall(flutuante)[0] == _sem_numpy(inteiro, monkeypatch)[0]
@@ -0,0 +1,29 @@
+"""
+Custo impresso pelos relatórios de caminho mínimo: o mesmo texto, com duas
+casas decimais, em todos os modos de pesos.
+"""
+import pytest
+from lib.core.graph import Grafo
+from lib.utils.converter import converter_peso
+from lib.algorithms.dijkstra import formatar_caminho_dijkstra
+from lib.algorithms.bellman_ford import formatar_caminho_bellman_ford
+from lib.utils.formater import formatar_caminho_floyd_warshall
+
+FORMATADORES = [formatar_caminho_dijkstra, formatar_caminho_bellman_ford, formatar_caminho_floyd_warshall]
+
+def _grafo(modo_pesos):
+    arestas = [("1", "2", "1.5"), ("2", "3", "2.25"), ("1", "3", "10")]
+    return Grafo.de_arestas([(u, v, converter_peso(w, modo_pesos)) for u, v, w in arestas],
+                            direcionado=True, ponderado=True, modo_pesos=modo_pesos)
+
+@pytest.mark.parametrize("formatar", FORMATADORES)
+@pytest.mark.parametrize("modo_pesos", ["decimal", "float", "inteiro"])
+def test_custo_com_duas_casas_em_todos_os_modos(formatar, modo_pesos):
+    relatorio, caminho = formatar(_grafo(modo_pesos), "1", "3")
+    assert "  Custo: 3.75\n" in relatorio
+    assert [v.id for v in caminho] == ["1", "2", "3"]
+
+@pytest.mark.parametrize("formatar", FORMATADORES)
+def test_sem_caminho(formatar):
+    relatorio, caminho = formatar(_grafo("inteiro"), "3", "1")
+    assert caminho is None and "Custo" not in relatorio
@@ -0,0 +1,120 @@
+"""
+Testes da estrutura `Grafo`: construção em lote e remoção de vértices e arestas.
+"""
+import numpy as np
+import pytest
+from lib.core.graph import Grafo
+
+def test_adicionar_arestas_array_float_gera_ids_inteiros():
+    grafo = Grafo(ponderado=True, modo_pesos="float")
+    grafo.adicionar_arestas(np.array([[1, 2, 3.5], [2, 3, 1.0]]), criar_vertices=True)
+    assert [v.id for v in grafo.vertices] == ["1", "2", "3"]
+    assert [(a.v1.id, a.v2.id, a.peso) for a in grafo.arestas] == [("1", "2", 3.5), ("2", "3", 1.0)]
+
+def test_adicionar_arestas_array_de_strings():
+    grafo = Grafo()
+    grafo.adicionar_arestas(np.array([["a", "b"], ["b", "c"]]), criar_vertices=True)
+    assert [v.id for v in grafo.vertices] == ["a", "b", "c"]
+
+def test_adicionar_arestas_array_com_id_fracionario():
+    with pytest.raises(ValueError):
+        Grafo().adicionar_arestas(np.array([[1.5, 2.0]]), criar_vertices=True)
+
+def _caminho(n):
+    return Grafo.de_arestas([(str(i), str(i + 1)) for i in range(1, n)])
+
+def test_remover_vertice_preserva_ordem():
+    grafo = _caminho(5)
+    grafo.remover_vertice("2")
+    assert [v.id for v in grafo.vertices] == ["1", "3", "4", "5"]
+    assert [(a.v1.id, a.v2.id) for a in grafo.arestas] == [("3", "4"), ("4", "5")]
+    assert [v.indice for v in grafo.vertices] == [0, 1, 2, 3]
+    assert [a.indice for a in grafo.arestas] == [0, 1]
+    assert list(grafo.graus()) == [0, 1, 2, 1]
+
+def test_remover_aresta_preserva_ordem():
+    grafo = _caminho(5)
+    grafo.remover_aresta("2", "3")
+    assert [(a.v1.id, a.v2.id) for a in grafo.arestas] == [("1", "2"), ("3", "4"), ("4", "5")]
+    assert [a.indice for a in grafo.arestas] == [0, 1, 2]
+
+@pytest.mark.parametrize("direcionado", [False, True])
+def test_remocoes_seguidas_equivalem_a_reconstruir(direcionado):
+    aleatorio = __import__("random").Random(7)
+    arestas = {(str(aleatorio.randrange(30)), str(aleatorio.randrange(30))) for _ in range(120)}
+    arestas = [(u, v, 1.0) for u, v in sorted(arestas) if u != v]
+    grafo = Grafo.de_arestas(arestas, vertices=[str(i) for i in range(30)], direcionado=direcionado,
+                             ponderado=True, modo_pesos="float")
+    removidos = set()
+    for id_v in aleatorio.sample([str(i) for i in range(30)], 10):
+        grafo.remover_vertice(id_v)
+        removidos.add(id_v)
+        u, v, _ = next(a for a in arestas if removidos.isdisjoint(a[:2]))
+        grafo.remover_aresta(u, v)
+        arestas = [a for a in arestas if removidos.isdisjoint(a[:2]) and a[:2] != (u, v)
+                   and (direcionado or a[:2] != (v, u))]
+
+    esperado = Grafo.de_arestas(arestas, vertices=[str(i) for i in range(30) if str(i) not in removidos],
+                                direcionado=direcionado, ponderado=True, modo_pesos="float")
+    assert [v.id for v in grafo.vertices] == [v.id for v in esperado.vertices]
+    assert [(a.v1.id, a.v2.id) for a in grafo.arestas] == [(a.v1.id, a.v2.id) for a in esperado.arestas]
+    assert [a.indice for a in grafo.arestas] == list(range(grafo.num_arestas()))
+    assert [grafo.get_grau(v.id) for v in grafo.vertices] == [esperado.get_grau(v.id) for v in esperado.vertices]
+    assert (grafo.matriz_pesos == esperado.matriz_pesos).all()
+
+def _rotatividade(grafo, rodadas):
+    """Remoções e inclusões intercaladas com consultas pontuais."""
+    for k in range(rodadas):
+        grafo.remover_vertice(str(k))
+        grafo.adicionar_vertice(f"novo{k}")
+        grafo.adicionar_aresta(f"novo{k}", str(k + 1))
+        grafo.get_grau(str(k + 1))
+        grafo.posicao(str(k + 2))
+        grafo.num_vertices()
+        grafo.num_arestas()
+
+def test_rotatividade_nao_compacta_a_cada_operacao(monkeypatch):
+    chamadas = []
+    for metodo in ("_compactar_vertices", "_compactar_arestas"):
+        original = getattr(Grafo, metodo)
+        monkeypatch.setattr(Grafo, metodo, lambda self, original=original: chamadas.append(1) or original(self))
+
+    n = 1000
+    grafo = Grafo.de_arestas((str(i), str((i + 1) % n)) for i in range(n))
+    _rotatividade(grafo, 200)
+    assert chamadas == []
+    assert grafo.num_vertices() == n and grafo.num_arestas() == n - 200
+
+    # As posições e os graus consultados com lacunas valem os da lista compactada.
+    ids = [f"novo{k}" for k in range(200)] + [str(i) for i in range(200, n, 37)]
+    posicoes = [grafo.posicao(id_v) for id_v in ids]
+    graus = [grafo.get_grau(id_v) for id_v in ids]
+    vertices = grafo.vertices
+    assert len(chamadas) == 1
+    assert [vertices[i].id for i in posicoes] == ids
+    assert graus == [grafo.get_grau(id_v) for id_v in ids]
+    assert grafo.graus().tolist() == [grafo.get_grau(v.id) for v in vertices]
+
+def test_lacunas_acima_da_fracao_compactam_na_remocao():
+    grafo = _caminho(10)
+    for i in range(1, 6):
+        grafo.remover_vertice(str(i))
+    assert grafo._lacunas_vertices == [0, 1, 2, 3, 4]
+    grafo.remover_vertice("6")
+    assert grafo._lacunas_vertices == []
+    assert [v.indice for v in grafo._lista_vertices] == [0, 1, 2, 3]
+
+def test_custo_da_rotatividade_independe_do_numero_de_vertices():
+    from time import perf_counter
+
+    def medir(n):
+        melhor = float("inf")
+        for _ in range(3):
+            grafo = Grafo.de_arestas((str(i), str((i + 1) % n)) for i in range(n))
+            inicio = perf_counter()
+            _rotatividade(grafo, 500)
+            melhor = min(melhor, perf_counter() - inicio)
+        return melhor
+
+    # Com uma compactação por operação, 8x mais vértices custariam ~8x mais.
+    assert medir(80000) < 3 * medir(10000)
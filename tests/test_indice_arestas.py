@@ -0,0 +1,75 @@
+"""
+Verifica o índice de arestas do Grafo (`indice_arestas`, `get_aresta`,
+`get_peso`) contra um modelo de referência num dicionário de pares, ao longo de
+sequências aleatórias de inclusões, atualizações de peso e remoções.
+"""
+import random
+import pytest
+from math import inf
+from lib.core.graph import Grafo
+
+def _par(u, v, direcionado):
+    return (u, v) if direcionado else frozenset((u, v))
+
+def _conferir(grafo, modelo, ids):
+    direcionado = grafo.direcionado
+    assert grafo.num_arestas() == len(modelo) == len(grafo.indice_arestas)
+    assert set(map(id, grafo.arestas)) == set(map(id, grafo.indice_arestas.values()))
+    for u in ids:
+        for v in ids:
+            esperado = modelo.get(_par(u, v, direcionado))
+            aresta = grafo.get_aresta(u, v)
+            if esperado is None:
+                assert aresta is None and grafo.get_peso(u, v) == inf
+            else:
+                assert {aresta.v1.id, aresta.v2.id} == {u, v} and aresta.peso == esperado
+                assert grafo.get_peso(u, v) == esperado
+
+CASOS = [(semente, direcionado) for semente in range(15) for direcionado in (False, True)]
+
+@pytest.mark.parametrize("semente,direcionado", CASOS)
+def test_indice_equivale_ao_modelo(semente, direcionado):
+    aleatorio = random.Random(semente)
+    ids = [str(i) for i in range(12)]
+    grafo = Grafo(direcionado=direcionado, ponderado=True, modo_pesos="float")
+    grafo.adicionar_vertices(ids)
+    modelo = {}
+    vivos = list(ids)
+
+    for passo in range(150):
+        operacao = aleatorio.random()
+        u, v = aleatorio.choice(vivos), aleatorio.choice(vivos)
+        chave = _par(u, v, direcionado)
+        if operacao < 0.6:
+            peso = float(aleatorio.randint(1, 9))
+            grafo.adicionar_aresta(u, v, peso)
+            modelo[chave] = min(peso, modelo.get(chave, inf))
+        elif operacao < 0.9:
+            assert grafo.remover_aresta(u, v) == (chave in modelo)
+            modelo.pop(chave, None)
+        elif len(vivos) > 2:
+            grafo.remover_vertice(u)
+            vivos.remove(u)
+            modelo = {par: peso for par, peso in modelo.items() if u not in (tuple(par) if direcionado else par)}
+        if passo % 25 == 0:
+            _conferir(grafo, modelo, vivos)
+    _conferir(grafo, modelo, vivos)
+
+@pytest.mark.parametrize("direcionado", [False, True])
+def test_inclusao_em_lote_equivale_a_uma_por_vez(direcionado):
+    aleatorio = random.Random(3)
+    arestas = [(str(aleatorio.randrange(15)), str(aleatorio.randrange(15)), float(aleatorio.randint(1, 9)))
+               for _ in range(120)]
+    lote = Grafo.de_arestas(arestas, direcionado=direcionado, ponderado=True, modo_pesos="float")
+    unitario = Grafo(direcionado=direcionado, ponderado=True, modo_pesos="float")
+    for u, v, peso in arestas:
+        unitario.adicionar_vertice(u)
+        unitario.adicionar_vertice(v)
+        unitario.adicionar_aresta(u, v, peso)
+
+    assert [v.id for v in lote.vertices] == [v.id for v in unitario.vertices]
+    assert [(a.v1.id, a.v2.id, a.peso) for a in lote.arestas] == [(a.v1.id, a.v2.id, a.peso)
+                                                                  for a in unitario.arestas]
+    # Sem orientação, a ordem do par na chave depende do `id()` dos vértices.
+    chaves = [{_par(u.id, v.id, direcionado) for u, v in grafo.indice_arestas} for grafo in (lote, unitario)]
+    assert chaves[0] == chaves[1]
@@ -0,0 +1,38 @@
+"""
+Testes da leitura da matriz de distâncias em CSV (`carregar_grafo_csv` e
+`ler_grafo_csv`), comparados com as células do próprio arquivo.
+"""
+import pytest
+from lib.utils.file_handler import carregar_grafo_csv, ler_grafo_csv
+
+def _escrever_csv(caminho, celulas):
+    n = len(celulas)
+    linhas = ["Min," + ",".join(str(i) for i in range(1, n + 1))]
+    linhas += [f"{i + 1}," + ",".join(linha) for i, linha in enumerate(celulas)]
+    caminho.write_text("\n".join(linhas) + "\n")
+    return str(caminho)
+
+def _celulas(n):
+    return [["" if i == j else str(10 * min(i, j) + max(i, j) + 1) for j in range(n)] for i in range(n)]
+
+def test_celula_invalida_so_perde_a_propria_aresta(tmp_path, capsys):
+    celulas = _celulas(4)
+    celulas[0][2] = "x"
+    celulas[3][1] = "??"  # triângulo inferior: não é lido
+    grafo = carregar_grafo_csv(_escrever_csv(tmp_path / "m.csv", celulas), modo_pesos="float")
+
+    assert "Célula (1, 3) com valor não numérico 'x' ignorada" in capsys.readouterr().out
+    esperado = {(str(i + 1), str(j + 1), float(celulas[i][j])) for i in range(4) for j in range(i + 1, 4)
+                if (i, j) != (0, 2)}
+    assert {(a.v1.id, a.v2.id, a.peso) for a in grafo.arestas} == esperado
+    assert ler_grafo_csv(str(tmp_path / "m.csv"), subconjunto=[1, 3, 4], modo_pesos="float").num_arestas() == 2
+
+@pytest.mark.parametrize("subconjunto", [None, [5, 1, 3], [2]])
+def test_subconjunto_tem_as_arestas_entre_os_vertices_escolhidos(tmp_path, subconjunto):
+    celulas = _celulas(6)
+    visao = ler_grafo_csv(_escrever_csv(tmp_path / "m.csv", celulas), subconjunto=subconjunto, modo_pesos="float")
+    ids = [str(i) for i in (subconjunto or range(1, 7))]
+    assert [v.id for v in visao.vertices] == ids
+    pares = {frozenset((u, v)) for u in ids for v in ids if u != v}
+    assert {frozenset((a.v1.id, a.v2.id)) for a in visao.arestas} == pares
+    assert all(a.peso == float(celulas[int(a.v1.id) - 1][int(a.v2.id) - 1]) for a in visao.arestas)
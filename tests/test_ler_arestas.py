@@ -0,0 +1,54 @@
+"""
+Verifica o leitor de arestas em blocos (`ler_arestas`): qualquer tamanho de
+bloco, inclusive os que cortam linhas e pesos ao meio, dá as mesmas arestas
+que a leitura linha a linha, e `ler_grafo` monta o mesmo grafo que `de_arestas`.
+"""
+import io
+import random
+import pytest
+from lib.core.graph import Grafo
+from lib.utils.converter import converter_peso
+from lib.utils.file_handler import ler_arestas, ler_grafo
+
+def _texto(semente):
+    aleatorio = random.Random(semente)
+    linhas = [str(aleatorio.randint(1, 50))]  # contagem de vértices, ignorada
+    arestas = []
+    for _ in range(aleatorio.randint(0, 60)):
+        u, v = f"v{aleatorio.randrange(30)}", f"v{aleatorio.randrange(30)}"
+        if aleatorio.random() < 0.3:
+            linhas.append(f"({u}, {v})")
+            arestas.append((u, v, None))
+        else:
+            peso = f"{aleatorio.randint(1, 99999) / 100:.2f}"
+            linhas.append(f"({u},{' ' * aleatorio.randint(0, 2)}{v}, {{{peso}}})")
+            arestas.append((u, v, peso))
+        if aleatorio.random() < 0.1:
+            linhas.append("")
+    texto = "\n".join(linhas)
+    if aleatorio.random() < 0.5:
+        texto += "\n"
+    return texto, arestas
+
+CASOS = [(semente, tamanho) for semente in range(5) for tamanho in (1, 2, 3, 7, 64, 1 << 20)]
+
+@pytest.mark.parametrize("semente,tamanho_bloco", CASOS)
+@pytest.mark.parametrize("modo", ["decimal", "float", "inteiro"])
+def test_blocos_de_qualquer_tamanho(semente, tamanho_bloco, modo):
+    texto, arestas = _texto(semente)
+    blocos = list(ler_arestas(io.StringIO(texto), modo, tamanho_bloco=tamanho_bloco))
+    lidas = [aresta for bloco in blocos for aresta in bloco]
+    assert lidas == [(u, v, None if w is None else converter_peso(w, modo)) for u, v, w in arestas]
+    if tamanho_bloco >= len(texto):
+        assert len(blocos) <= 2
+
+def test_ler_grafo_equivale_a_de_arestas(tmp_path):
+    texto, arestas = _texto(4)
+    arquivo = tmp_path / "GRAFO.txt"
+    arquivo.write_text(texto)
+    lido = ler_grafo(str(arquivo), ponderado=True, modo_pesos="float")
+    esperado = Grafo.de_arestas([(u, v, None if w is None else float(w)) for u, v, w in arestas],
+                                ponderado=True, modo_pesos="float")
+    assert [v.id for v in lido.vertices] == [v.id for v in esperado.vertices]
+    assert [(a.v1.id, a.v2.id, a.peso) for a in lido.arestas] == [(a.v1.id, a.v2.id, a.peso)
+                                                                  for a in esperado.arestas]
@@ -0,0 +1,65 @@
+"""
+Verifica as matrizes materializadas sob demanda (`matriz_adj`,
+`matriz_incidencia` e `matriz_pesos`): só são montadas no primeiro acesso,
+ficam em cache e, depois de cada modificação, equivalem às de um grafo
+reconstruído do zero com as mesmas arestas.
+"""
+import random
+import numpy as np
+import pytest
+from math import inf
+from lib.core.graph import Grafo
+
+def _reconstruir(grafo):
+    return Grafo.de_arestas([(a.v1.id, a.v2.id, a.peso) for a in grafo.arestas],
+                            vertices=[v.id for v in grafo.vertices], direcionado=grafo.direcionado,
+                            ponderado=grafo.ponderado, modo_pesos=grafo.modo_pesos)
+
+def _esperada_adj(grafo):
+    n = grafo.num_vertices()
+    matriz = [[grafo.vazio] * n for _ in range(n)]
+    for a in grafo.arestas:
+        i, j = grafo.posicao_vertice(a.v1), grafo.posicao_vertice(a.v2)
+        matriz[i][j] = a.peso
+        if not grafo.direcionado:
+            matriz[j][i] = a.peso
+    return matriz
+
+def _conferir(grafo):
+    referencia = _reconstruir(grafo)
+    assert grafo.matriz_adj == _esperada_adj(grafo) == referencia.matriz_adj
+    assert grafo.matriz_incidencia == referencia.matriz_incidencia
+    assert np.array_equal(grafo.matriz_pesos, referencia.matriz_pesos)
+
+def test_matrizes_so_sao_montadas_no_primeiro_acesso():
+    grafo = Grafo.de_arestas([("1", "2", 2.0), ("2", "3", 3.0)], ponderado=True, modo_pesos="float")
+    assert grafo._matriz_adj is None and grafo._matriz_incidencia is None and grafo._matriz_pesos is None
+
+    adj, inc, pesos = grafo.matriz_adj, grafo.matriz_incidencia, grafo.matriz_pesos
+    assert grafo.matriz_adj is adj and grafo.matriz_incidencia is inc
+    assert np.shares_memory(grafo.matriz_pesos, pesos) and not pesos.flags.writeable
+    assert inc == [[1, 0], [1, 1], [0, 1]]
+    assert pesos[0, 1] == 2.0 and pesos[0, 2] == inf
+
+@pytest.mark.parametrize("semente,direcionado", [(s, d) for s in range(8) for d in (False, True)])
+def test_matrizes_acompanham_as_modificacoes(semente, direcionado):
+    aleatorio = random.Random(semente)
+    ids = [str(i) for i in range(10)]
+    arestas = [(aleatorio.choice(ids), aleatorio.choice(ids), float(aleatorio.randint(1, 9))) for _ in range(25)]
+    grafo = Grafo.de_arestas(arestas, vertices=ids, direcionado=direcionado, ponderado=True, modo_pesos="float")
+    _conferir(grafo)
+
+    for passo in range(30):
+        u, v = aleatorio.choice(ids), aleatorio.choice(ids)
+        operacao = passo % 5
+        if operacao in (0, 1):
+            grafo.adicionar_aresta(u, v, float(aleatorio.randint(0, 9)))
+        elif operacao == 2:
+            grafo.remover_aresta(u, v)
+        elif operacao == 3 and len(ids) > 3:
+            grafo.remover_vertice(u)
+            ids.remove(u)
+        else:
+            ids.append(f"n{passo}")
+            grafo.adicionar_vertice(ids[-1])
+        _conferir(grafo)
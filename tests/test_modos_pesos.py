@@ -0,0 +1,69 @@
+"""
+Verifica os modos de pesos ("decimal", "float" e "inteiro"): a conversão na
+carga e o retorno ao valor real, e que os algoritmos dão os mesmos resultados
+(em valor real) nos três modos.
+"""
+import random
+import pytest
+from decimal import Decimal
+from lib.core.graph import Grafo
+from lib.utils.converter import converter_peso, peso_real, formatar_peso, MODOS_PESO
+from lib.utils.file_handler import ler_grafo
+from lib.algorithms.dijkstra import dijkstra
+from lib.algorithms.bellman_ford import bellman_ford
+from lib.algorithms.kruskal import kruskal
+from lib.algorithms.floyd_warshall import floyd_warshall
+
+@pytest.mark.parametrize("modo,nativo", [("decimal", Decimal("2.25")), ("float", 2.25), ("inteiro", 225)])
+def test_conversao_de_ida_e_volta(modo, nativo):
+    peso = converter_peso("2.25", modo)
+    assert peso == nativo and type(peso) is type(nativo)
+    assert peso_real(peso, modo) == 2.25
+    assert formatar_peso(peso, modo) == "2.25"
+
+def test_modo_inteiro_soma_sem_erro_de_arredondamento():
+    soma = sum(converter_peso(w, "inteiro") for w in ("0.1", "0.2", "0.3"))
+    assert soma == 60 and formatar_peso(soma, "inteiro") == "0.60"
+    assert converter_peso("1.005", "inteiro") == 101  # arredonda meio para cima, como get_decimal
+
+def test_modo_desconhecido():
+    with pytest.raises(ValueError):
+        converter_peso("1", "racional")
+    with pytest.raises(ValueError):
+        Grafo(modo_pesos="racional")
+
+def _grafos(semente, direcionado):
+    aleatorio = random.Random(semente)
+    textos = [(str(aleatorio.randrange(12)), str(aleatorio.randrange(12)), f"{aleatorio.randint(1, 999) / 100:.2f}")
+              for _ in range(40)]
+    return {modo: Grafo.de_arestas([(u, v, converter_peso(w, modo)) for u, v, w in textos],
+                                   vertices=[str(i) for i in range(12)], direcionado=direcionado,
+                                   ponderado=True, modo_pesos=modo)
+            for modo in MODOS_PESO}
+
+@pytest.mark.parametrize("semente,direcionado", [(s, d) for s in range(6) for d in (False, True)])
+def test_algoritmos_iguais_nos_tres_modos(semente, direcionado):
+    grafos = _grafos(semente, direcionado)
+    resultados = {}
+    for modo, grafo in grafos.items():
+        _, dist_dijkstra, _ = dijkstra(grafo, "0")
+        dist_bf, _, _ = bellman_ford(grafo, "0")
+        dist_fw, _, _ = floyd_warshall(grafo)
+        resultados[modo] = (
+            {v.id: round(float(grafo.peso_real(d)), 6) for v, d in dist_dijkstra.items()},
+            {v: round(float(grafo.peso_real(d)), 6) for v, d in dist_bf.items()},
+            [[round(d, 6) for d in linha] for linha in dist_fw],
+            None if direcionado else grafo.formatar_peso(sum(a.peso for a in kruskal(grafo).arestas)),
+        )
+    assert resultados["decimal"] == resultados["float"] == resultados["inteiro"]
+
+@pytest.mark.parametrize("modo,nativo", [("decimal", Decimal), ("float", float), ("inteiro", int)])
+def test_ler_grafo_converte_uma_vez_na_carga(tmp_path, modo, nativo):
+    arquivo = tmp_path / "GRAFO.txt"
+    arquivo.write_text("3\n(1, 2, {1.5})\n(2, 3, {2.25})\n(1, 3, {1.5})\n")
+    grafo = ler_grafo(str(arquivo), ponderado=True, modo_pesos=modo)
+    assert grafo.modo_pesos == modo
+    assert all(type(a.peso) is nativo for a in grafo.arestas)
+    assert [grafo.peso_real(a.peso) for a in grafo.arestas] == [1.5, 2.25, 1.5]
+    # Pesos repetidos viram o mesmo objeto (convertidos uma única vez).
+    assert grafo.arestas[0].peso is grafo.arestas[2].peso
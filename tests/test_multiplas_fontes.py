@@ -0,0 +1,38 @@
+"""
+Testes de `caminhos_multiplas_fontes`: mesmas distâncias e predecessores do
+núcleo do Dijkstra, com e sem Numba, em um ou mais processos.
+"""
+import random
+import numpy as np
+import pytest
+from lib.core.graph import Grafo
+from lib.algorithms import multiplas_fontes
+from lib.algorithms.dijkstra import _dijkstra_listas
+
+def _grafo(semente):
+    aleatorio = random.Random(semente)
+    n = aleatorio.randint(1, 30)
+    arestas = [(str(aleatorio.randrange(n)), str(aleatorio.randrange(n)), aleatorio.randint(1, 3))
+               for _ in range(aleatorio.randint(0, 90))]
+    return Grafo.de_arestas([a for a in arestas if a[0] != a[1]], vertices=[str(i) for i in range(n)],
+                            direcionado=semente % 2 == 0, ponderado=True, modo_pesos="float")
+
+def _referencia(grafo, fontes):
+    csr = grafo.congelar()
+    indptr, indices, pesos = csr.como_listas()
+    resultados = [_dijkstra_listas(indptr, indices, pesos, csr.posicao(f)) for f in fontes]
+    return np.array([r[0] for r in resultados]), np.array([r[1] for r in resultados])
+
+@pytest.mark.parametrize("numba", [True, False])
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("semente", range(6))
+def test_igual_ao_nucleo_do_dijkstra(monkeypatch, numba, workers, semente):
+    if numba and not multiplas_fontes.HAS_NUMBA:
+        pytest.skip("numba não instalado")
+    monkeypatch.setattr(multiplas_fontes, "HAS_NUMBA", numba)
+    grafo = _grafo(semente)
+    fontes = [v.id for v in grafo.vertices][::2]
+    distancias, predecessores = multiplas_fontes.caminhos_multiplas_fontes(grafo, fontes, workers=workers)
+    esperado_dist, esperado_pred = _referencia(grafo, fontes)
+    assert np.array_equal(distancias, esperado_dist)
+    assert np.array_equal(predecessores, esperado_pred)
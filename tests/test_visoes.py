@@ -0,0 +1,82 @@
+"""
+Testes das visões de grafo (`graph_view`): somente leitura e `materializar`.
+"""
+import pytest
+from lib.core.graph import Grafo
+from lib.core.graph_view import VisaoGrafo, VisaoArestas, VisaoInduzida
+from lib.algorithms.kruskal import kruskal
+from lib.algorithms.prim import prim
+from lib.algorithms.dijkstra import dijkstra
+from lib.core.graph_converter import get_grafo_subjacente
+
+def _grafo():
+    return Grafo.de_arestas([("1", "2", 1.0), ("2", "3", 2.0), ("1", "3", 5.0), ("3", "4", 1.0)],
+                            ponderado=True, modo_pesos="float")
+
+def test_visao_grafo_e_abstrata():
+    with pytest.raises(TypeError):
+        VisaoGrafo(_grafo())
+
+@pytest.mark.parametrize("algoritmo", [kruskal, prim, lambda g: dijkstra(g, "1")[0]])
+def test_arvores_sao_visoes_somente_leitura(algoritmo):
+    arvore = algoritmo(_grafo())
+    assert isinstance(arvore, VisaoArestas)
+    with pytest.raises(TypeError):
+        arvore.adicionar_aresta("1", "4", 1.0)
+    with pytest.raises(TypeError):
+        arvore.matriz_adj = []
+    with pytest.raises(TypeError):
+        arvore.matriz_incidencia = []
+
+@pytest.mark.parametrize("algoritmo", [kruskal, prim, lambda g: dijkstra(g, "1")[0]])
+def test_materializar_devolve_grafo_modificavel(algoritmo):
+    grafo = _grafo()
+    arvore = algoritmo(grafo)
+    copia = arvore.materializar()
+    assert type(copia) is Grafo
+    assert [v.id for v in copia.vertices] == [v.id for v in arvore.vertices]
+    assert [(a.v1.id, a.v2.id, a.peso) for a in copia.arestas] == [(a.v1.id, a.v2.id, a.peso) for a in arvore.arestas]
+    assert copia.matriz_adj == arvore.matriz_adj
+
+    copia.remover_vertice("4")
+    copia.matriz_adj = None
+    assert grafo.num_vertices() == 4 and arvore.num_vertices() == 4
+
+def test_materializar_visao_induzida():
+    grafo = _grafo()
+    copia = VisaoInduzida(grafo, ["3", "1"]).materializar(nome_arquivo="SUB")
+    assert [v.id for v in copia.vertices] == ["3", "1"]
+    assert [(a.v1.id, a.v2.id) for a in copia.arestas] == [("1", "3")]
+    assert copia.nome_arquivo == "SUB" and copia.modo_pesos == "float"
+
+def test_grafo_subjacente_reaproveitado_ate_mudar_o_digrafo():
+    digrafo = Grafo.de_arestas([("1", "2", 3.0), ("2", "1", 1.0), ("2", "3", 2.0)], direcionado=True,
+                               ponderado=True, modo_pesos="float")
+    subjacente = get_grafo_subjacente(digrafo)
+    assert get_grafo_subjacente(digrafo) is subjacente
+    assert sorted((*sorted((a.v1.id, a.v2.id)), a.peso) for a in subjacente.arestas) == [("1", "2", 1.0),
+                                                                                        ("2", "3", 2.0)]
+
+    digrafo.adicionar_vertice("4")
+    digrafo.adicionar_aresta("3", "4", 4.0)
+    atual = get_grafo_subjacente(digrafo)
+    assert atual.num_arestas() == 3 and atual.get_peso("3", "4") == 4.0
+
+@pytest.mark.parametrize("direcionado", [False, True])
+@pytest.mark.parametrize("tamanho", [1, 4, 25])
+def test_visao_induzida_equivale_a_filtrar_as_arestas_da_base(direcionado, tamanho):
+    import random
+    aleatorio = random.Random(tamanho)
+    arestas = [(str(aleatorio.randrange(40)), str(aleatorio.randrange(40)), float(aleatorio.randint(1, 9)))
+               for _ in range(300)]
+    base = Grafo.de_arestas(arestas, vertices=[str(i) for i in range(40)], direcionado=direcionado,
+                            ponderado=True, modo_pesos="float")
+    base.remover_vertice("7")
+    base.remover_aresta(*next((a.v1.id, a.v2.id) for a in base.arestas if a.v1 is not a.v2))
+
+    ids = aleatorio.sample([v.id for v in base.vertices], tamanho)
+    visao = VisaoInduzida(base, ids)
+    selecionados = set(ids)
+    esperado = [a for a in base.arestas if a.v1.id in selecionados and a.v2.id in selecionados]
+    assert visao.arestas == esperado
+    assert [v.id for v in visao.vertices] == ids
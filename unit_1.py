@@ -6,7 +6,8 @@ Descriçao: Ponto de entrada da aplicação. Orquestra a leitura dos dados,
 """
 import os
 import time
-from lib.utils.file_handler import ler_diretorio # Leitura de arquivos de grafos
+from lib.utils.file_handler import iterar_diretorio # Leitura preguiçosa de arquivos de grafos
+from lib.utils.pipeline import executar_pipeline # Processa um grafo por vez
 from lib.utils.formater import gerar_relatorio_completo # Geração do relatório textual completo
 from lib.algorithms.bfs import bfs # Implementação do algoritmo BFS
 from lib.algorithms.dfs import dfs # Implementação do algoritmo DFS (com ou sem classificação de arestas)
@@ -18,68 +19,40 @@ from lib.utils.renderer import (
     renderizar_dfs_classificada # Renderiza DFS com classificação de arestas (dígrafo)
 )
 
-inicio_timer = time.time()
-directory = 'data/unit_1'
-grafos = ler_diretorio(directory) # Carrega todos os grafos da pasta 'data'
-
-print("\n--- Gerando Relatório de Análise (resultados.txt) ---")
-output_filename = 'resultados.txt'
-with open(output_filename, 'w', encoding='utf-8') as f:
-    grafos_ordenados = sorted(grafos, key=lambda g: g.nome_arquivo)
-    for i, grafo in enumerate(grafos_ordenados):
-        print(f"Analisando: {grafo.nome_arquivo}")
-        relatorio = gerar_relatorio_completo(grafo) # Gera relatório textual
-        f.write(relatorio)
-        if i < len(grafos_ordenados) - 1:
-            f.write("\n\n\n")
-print("Relatório de análise gerado com sucesso!\n")
+def relatar(grafo):
+    print(f"Analisando: {grafo.nome_arquivo}")
+    if relatorio.tell() > 0:
+        relatorio.write("\n\n\n")
+    relatorio.write(gerar_relatorio_completo(grafo)) # Gera relatório textual
 
-print("--- Renderizando Grafos e Dígrafos Originais ---")
-for grafo in grafos:
+def renderizar_original(grafo):
     print("Renderizando:", grafo.nome_arquivo)
     base_name = os.path.splitext(grafo.nome_arquivo)[0]
     dot = renderizar_grafo(grafo) # Cria objeto DOT para grafo/dígrafo
     dot.render(f'render/{base_name}', view=False, cleanup=True) # Renderiza para PNG
 
-print("\n--- Executando BFS para GRAFOS (Req. 13) ---")
-for grafo in grafos:
-    if not grafo.direcionado and grafo.vertices:
-        print("Executando BFS em:", grafo.nome_arquivo)
-        base_name = os.path.splitext(grafo.nome_arquivo)[0]
-        vertice_inicial = str(grafo.vertices[0].id) # Usa o primeiro vértice como inicial
-        order, back_edges = bfs(grafo, vertice_inicial) # Executa BFS
-        dot = renderizar_bfs(order, back_edges, direcionado=False) # Renderiza BFS (grafo)
-        dot.render(f'render/bfs/{base_name}_BFS', view=False, cleanup=True)
-
-print("\n--- Executando BFS para DÍGRAFOS (Req. 19) ---")
-for grafo in grafos:
-    if grafo.direcionado and grafo.vertices:
-        print("Executando BFS em:", grafo.nome_arquivo)
-        base_name = os.path.splitext(grafo.nome_arquivo)[0]
-        vertice_inicial = str(grafo.vertices[0].id)
-        order, back_edges = bfs(grafo, vertice_inicial) # Executa BFS
-        dot = renderizar_bfs(order, back_edges, direcionado=True) # Renderiza BFS (dígrafo)
-        dot.render(f'render/bfs/{base_name}_BFS', view=False, cleanup=True)
+def executar_bfs(grafo):
+    if not grafo.vertices:
+        return
+    print("Executando BFS em:", grafo.nome_arquivo) # Req. 13 (grafos) e 19 (dígrafos)
+    base_name = os.path.splitext(grafo.nome_arquivo)[0]
+    vertice_inicial = str(grafo.vertices[0].id) # Usa o primeiro vértice como inicial
+    order, back_edges = bfs(grafo, vertice_inicial) # Executa BFS
+    dot = renderizar_bfs(order, back_edges, direcionado=grafo.direcionado) # Renderiza BFS
+    dot.render(f'render/bfs/{base_name}_BFS', view=False, cleanup=True)
 
-print("\n--- Executando DFS para GRAFOS (Req. 14) ---")
-for grafo in grafos:
-    if not grafo.direcionado and grafo.vertices:
-        print("Executando DFS em:", grafo.nome_arquivo)
-        base_name = os.path.splitext(grafo.nome_arquivo)[0]
-        vertice_inicial = str(grafo.vertices[0].id)
+def executar_dfs(grafo):
+    if not grafo.vertices:
+        return
+    print("Executando DFS em:", grafo.nome_arquivo)
+    base_name = os.path.splitext(grafo.nome_arquivo)[0]
+    vertice_inicial = str(grafo.vertices[0].id)
+    if not grafo.direcionado: # Req. 14
         ordem_dfs, arestas_de_retorno = dfs(grafo, vertice_inicial) # Executa DFS (grafo)
         dot_dfs = renderizar_dfs(ordem_dfs, arestas_de_retorno) # Renderiza DFS
-        dot_dfs.render(f'render/dfs/{base_name}_DFS', view=False, cleanup=True)
-
-print("\n--- Executando DFS para DÍGRAFOS (Req. 20) ---")
-for grafo in grafos:
-    if grafo.direcionado and grafo.vertices:
-        print("Executando DFS em:", grafo.nome_arquivo)
-        base_name = os.path.splitext(grafo.nome_arquivo)[0]
-        vertice_inicial = str(grafo.vertices[0].id)
-        
+    else: # Req. 20
         resultados_dfs = dfs(grafo, vertice_inicial, classificar_arestas=True) # Executa DFS c/ classificação
-        
+
         dot_dfs = renderizar_dfs_classificada( # Renderiza DFS classificada
             ordem_visita=resultados_dfs['ordem_visita'],
             arestas_arvore=resultados_dfs.get('arestas_arvore', []),
@@ -87,14 +60,27 @@ for grafo in grafos:
             arestas_avanco=resultados_dfs.get('arestas_avanco', []),
             arestas_cruzamento=resultados_dfs.get('arestas_cruzamento', [])
         )
-        dot_dfs.render(f'render/dfs/{base_name}_DFS', view=False, cleanup=True)
+    dot_dfs.render(f'render/dfs/{base_name}_DFS', view=False, cleanup=True)
 
-print("\n--- Renderizando Grafos Subjacentes para DÍGRAFOS (Req. 18) ---")
-for grafo in grafos:
-    if grafo.direcionado and grafo.vertices:
+def renderizar_subjacente(grafo):
+    if grafo.direcionado and grafo.vertices: # Req. 18
         print("Gerando Subjacente de:", grafo.nome_arquivo)
         base_name = os.path.splitext(grafo.nome_arquivo)[0]
         dot = renderizar_grafo_subjacente(grafo) # Cria objeto DOT do grafo subjacente
         dot.render(f'render/subjacente/SUBJACENTE_{base_name}', view=False, cleanup=True)
 
-print("\nTempo total: %.4f segundos" % (time.time() - inicio_timer))
\ No newline at end of file
+inicio_timer = time.time()
+directory = 'data/unit_1'
+
+# Cada grafo passa por todas as etapas antes de o próximo ser lido; os grafos
+# saem em ordem de nome, a mesma ordem do relatório.
+print("\n--- Analisando, relatando (resultados.txt) e renderizando cada grafo ---")
+output_filename = 'resultados.txt'
+with open(output_filename, 'w', encoding='utf-8') as relatorio:
+    executar_pipeline(
+        iterar_diretorio(directory, ordenar=True),
+        [relatar, renderizar_original, executar_bfs, executar_dfs, renderizar_subjacente]
+    )
+print("Relatório de análise gerado com sucesso!\n")
+
+print("\nTempo total: %.4f segundos" % (time.time() - inicio_timer))
@@ -6,10 +6,11 @@ Descriçao: Ponto de entrada da aplicação. Orquestra a leitura dos dados,
 """
 import os
 import time
-from lib.utils.file_handler import ler_diretorio  # Leitura de arquivos de grafos
+from lib.utils.file_handler import iterar_diretorio  # Leitura preguiçosa de arquivos de grafos
+from lib.utils.pipeline import executar_pipeline  # Processa um grafo por vez
 from lib.utils.formater import ( # Geração do relatório textual completo
     formatar_caminho_floyd_warshall,
-    gerar_relatorio_unidade_2
+    formatar_relatorio_unidade_2
 )
 from lib.utils.renderer import (
     renderizar_grafo,
@@ -23,108 +24,102 @@ from lib.algorithms.dijkstra import dijkstra, formatar_caminho_dijkstra # Implem
 from lib.algorithms.bellman_ford import formatar_caminho_bellman_ford
 from lib.algorithms.chu_liu_edmonds import chu_liu_edmonds
 
-inicio_timer = time.time()
-directory = 'data/unit_2'
-
-# 1. Leitura de dados (Imprime "Lendo arquivo: ...")
-grafos = ler_diretorio(directory)
-
-# Listas separadas para cada categoria de resultado
-grafos_agm = []
-grafos_arborescencia = []
+ID_INICIO = "1"
+ID_FIM = "15"
 
-# --- 2. Processamento Centralizado de Algoritmos --
-for grafo in grafos:
+# --- 1. Processamento de Algoritmos e Renderização de AGMs / Arborescência ---
+def processar_algoritmos(grafo):
     if 'AGM' in grafo.nome_arquivo:
         try:
-            grafos_agm.append(kruskal(grafo))
-            grafos_agm.append(prim(grafo))
-            spt, _, _ = dijkstra(grafo)
-            grafos_agm.append(spt) 
+            agms = [
+                grafo.resultado_derivado("kruskal", lambda: kruskal(grafo)),
+                grafo.resultado_derivado("prim", lambda: prim(grafo)),
+                grafo.resultado_derivado(("dijkstra", None), lambda: dijkstra(grafo))[0],
+            ]
         except Exception as e:
             print(f"  Erro ao gerar AGM para {grafo.nome_arquivo}: {e}")
+            return
+        for agm in agms: # Kruskal, Prim, Dijkstra
+            print("Renderizando:", agm.nome_arquivo)
+            dot = renderizar_agm(agm)
+            dot.render(f'render/agm/{agm.nome_arquivo}', view=False, cleanup=True)
     elif "CHU_LIU_EDMONDS" in grafo.nome_arquivo:
         agm_chu, erro = chu_liu_edmonds(grafo, raiz="1")
         if agm_chu:
-            grafos_arborescencia.append(agm_chu)
+            print("Renderizando:", agm_chu.nome_arquivo)
+            dot = renderizar_agm(agm_chu)
+            dot.render(f'render/arborescencia/{agm_chu.nome_arquivo}', view=False, cleanup=True)
         else:
             print(f"  Aviso: Erro no {grafo.nome_arquivo} usando Chu-Liu/Edmonds: {erro}")
-    elif "HIERHOLZER" in grafo.nome_arquivo:
-        pass
 
-# --- 3. Renderização de Grafos Originais ---
-print("\n--- Renderizando Grafos e Dígrafos Originais ---")
-os.makedirs('render', exist_ok=True)
-for grafo in grafos:
+# --- 2. Renderização de Grafos Originais ---
+def renderizar_original(grafo):
     print("Renderizando:", grafo.nome_arquivo)
     base_name = os.path.splitext(grafo.nome_arquivo)[0]
     dot = renderizar_grafo(grafo)
     dot.render(f'render/{base_name}', view=False, cleanup=True)
 
-# --- 4. Renderização de AGMs (Kruskal, Prim, Dijkstra) ---
-print("\n--- Renderizando AGMs (Kruskal, Prim, Dijkstra) ---")
-os.makedirs('render/agm', exist_ok=True)
-for grafo in grafos_agm: 
-    print("Renderizando:", grafo.nome_arquivo)
-    base_name = grafo.nome_arquivo
-    dot = renderizar_agm(grafo)
-    dot.render(f'render/agm/{base_name}', view=False, cleanup=True)
+# --- 3. Renderização do Caminho Mais Curto ---
+def renderizar_caminhos(grafo):
+    if not ('AGM' in grafo.nome_arquivo and grafo.ponderado):
+        return
 
-# --- 5. Renderização de Arborescência (Chu-Liu-Edmonds) ---
-print("\n--- Renderizando Arborescência (Chu-Liu-Edmonds) ---")
-os.makedirs('render/arborescencia', exist_ok=True) 
-for grafo in grafos_arborescencia: 
-    print("Renderizando:", grafo.nome_arquivo)
-    base_name = grafo.nome_arquivo
-    dot = renderizar_agm(grafo) 
-    dot.render(f'render/arborescencia/{base_name}', view=False, cleanup=True)
+    _ , caminho_data = formatar_caminho_floyd_warshall(grafo, ID_INICIO, ID_FIM)
+    if caminho_data:
+        print(f"Renderizando: FLOYD_WARSHALL")
+        dot_caminho = renderizar_caminho_curto(grafo, caminho_data,
+                         nome_grafo=f"Caminho_{ID_INICIO}-{ID_FIM}")
+        output_path = f'render/caminho_mais_curto/FLOYD_WARSHALL'
+        dot_caminho.render(output_path, view=False, cleanup=True)
 
-# --- 6. Renderização do Caminho Mais Curto ---
-print("\n--- Renderizando Caminho Mais Curto ---")
-ID_INICIO = "1"
-ID_FIM = "15"
-os.makedirs('render/caminho_mais_curto', exist_ok=True)
+    bf_string, caminho_bf = formatar_caminho_bellman_ford(grafo, ID_INICIO, ID_FIM)
+    if caminho_bf:
+        print("Renderizando: BELLMAN-FORD")
+        dot_bf = renderizar_caminho_curto(
+            grafo, caminho_bf,
+            nome_grafo=f"BELLMAN_FORD_{ID_INICIO}_{ID_FIM}"
+        )
+        dot_bf.render(
+            f"render/caminho_mais_curto/BELLMAN_FORD-{ID_INICIO}-{ID_FIM}",
+            view=False, cleanup=True
+        )
+
+    dijkstra_string, caminho_dijkstra = formatar_caminho_dijkstra(grafo, ID_INICIO, ID_FIM)
+    if caminho_dijkstra:
+        print("Renderizando: DIJKSTRA")
+        # A árvore parte de ID_INICIO, como a busca que gerou o caminho destacado.
+        spt, _, _ = grafo.resultado_derivado(("dijkstra", ID_INICIO), lambda: dijkstra(grafo, ID_INICIO))
+        dot_dijkstra = renderizar_caminho_curto(
+            spt, caminho_dijkstra,
+            nome_grafo=f"DIJKSTRA_{ID_INICIO}_{ID_FIM}"
+        )
+        dot_dijkstra.render(
+            f"render/caminho_mais_curto/DIJKSTRA-{ID_INICIO}-{ID_FIM}",
+            view=False, cleanup=True
+        )
+
+# --- 4. Relatório (resultados.txt) ---
+def relatar(grafo):
+    relatorio.write(formatar_relatorio_unidade_2(grafo))
 
-for grafo in grafos:
-    if 'AGM' in grafo.nome_arquivo and grafo.ponderado:
-        _ , caminho_data = formatar_caminho_floyd_warshall(grafo, ID_INICIO, ID_FIM)
+inicio_timer = time.time()
+directory = 'data/unit_2'
 
-        if caminho_data:
-            print(f"Renderizando: FLOYD_WARSHALL")
-            dot_caminho = renderizar_caminho_curto(grafo, caminho_data,
-                             nome_grafo=f"Caminho_{ID_INICIO}-{ID_FIM}")
-            output_path = f'render/caminho_mais_curto/FLOYD_WARSHALL'
-            dot_caminho.render(output_path, view=False, cleanup=True)
-        
-        bf_string, caminho_bf = formatar_caminho_bellman_ford(grafo, ID_INICIO, ID_FIM)
-        if caminho_bf:
-            print("Renderizando: BELLMAN-FORD")
-            dot_bf = renderizar_caminho_curto(
-                grafo, caminho_bf,
-                nome_grafo=f"BELLMAN_FORD_{ID_INICIO}_{ID_FIM}"
-            )
-            dot_bf.render(
-                f"render/caminho_mais_curto/BELLMAN_FORD-{ID_INICIO}-{ID_FIM}",
-                view=False, cleanup=True
-            )
-        
-        dijkstra_string, caminho_dijkstra = formatar_caminho_dijkstra(grafo, ID_INICIO, ID_FIM)
-        if caminho_dijkstra:
-            print("Renderizando: DIJKSTRA")
-            dot_dijkstra = renderizar_caminho_curto(
-                spt, caminho_dijkstra,
-                nome_grafo=f"DIJKSTRA_{ID_INICIO}_{ID_FIM}"
-            )
-            dot_dijkstra.render(
-                f"render/caminho_mais_curto/DIJKSTRA-{ID_INICIO}-{ID_FIM}",
-                view=False, cleanup=True
-            )
+for pasta in ('render', 'render/agm', 'render/arborescencia', 'render/caminho_mais_curto'):
+    os.makedirs(pasta, exist_ok=True)
 
-# --- 7. "Renderização" de Hierholzer ---
+# Leitura de dados (Imprime "Lendo arquivo: ..."). Cada grafo passa por todas as
+# etapas antes de o próximo ser lido; os grafos saem em ordem de nome, a mesma
+# ordem do relatório.
+with open("resultados.txt", "w", encoding='utf-8') as relatorio:
+    executar_pipeline(
+        iterar_diretorio(directory, ordenar=True),
+        [processar_algoritmos, renderizar_original, renderizar_caminhos, relatar]
+    )
+
+# --- 5. "Renderização" de Hierholzer ---
 print("\n--- Renderizando Grafos Eulerianos ---")
 print("Renderizando: Hierholzer Caminhos")
 print("Renderizando: Hierholzer Ciclos")
 
-gerar_relatorio_unidade_2(grafos)
-
-print("\nTempo total: %.4f segundos" % (time.time() - inicio_timer))
\ No newline at end of file
+print("\nTempo total: %.4f segundos" % (time.time() - inicio_timer))
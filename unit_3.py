@@ -3,7 +3,6 @@ Módulo: main
 Descrição: Ponto de entrada da aplicação para problemas da unidade 3.
 """
 import time
-import numpy as np
 from lib.utils.file_handler import ler_diretorio
 from lib.utils.formater import gerar_relatorio_unidade_3, gerar_relatorio_genetico, gerar_relatorio_memetico
 from lib.algorithms.local_searches import two_opt, shift, swap, HAS_NUMBA as JIT_LOCAL
@@ -38,7 +37,7 @@ def main():
 
     grafos = []
     for it, destino in enumerate(destinos):
-        grafos += ler_diretorio(directory, destinos=destino, it=it)
+        grafos += ler_diretorio(directory, destinos=destino, it=it, modo_pesos="inteiro")
 
     print(f"\n--- 1. Heurísticas Construtivas + Busca Local ---")
     if MODO_ACELERADO: print("--> MODO ACELERADO (JIT) ATIVADO")
@@ -52,18 +51,23 @@ def main():
         t_inicio = time.time()
         inicio_id = list(grafo.vertices)[0].id
         
+        # As versões aceleradas somam a matriz de pesos e já devolvem custos reais;
+        # as em Python puro somam os pesos do grafo, em ponto fixo.
         if JIT_NEAREST:
             ciclo, custo = nearest_neighbor_acelerado(grafo, inicio_id)
         else:
             ciclo, custo = nearest_neighbor(grafo, inicio_id)
+            custo = grafo.peso_real(custo)
         
         if JIT_LOCAL:
             ciclo_melhorado, custo_melhorado = two_opt_acelerado(grafo, ciclo)
         else:
             ciclo_melhorado, custo_melhorado = two_opt(grafo, ciclo)
+            custo_melhorado = grafo.peso_real(custo_melhorado)
         
         ciclo_ni_res, custo_ni_res = cheapest_insertion(grafo, grafo.vertices[0])
         ciclo_ni_m, custo_ni_m = swap(grafo, ciclo_ni_res)
+        custo_ni_res, custo_ni_m = grafo.peso_real(custo_ni_res), grafo.peso_real(custo_ni_m)
 
         duracao = time.time() - t_inicio
         print(f"  > Grafo {i+1:02d} | NN+2opt: {custo_melhorado:.2f} | NI+Swap: {custo_ni_m:.2f} | Tempo: {duracao:.4f}s")
@@ -101,13 +105,7 @@ def main():
             
             if JIT_GENETIC:
                 ids = [v.id for v in grafo.vertices]
-                mapa = {id_v: idx for idx, id_v in enumerate(ids)}
-                n = len(ids)
-                matriz_np = np.full((n, n), np.inf, dtype=np.float32)
-                for v in grafo.vertices:
-                    idx1 = mapa[v.id]
-                    for viz, peso in grafo.get_vizinhos(v.id).items():
-                        matriz_np[idx1, mapa[viz]] = float(peso)
+                matriz_np = grafo.matriz_pesos
 
             for execucao in range(1, 21):
                 t_ini = time.time()
@@ -143,6 +141,7 @@ def main():
                         ciclo_final, custo_final = func_bl(grafo, c_ga)
                     else:
                         ciclo_final, custo_final = c_ga, _
+                    custo_final = grafo.peso_real(custo_final)
                     
                 duracao = time.time() - t_ini
                 soma_custos += custo_final